@@ -13,7 +13,7 @@ from ..core.search_modes import (
     SearchMode, SearchParameters, SectorResolver,
     parse_coordinates, validate_search_parameters
 )
-from ..configs.config_loader import config_loader
+from ..configs.config_loader import get_config_loader
 
 
 @click.command()
@@ -132,7 +132,7 @@ def filter_cmd(
     # List configurations if requested
     if list_configs:
         click.echo("Built-in configurations:")
-        for name, desc in config_loader.list_configs():
+        for name, desc in get_config_loader().list_configs():
             click.echo(f"  {name}: {desc}")
         return
 
@@ -211,7 +211,7 @@ def filter_cmd(
         # Load and validate configuration
         if config:
             # Load config from name or file path
-            config_obj = config_loader.load_config(config)
+            config_obj = get_config_loader().load_config(config)
         elif pattern_file:
             # Load JSON pattern as config
             from ..configs.json_pattern import JSONPatternConfig
@@ -7,6 +7,10 @@ from datetime import datetime
 class BaseConfig(ABC):
     """Base class for all galaxy filter configurations."""
     
+    # Slotted so small subclasses can opt out of a per-instance __dict__;
+    # subclasses that don't declare __slots__ keep one as usual
+    __slots__ = ('name', 'description', '_output_columns', '_last_filter_result')
+    
     def __init__(self, name: str, description: str):
         """Initialize base configuration.
         
@@ -40,6 +44,20 @@ class BaseConfig(ABC):
         """
         pass
     
+    def may_match_raw(self, raw_line) -> bool:
+        """Cheap probe on an undecoded JSONL line before full parsing.
+        
+        Configurations that can reject most systems from the raw text alone
+        override this; returning False skips json parsing and filter_system.
+        
+        Args:
+            raw_line: Raw JSONL line (str or bytes)
+            
+        Returns:
+            False if the system can never match, True otherwise
+        """
+        return True
+    
     def get_description(self) -> str:
         """Get configuration description.
         
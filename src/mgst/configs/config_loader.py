@@ -1,17 +1,77 @@
 """Dynamic configuration loader for modular search profiles."""
 
+import functools
 import importlib
 import importlib.util
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Type, Any, Optional
+from types import ModuleType
+from typing import Dict, Type, Any, Optional, Tuple
 import inspect
 
 from .base import BaseConfig
 
 
+# Built-in configurations: registry name -> (submodule, class name)
+_BUILTIN_CONFIGS = {
+    'exobiology': ('exobiology', 'ExobiologyConfig'),
+    'high-value-exobiology': ('high_value_exobiology', 'HighValueExobiologyConfig'),
+    'rule-based-exobiology-selective': ('rule_based_exobiology_10m_selective', 'RuleBasedExobiologySelectiveConfig'),
+    'binary-body-search': ('binary_body_search', 'BinaryBodySearchConfig'),
+    'faction-search': ('faction_search', 'FactionSearchConfig'),
+    'biological-landmarks': ('biological_landmarks', 'BiologicalLandmarksConfig'),
+}
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Import a module whose body only executes on first attribute access.
+
+    Args:
+        name: Fully qualified module name
+
+    Returns:
+        Already-imported module, or a lazily executing module
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot find module: {name}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def _load_user_module(path: str, mtime_ns: int):
+    """Execute a user configuration module once per (path, mtime) per process.
+
+    Args:
+        path: Path to the user configuration file
+        mtime_ns: File modification time, so edited files are reloaded
+
+    Returns:
+        Executed module, or None if no loader could be created
+    """
+    spec = importlib.util.spec_from_file_location("user_config", path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class LegacyConfigWrapper(BaseConfig):
     """Wrapper for legacy configuration modules that can be pickled."""
     
+    __slots__ = ('module_path', 'output_columns', '_module')
+    
     def __init__(self, module_name: str, module_doc: str, module_path: str, output_columns: list[str]):
         super().__init__(
             name=f"legacy-{module_name}",
@@ -22,15 +82,33 @@ class LegacyConfigWrapper(BaseConfig):
         self._module = None
     
     def _get_module(self):
-        """Lazy load module to avoid pickle issues."""
+        """Lazy load module to avoid pickle issues.
+
+        Unpickled copies in the same worker share one executed module via
+        the process-level ``_load_user_module`` cache.
+        """
         if self._module is None:
             if self.module_path:
-                spec = importlib.util.spec_from_file_location("user_config", self.module_path)
-                if spec and spec.loader:
-                    self._module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(self._module)
+                mtime_ns = os.stat(self.module_path).st_mtime_ns
+                self._module = _load_user_module(self.module_path, mtime_ns)
         return self._module
+
+    def __getstate__(self):
+        """Drop the loaded module so the wrapper always pickles cleanly."""
+        state = {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, '__slots__', ())
+            if hasattr(self, slot)
+        }
+        state['_module'] = None
+        return state
     
+    def __setstate__(self, state):
+        """Restore slot values from a pickled state."""
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     def filter_system(self, system_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Use the legacy filter_system function."""
         mod = self._get_module()
@@ -46,27 +124,33 @@ class ConfigurationLoader:
     
     def __init__(self):
         self._loaded_configs: Dict[str, Type[BaseConfig]] = {}
+        self._lazy_configs: Dict[str, Tuple[ModuleType, str]] = {}
         self._register_builtin_configs()
     
     def _register_builtin_configs(self):
-        """Register built-in configurations."""
-        from .exobiology import ExobiologyConfig
-        from .high_value_exobiology import HighValueExobiologyConfig
-        from .rule_based_exobiology_10m_selective import RuleBasedExobiologySelectiveConfig
-        from .binary_body_search import BinaryBodySearchConfig
-        from .faction_search import FactionSearchConfig
-        from .biological_landmarks import BiologicalLandmarksConfig
-
-        self._loaded_configs['exobiology'] = ExobiologyConfig
-        self._loaded_configs['high-value-exobiology'] = HighValueExobiologyConfig
-        self._loaded_configs['rule-based-exobiology-selective'] = RuleBasedExobiologySelectiveConfig
-        self._loaded_configs['binary-body-search'] = BinaryBodySearchConfig
-        self._loaded_configs['faction-search'] = FactionSearchConfig
-        self._loaded_configs['biological-landmarks'] = BiologicalLandmarksConfig
+        """Register built-in configurations.
+        
+        Submodules are imported lazily, so a built-in config module is only
+        executed once its class is actually resolved.
+        """
+        for name, (module_name, class_name) in _BUILTIN_CONFIGS.items():
+            module = _lazy_import(f"{__package__}.{module_name}")
+            self._lazy_configs[name] = (module, class_name)
+    
+    def _get_config_class(self, config_name: str) -> Type[BaseConfig]:
+        """Resolve a registered configuration class, executing its module if needed."""
+        if config_name in self._lazy_configs:
+            module, class_name = self._lazy_configs.pop(config_name)
+            self._loaded_configs[config_name] = getattr(module, class_name)
+        return self._loaded_configs[config_name]
     
     def load_config_from_file(self, config_path: Path) -> BaseConfig:
         """Load configuration from a Python file.
         
+        The file may name its configuration class explicitly with
+        ``__config_class__ = MyConfig``; otherwise the module is scanned for
+        a BaseConfig subclass, then for a legacy filter_system function.
+        
         Args:
             config_path: Path to Python configuration file
             
@@ -92,8 +176,14 @@ class ConfigurationLoader:
         except Exception as e:
             raise ValueError(f"Error executing configuration file: {e}")
         
+        # Prefer an explicitly declared __config_class__ over scanning the module
+        config_class = getattr(module, '__config_class__', None)
+        if config_class is not None:
+            if not (inspect.isclass(config_class) and issubclass(config_class, BaseConfig)):
+                raise ValueError("__config_class__ must be a class that inherits from BaseConfig")
+            return config_class()
+        
         # Look for a configuration class that inherits from BaseConfig
-        config_class = None
         for name, obj in inspect.getmembers(module, inspect.isclass):
             if (obj != BaseConfig and 
                 issubclass(obj, BaseConfig) and 
@@ -109,7 +199,7 @@ class ConfigurationLoader:
             else:
                 raise ValueError(
                     f"Configuration file must either:\n"
-                    f"1. Define a class that inherits from BaseConfig, or\n"
+                    f"1. Set __config_class__ or define a class that inherits from BaseConfig, or\n"
                     f"2. Define a filter_system(system_data) function (legacy mode)"
                 )
         
@@ -128,10 +218,10 @@ class ConfigurationLoader:
         Raises:
             ValueError: If configuration name is not found
         """
-        if config_name not in self._loaded_configs:
+        if config_name not in self._loaded_configs and config_name not in self._lazy_configs:
             raise ValueError(f"Unknown configuration: {config_name}")
         
-        config_class = self._loaded_configs[config_name]
+        config_class = self._get_config_class(config_name)
         return config_class()
     
     def register_config(self, name: str, config_class: Type[BaseConfig]):
@@ -144,6 +234,7 @@ class ConfigurationLoader:
         if not issubclass(config_class, BaseConfig):
             raise ValueError("Configuration class must inherit from BaseConfig")
         
+        self._lazy_configs.pop(name, None)
         self._loaded_configs[name] = config_class
     
     def list_available_configs(self) -> Dict[str, str]:
@@ -153,9 +244,9 @@ class ConfigurationLoader:
             Dictionary mapping config names to descriptions
         """
         configs = {}
-        for name, config_class in self._loaded_configs.items():
+        for name in [*self._lazy_configs, *self._loaded_configs]:
             try:
-                instance = config_class()
+                instance = self._get_config_class(name)()
                 configs[name] = instance.get_description()
             except Exception as e:
                 configs[name] = f"Error loading description: {e}"
@@ -194,5 +285,18 @@ class ConfigurationLoader:
         return LegacyConfigWrapper(module_name, module_doc, module_path, output_columns)
 
 
-# Global configuration loader instance
-config_loader = ConfigurationLoader()
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def get_config_loader() -> ConfigurationLoader:
+    """Get the shared configuration loader, creating it on first use.
+    
+    Returns:
+        Process-wide ConfigurationLoader instance
+    """
+    return ConfigurationLoader()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep ``config_loader`` importable without building it at import time."""
+    if name == 'config_loader':
+        return get_config_loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,11 +4,44 @@ Expands the original dataset by adding systems where bodies have both ultra-high
 and moderate value (12-15M) species on the same body, reducing the 3+ body requirement.
 """
 
+import sys
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from .base import BaseConfig
 
+# Interned dictionary keys used in the per-body hot loop
+_K_ATMOS = sys.intern('atmosphereType')
+_K_PRESSURE = sys.intern('surfacePressure')
+_K_TEMP = sys.intern('surfaceTemperature')
+_K_GRAVITY = sys.intern('gravity')
+_K_SUBTYPE = sys.intern('subType')
+_K_BIOSCAN = sys.intern('bioscan_predictions')
+_K_PRED = sys.intern('predicted_species')
+_K_GENUS = sys.intern('genus')
+_K_SPECIES = sys.intern('species')
+_K_VALUE = sys.intern('value')
+_K_NAME = sys.intern('name')
+_K_BODY_NAME = sys.intern('bodyName')
+
+# Per-body output columns, precomputed for the three reported body slots
+_BODY_SLOT_FIELDS = ('name', 'atmosphere', 'pressure', 'genera', 'species_count', 'value', 'cooccurrence')
+_BODY_SLOT_KEYS = tuple(
+    tuple(f'body_{i + 1}_{field}' for field in _BODY_SLOT_FIELDS)
+    for i in range(3)
+)
+_EMPTY_BODY_SLOTS = {key: '' for slot_keys in _BODY_SLOT_KEYS for key in slot_keys}
+
+# Competing bacterium eligibility by normalized atmosphere:
+# (min gravity, max gravity, min temperature K, max temperature K)
+_COMPETING_BACTERIUM_RANGES = {
+    'Carbon dioxide': (0.039, 0.608, 145.0, 400.0),   # Bacterium Aurasus
+    'Sulphur dioxide': (0.042, 0.605, 132.0, 500.0),  # Bacterium Cerbrus
+}
+
+# Body types that can host a competing bacterium
+_BACTERIUM_BODY_TYPES = frozenset(('Rocky body', 'High metal content body', 'Rocky ice body'))
+
 
 class ExobiologyConfig(BaseConfig):
     """Co-occurrence expansion exobiology research configuration."""
@@ -37,39 +70,32 @@ Criteria:
     def has_competing_bacterium(self, body: Dict) -> bool:
         """Check if body is eligible for bacterium aurasus or cerbrus (species that compete with valuable ones)."""
         # Extract body conditions - handle None values
-        atmosphere_type = body.get('atmosphereType', '') or ''
-        surface_temp = body.get('surfaceTemperature', 0) or 0
-        gravity = body.get('gravity', 0) or 0
-        body_type = body.get('subType', '') or ''
+        atmosphere_type = body.get(_K_ATMOS, '') or ''
+        surface_temp = body.get(_K_TEMP, 0) or 0
+        gravity = body.get(_K_GRAVITY, 0) or 0
+        body_type = body.get(_K_SUBTYPE, '') or ''
         
         # Normalize atmosphere name (remove "Thin " prefix)
         normalized_atmosphere = atmosphere_type.replace('Thin ', '').replace('Thick ', '')
         
-        # Check Bacterium Aurasus eligibility
-        # Criteria: CarbonDioxide atmosphere, Rocky/High metal/Rocky ice body, gravity 0.039-0.608, temp 145-400K
-        if (normalized_atmosphere == 'Carbon dioxide' and 
-            body_type in ['Rocky body', 'High metal content body', 'Rocky ice body'] and
-            0.039 <= gravity <= 0.608 and
-            145.0 <= surface_temp <= 400.0):
-            return True
+        # Bacterium Aurasus (Carbon dioxide) and Cerbrus (Sulphur dioxide) share the
+        # Rocky/High metal/Rocky ice body requirement; only the ranges differ
+        ranges = _COMPETING_BACTERIUM_RANGES.get(normalized_atmosphere)
+        if ranges is None:
+            return False
         
-        # Check Bacterium Cerbrus eligibility  
-        # Criteria: SulphurDioxide atmosphere, Rocky/High metal/Rocky ice body, gravity 0.042-0.605, temp 132-500K
-        if (normalized_atmosphere == 'Sulphur dioxide' and
-            body_type in ['Rocky body', 'High metal content body', 'Rocky ice body'] and
-            0.042 <= gravity <= 0.605 and
-            132.0 <= surface_temp <= 500.0):
-            return True
-            
-        return False
+        min_gravity, max_gravity, min_temp, max_temp = ranges
+        return (body_type in _BACTERIUM_BODY_TYPES and
+                min_gravity <= gravity <= max_gravity and
+                min_temp <= surface_temp <= max_temp)
     
     def has_cooccurrence_species(self, body: Dict) -> bool:
         """Check if body has both ultra-high value (≥15M) and moderate value (12-15M) species."""
-        bioscan_predictions = body.get('bioscan_predictions')
+        bioscan_predictions = body.get(_K_BIOSCAN)
         if not bioscan_predictions:
             return False
         
-        predicted_species = bioscan_predictions.get('predicted_species', [])
+        predicted_species = bioscan_predictions.get(_K_PRED, [])
         if not predicted_species:
             return False
         
@@ -77,7 +103,7 @@ Criteria:
         has_moderate = False
         
         for species in predicted_species:
-            value = species.get('value', 0)
+            value = species.get(_K_VALUE, 0)
             if value >= 15000000:
                 has_ultra_high = True
             elif 12000000 <= value < 15000000:
@@ -101,82 +127,93 @@ Criteria:
                 continue
                 
             # Check for bioscan predictions
-            bioscan_predictions = body.get('bioscan_predictions')
+            bioscan_predictions = body.get(_K_BIOSCAN)
             if not bioscan_predictions:
                 continue
                 
-            predicted_species = bioscan_predictions.get('predicted_species', [])
+            predicted_species = bioscan_predictions.get(_K_PRED, [])
             if not predicted_species:
                 continue
                 
-            # Group species by genus and check if ALL species in genus meet threshold
-            genus_species = self.group_species_by_genus(predicted_species)
+            # Single pass: group species by genus, track value tiers and each genus minimum
+            genus_species = {}
+            genus_min_value = {}
             body_species_detail = []
             ultra_high_species = []
             moderate_species = []
             
             for species in predicted_species:
-                genus = species.get('genus', 'Unknown')
-                value = species.get('value', 0)
-                species_name = species.get('species', 'Unknown')
+                genus = species.get(_K_GENUS, 'Unknown')
+                value = species.get(_K_VALUE, 0)
+                species_name = species.get(_K_SPECIES, 'Unknown')
                 
                 species_info = {
                     'species': species_name,
                     'value': value,
-                    'full_name': species.get('name', f"{genus} {species_name}")
+                    'full_name': species.get(_K_NAME, f"{genus} {species_name}")
                 }
                 
+                species_list = genus_species.get(genus)
+                if species_list is None:
+                    genus_species[genus] = [species_info]
+                    genus_min_value[genus] = value
+                else:
+                    species_list.append(species_info)
+                    if value < genus_min_value[genus]:
+                        genus_min_value[genus] = value
+                
                 # Track ultra-high and moderate value species
                 if value >= 15000000:
                     ultra_high_species.append(species_info)
-                elif 12000000 <= value < 15000000:
+                elif value >= 12000000:
                     moderate_species.append(species_info)
             
             # Only count genera where ALL species meet the 15M threshold (for qualifying bodies)
             qualifying_genera = {}
             for genus, species_list in genus_species.items():
-                # Check if ALL species in this genus meet the threshold
-                all_species_qualify = all(species['value'] >= 15000000 for species in species_list)
+                # The genus minimum decides whether ALL species meet the threshold
+                if genus_min_value[genus] < 15000000:
+                    continue
                 
-                if all_species_qualify:
-                    # Calculate total value for this genus (all species combined)
-                    total_genus_value = sum(species['value'] for species in species_list)
-                    qualifying_genera[genus] = {
-                        'species_count': len(species_list),
-                        'total_value': total_genus_value,
-                        'species_list': species_list
-                    }
-                    
-                    # Add to body species detail
-                    for species in species_list:
-                        body_species_detail.append({
-                            'genus': genus,
-                            'species': species['species'],
-                            'value': species['value'],
-                            'full_name': species['full_name']
-                        })
+                # Calculate total value for this genus (all species combined)
+                total_genus_value = sum(species['value'] for species in species_list)
+                qualifying_genera[genus] = {
+                    'species_count': len(species_list),
+                    'total_value': total_genus_value,
+                    'species_list': species_list
+                }
+                
+                # Add to body species detail
+                for species in species_list:
+                    body_species_detail.append({
+                        'genus': genus,
+                        'species': species['species'],
+                        'value': species['value'],
+                        'full_name': species['full_name']
+                    })
             
             # Check if body qualifies and has co-occurrence
             has_cooccurrence = len(ultra_high_species) > 0 and len(moderate_species) > 0
             
             # Body must have at least 1 qualifying genus (where ALL species ≥15M)
             if len(qualifying_genera) >= 1:
-                # Apply genus diversity rule for bodies with competing bacterium
-                if self.has_competing_bacterium(body):
-                    # Count all genera (including those that don't meet 15M threshold)
-                    total_genera_count = len(genus_species)
-                    # Require at least 3 total genera if competing bacterium present
-                    if total_genera_count < 3:
-                        continue
+                # Apply genus diversity rule for bodies with competing bacterium.
+                # Count all genera (including those that don't meet 15M threshold)
+                # from the grouping built above; the eligibility check only runs
+                # when the body would actually fail the 3-genus requirement.
+                total_genera_count = len(genus_species)
+                if total_genera_count < 3 and self.has_competing_bacterium(body):
+                    continue
                         
                 body_info = {
-                    'body_name': body.get('bodyName', body.get('name', 'Unknown')),
+                    'body_name': body.get(_K_BODY_NAME, body.get(_K_NAME, 'Unknown')),
                     'genus_count': len(qualifying_genera),
+                    'species_count': len(body_species_detail),
                     'total_value': sum(g['total_value'] for g in qualifying_genera.values()),
                     'genera_details': qualifying_genera,
                     'species_detail': body_species_detail,
-                    'atmosphere': body.get('atmosphereType', ''),
-                    'pressure': body.get('surfacePressure', 0),
+                    'atmosphere': body.get(_K_ATMOS, ''),
+                    'pressure': body.get(_K_PRESSURE, 0),
                     'has_cooccurrence': has_cooccurrence,
                     'ultra_high_species': ultra_high_species,
                     'moderate_species': moderate_species
@@ -213,6 +250,9 @@ Criteria:
             total_value += body['total_value']
             all_species_details.extend(body['species_detail'])
         
+        # Sort the system genera once; body genera are filtered from it in order
+        system_genera_sorted = sorted(total_genera)
+        
         coords = self.extract_system_coordinates(system_data)
         
         # Prepare detailed body information for up to 3 bodies
@@ -228,29 +268,22 @@ Criteria:
             'coords_z': coords[2],
             'body_details': qualifying_bodies,
             'species_summary': f"{len(total_genera)} genera, {len(all_species_details)} species (all ≥15M), {total_value:,} credits",
-            'genera_list': ', '.join(sorted(total_genera))
+            'genera_list': ', '.join(system_genera_sorted)
         }
         
         # Add detailed body information for up to 3 bodies
-        for i in range(3):
-            body_prefix = f'body_{i+1}'
-            if i < len(qualifying_bodies):
-                body = qualifying_bodies[i]
-                result[f'{body_prefix}_name'] = body['body_name']
-                result[f'{body_prefix}_atmosphere'] = body['atmosphere']
-                result[f'{body_prefix}_pressure'] = body['pressure']
-                result[f'{body_prefix}_genera'] = ', '.join(sorted(body['genera_details'].keys()))
-                result[f'{body_prefix}_species_count'] = sum(g['species_count'] for g in body['genera_details'].values())
-                result[f'{body_prefix}_value'] = body['total_value']
-                result[f'{body_prefix}_cooccurrence'] = 'Yes' if body['has_cooccurrence'] else 'No'
-            else:
-                result[f'{body_prefix}_name'] = ''
-                result[f'{body_prefix}_atmosphere'] = ''
-                result[f'{body_prefix}_pressure'] = ''
-                result[f'{body_prefix}_genera'] = ''
-                result[f'{body_prefix}_species_count'] = ''
-                result[f'{body_prefix}_value'] = ''
-                result[f'{body_prefix}_cooccurrence'] = ''
+        result.update(_EMPTY_BODY_SLOTS)
+        for body, slot_keys in zip(qualifying_bodies, _BODY_SLOT_KEYS):
+            (name_key, atmosphere_key, pressure_key, genera_key,
+             species_count_key, value_key, cooccurrence_key) = slot_keys
+            result[name_key] = body['body_name']
+            result[atmosphere_key] = body['atmosphere']
+            result[pressure_key] = body['pressure']
+            genera_details = body['genera_details']
+            result[genera_key] = ', '.join(g for g in system_genera_sorted if g in genera_details)
+            result[species_count_key] = body['species_count']
+            result[value_key] = body['total_value']
+            result[cooccurrence_key] = 'Yes' if body['has_cooccurrence'] else 'No'
         
         return result
     
@@ -16,17 +16,28 @@ Architecture supports extensible faction searching:
 - Station-level faction analysis
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from .base import BaseConfig
 
+# Characters that JSON encoders may escape; names containing them can't be probed raw
+_JSON_ESCAPABLE = frozenset('"\\/')
+
 
 class FactionSearchConfig(BaseConfig):
     """Faction Search Configuration"""
 
+    __slots__ = ('target_faction', 'output_format', '_target_bytes')
+
     def __init__(self, target_faction: str = "The Dukes of Mikunn", output_format: str = "both"):
         self.target_faction = target_faction
         self.output_format = output_format  # "jsonl", "tsv", or "both"
 
+        # Raw-line probe target; only safe when the name is encoded verbatim in JSON
+        if target_faction.isascii() and target_faction.isprintable() and not _JSON_ESCAPABLE.intersection(target_faction):
+            self._target_bytes = target_faction.encode('utf-8')
+        else:
+            self._target_bytes = None
+
         super().__init__(
             name="faction-search",
             description=(
@@ -46,6 +57,14 @@ class FactionSearchConfig(BaseConfig):
             )
         )
 
+    def may_match_raw(self, raw_line: Union[str, bytes]) -> bool:
+        """Reject systems whose raw JSON line never mentions the target faction."""
+        if self._target_bytes is None:
+            return True
+        if isinstance(raw_line, bytes):
+            return self._target_bytes in raw_line
+        return self.target_faction in raw_line
+
     def has_target_faction(self, system_data: Dict[str, Any]) -> tuple[bool, Dict[str, Any]]:
         """Check if system has the target faction and return faction details."""
         faction_info = {
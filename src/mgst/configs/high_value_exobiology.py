@@ -9,17 +9,292 @@ ensuring guaranteed high-value returns.
 """
 
 import os
-import importlib.util
-from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime
+import sys
+from bisect import bisect_left, bisect_right
+import functools
+import heapq
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Tuple, Callable
+from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 from .base import BaseConfig
+from ..utils.file_utils import load_json_file
+
+# Numeric ruleset bounds flattened into arrays: (ruleset key, missing-bound default)
+_RULESET_BOUNDS = (
+    ('min_gravity', -np.inf), ('max_gravity', np.inf),
+    ('min_temperature', -np.inf), ('max_temperature', np.inf),
+    ('min_pressure', -np.inf), ('max_pressure', np.inf),
+)
+
+# Orders (genus, minimum value) pairs by value
+_genus_min_value = itemgetter(1)
+
+# Competing bacterium eligibility by normalized atmosphere:
+# (min gravity, max gravity, min temperature K, max temperature K)
+_COMPETING_BACTERIUM_RANGES = {
+    'CarbonDioxide': (0.039, 0.608, 145.0, 400.0),   # Bacterium Aurasus
+    'SulphurDioxide': (0.042, 0.605, 132.0, 500.0),  # Bacterium Cerbrus
+}
+
+# Body types that can host a competing bacterium
+_BACTERIUM_BODY_TYPES = frozenset(('Rocky body', 'High metal content body', 'Rocky ice body'))
+
+# Reads a detected species' value; summed with map() to avoid a generator per body
+_species_value = itemgetter('value')
+
+# Maximum number of distinct body characteristics kept in the detection cache
+_DETECTION_CACHE_SIZE = 100_000
+
+# updateTime suffixes that mark a UTC timestamp, eligible for string comparison
+_UTC_SUFFIXES = frozenset(('', 'Z', '+00:00'))
+
+
+def _naive_utc(value):
+    """Convert a timezone-aware datetime to naive UTC; other values pass through."""
+    if getattr(value, 'tzinfo', None) is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_update_time(update_time: str) -> datetime:
+    """Parse an ISO 8601 updateTime string into a naive UTC datetime."""
+    return _naive_utc(datetime.fromisoformat(update_time.replace('Z', '+00:00')))
+
+
+@functools.lru_cache(maxsize=16)
+def _threshold_strings(date_threshold: datetime) -> Tuple[str, str]:
+    """Split a threshold into comparable UTC (date, time) strings."""
+    date_threshold = _naive_utc(date_threshold)
+    return date_threshold.strftime('%Y-%m-%d'), date_threshold.strftime('%H:%M:%S')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ruleset_catalogs(ruleset_files: Tuple[Tuple[str, int], ...]) -> Dict[str, Dict]:
+    """Execute ruleset files once per process and extract their species.
+    
+    Args:
+        ruleset_files: (path, mtime_ns) pairs, so edited files are reloaded
+        
+    Returns:
+        Mapping of species name to genus, value and rulesets
+    """
+    # Only needed the first time rulesets are loaded
+    import importlib.util
+    
+    species_data = {}
+    
+    for ruleset_file, _ in ruleset_files:
+        file_name = os.path.basename(ruleset_file)
+        if file_name.startswith("__"):
+            continue
+            
+        try:
+            # Load the module under its own name; the source loader reuses cached bytecode
+            module_name = f"ruleset_{os.path.splitext(file_name)[0]}"
+            spec = importlib.util.spec_from_file_location(module_name, ruleset_file)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            
+            if hasattr(module, 'catalog'):
+                catalog = module.catalog
+                
+                # Extract species from catalog
+                for genus_key, genus_data in catalog.items():
+                    for species_key, species_info in genus_data.items():
+                        species_name = species_info.get('name', 'Unknown')
+                        value = species_info.get('value', 0)
+                        rulesets = species_info.get('rulesets', [])
+                        
+                        # Store species with all its ruleset data
+                        species_data[species_name] = {
+                            'genus': genus_key,
+                            'value': value,
+                            'rulesets': rulesets
+                        }
+                        
+        except Exception as e:
+            print(f"Warning: Could not load ruleset {ruleset_file}: {e}")
+            continue
+    
+    return species_data
+
+
+@functools.lru_cache(maxsize=1)
+def _latest_species_ranges_file() -> Optional[str]:
+    """Find the newest output/*/species_stellar_ranges.json, resolved once per process."""
+    output_dir = Path(__file__).parent.parent.parent.parent / "output"
+    
+    latest_file = None
+    latest_mtime = None
+    try:
+        entries = os.scandir(output_dir)
+    except OSError:
+        return None
+    
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            candidate = os.path.join(entry.path, 'species_stellar_ranges.json')
+            try:
+                mtime = os.stat(candidate).st_mtime
+            except OSError:
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest_file, latest_mtime = candidate, mtime
+    
+    return latest_file
+
+
+def load_species_ranges() -> Optional[Dict[str, Any]]:
+    """Load the newest species stellar ranges file from the repository output directory.
+    
+    The file location is resolved once per process; set MGST_REFRESH_RANGES=1
+    to look for newer output directories on every load. Parsed data is cached
+    per file version, so every config instance in a process shares one copy.
+    
+    Returns:
+        Species ranges keyed by species name, or None if no ranges file exists
+    """
+    if os.environ.get('MGST_REFRESH_RANGES'):
+        _latest_species_ranges_file.cache_clear()
+    
+    latest_file = _latest_species_ranges_file()
+    if latest_file is None:
+        return None
+    
+    try:
+        return load_json_file(Path(latest_file))
+    except FileNotFoundError:
+        # The cached file was removed; look again
+        _latest_species_ranges_file.cache_clear()
+        latest_file = _latest_species_ranges_file()
+        return load_json_file(Path(latest_file)) if latest_file else None
+
+
+# Stellar class reported for systems without primary star data
+UNKNOWN_STELLAR_CLASS = 'Unknown'
+
+
+def primary_star_info(system_data: Dict[str, Any]) -> Tuple[str, float]:
+    """Extract the stellar class and surface temperature of the primary star.
+    
+    Both values come from a single scan of the system's stars, falling back to
+    the enriched stellar fields on the first body when no star data is present.
+    
+    Args:
+        system_data: System data dictionary
+        
+    Returns:
+        Tuple of (stellar class letter or UNKNOWN_STELLAR_CLASS, stellar temperature)
+    """
+    # Look for primary star data
+    stars = system_data.get('stars', [])
+    if stars:
+        primary_star = None
+        for star in stars:
+            if star.get('mainStar', False):
+                primary_star = star
+                break
+        if not primary_star:
+            primary_star = stars[0]
+        
+        stellar_temp = primary_star.get('surfaceTemperature', 0.0)
+        spectral_class = primary_star.get('spectralClass', primary_star.get('subType', ''))
+        if spectral_class:
+            return spectral_class[0], stellar_temp
+    
+    # Fallback: check bodies for stellar data (from enriched dataset)
+    bodies = system_data.get('bodies', [])
+    first_body = bodies[0] if bodies else {}
+    
+    spectral_class = first_body.get('stellar_spectral_class')
+    stellar_class = spectral_class[0] if spectral_class else UNKNOWN_STELLAR_CLASS
+    if not stars:
+        stellar_temp = first_body.get('stellar_surface_temperature') or 0.0
+    
+    return stellar_class, stellar_temp
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_atmosphere_type(atmosphere_type: str) -> str:
+    """Normalize an atmosphere type string, interning the result."""
+    if not atmosphere_type:
+        return ""
+    return sys.intern(atmosphere_type.replace(" atmosphere", "").replace("_", "").strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_genus_value(genus: str, value: int) -> str:
+    """Format a genus and its minimum value in millions, e.g. 'Stratum(19M)'."""
+    return f"{genus}({value//1000000}M)"
+
+
+@dataclass
+class BodyInfo:
+    """Summary of a body that passed the per-body high-value checks."""
+    
+    # Explicit slots keep one qualifying body compact; dataclass(slots=True) needs 3.10
+    __slots__ = (
+        'body_name', 'detected_species', 'genus_min_values', 'genus_count', 'species_count',
+        'total_value', 'has_bacterium', 'atmosphere_type', 'surface_pressure',
+        'surface_temperature', 'gravity', 'body_type', 'genus_tiers',
+    )
+    
+    body_name: str
+    detected_species: List[Dict]
+    genus_min_values: Dict[str, int]
+    genus_count: int
+    species_count: int
+    total_value: int
+    has_bacterium: bool
+    atmosphere_type: str
+    surface_pressure: float
+    surface_temperature: float
+    gravity: float
+    body_type: str
+    # (extremely_high, high, moderate, low) genus counts, filled in on first use
+    genus_tiers: Optional[Tuple[int, int, int, int]]
+
+
+@dataclass
+class ClassRanges:
+    """Tolerance-adjusted empirical ranges for one species around one stellar class.
+    
+    A None bound pair means that check accepts any value.
+    """
+    
+    # Flat slots instead of nested (lo, hi) tuples keep range tables small
+    __slots__ = ('stellar_lo', 'stellar_hi', 'body_lo', 'body_hi', 'distance_lo', 'distance_hi')
+    
+    stellar_lo: Optional[float]
+    stellar_hi: Optional[float]
+    body_lo: Optional[float]
+    body_hi: Optional[float]
+    distance_lo: Optional[float]
+    distance_hi: Optional[float]
+    
+    @classmethod
+    def from_bounds(cls, stellar: Optional[Tuple[float, float]], body: Optional[Tuple[float, float]],
+                    distance: Optional[Tuple[float, float]]) -> 'ClassRanges':
+        """Build from optional (lo, hi) pairs, None meaning unconstrained."""
+        return cls(*(stellar or (None, None)), *(body or (None, None)), *(distance or (None, None)))
 
 
 class HighValueExobiologyConfig(BaseConfig):
     """High-value exobiology configuration using genus-level minimum value analysis with 10M+ threshold."""
     
+    # Fewest qualifying bodies meets_system_criteria can accept; systems with
+    # fewer bodies are rejected before any body is examined
+    MIN_QUALIFYING_BODIES = 2
+    
     def __init__(self):
         super().__init__(
             name="high-value-exobiology",
@@ -55,64 +330,236 @@ Value Tiers (Minimum Guaranteed):
         
         # Load species rulesets
         self.species_rulesets = self._load_all_rulesets()
+        self._build_ruleset_arrays()
         
     def _load_all_rulesets(self) -> Dict[str, Dict]:
         """Load all species rulesets from the rulesets directory."""
         rulesets_dir = Path(__file__).parent.parent.parent.parent / "rulesets"
-        species_data = {}
         
         if not rulesets_dir.exists():
             raise FileNotFoundError(f"Rulesets directory not found: {rulesets_dir}")
         
-        for ruleset_file in rulesets_dir.glob("*.py"):
-            if ruleset_file.name.startswith("__"):
-                continue
-                
-            try:
-                # Load the module dynamically
-                spec = importlib.util.spec_from_file_location("ruleset", ruleset_file)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                if hasattr(module, 'catalog'):
-                    catalog = module.catalog
-                    
-                    # Extract species from catalog
-                    for genus_key, genus_data in catalog.items():
-                        for species_key, species_info in genus_data.items():
-                            species_name = species_info.get('name', 'Unknown')
-                            value = species_info.get('value', 0)
-                            rulesets = species_info.get('rulesets', [])
-                            
-                            # Store species with all its ruleset data
-                            species_data[species_name] = {
-                                'genus': genus_key,
-                                'value': value,
-                                'rulesets': rulesets
-                            }
-                            
-            except Exception as e:
-                print(f"Warning: Could not load ruleset {ruleset_file}: {e}")
-                continue
+        with os.scandir(rulesets_dir) as entries:
+            ruleset_files = tuple(sorted(
+                (entry.path, entry.stat().st_mtime_ns)
+                for entry in entries
+                if entry.name.endswith(".py") and entry.is_file()
+            ))
+        species_data = dict(_load_ruleset_catalogs(ruleset_files))
         
-        print(f"Loaded {len(species_data)} species from {len(list(rulesets_dir.glob('*.py')))} ruleset files")
+        print(f"Loaded {len(species_data)} species from {len(ruleset_files)} ruleset files")
         return species_data
     
+    def _build_ruleset_arrays(self):
+        """Flatten every (species, ruleset) pair into parallel arrays for vectorized matching.
+        
+        Each row is one ruleset. Numeric bounds become float arrays with +/-inf for
+        missing limits; atmosphere and body type constraints become per-value
+        boolean row masks; volcanism is kept per row and resolved per body string.
+        """
+        # Names are interned so lookups keyed by detected species hit the identity fast path
+        self._species_names = [sys.intern(species_name) for species_name in self.species_rulesets]
+        # One read-only detection entry per species, shared by every body it is detected on
+        self._species_entries = [
+            {
+                'name': species_name,
+                'genus': sys.intern(self.species_rulesets[species_name].get('genus', 'Unknown')),
+                'value': self.species_rulesets[species_name].get('value', 0)
+            }
+            for species_name in self._species_names
+        ]
+        row_species = []
+        row_atmospheres = []
+        row_body_types = []
+        row_bounds = {key: [] for key, _ in _RULESET_BOUNDS}
+        volcanism_checks = []
+        volcanism_vocabulary = set()
+        
+        for species_idx, species_name in enumerate(self._species_names):
+            for ruleset in self.species_rulesets[species_name].get('rulesets', []):
+                row_species.append(species_idx)
+                row_atmospheres.append(self._ruleset_value_set(ruleset, 'atmosphere'))
+                row_body_types.append(self._ruleset_value_set(ruleset, 'body_type'))
+                for key, default in _RULESET_BOUNDS:
+                    row_bounds[key].append(ruleset.get(key, default))
+                volcanism_req = ruleset.get('volcanism', 'Any')
+                volcanism_vocabulary.update(self._volcanism_requirement_tokens(volcanism_req))
+                volcanism_check = self._compile_volcanism_requirement(volcanism_req)
+                if volcanism_check is not None:
+                    volcanism_checks.append((len(row_species) - 1, volcanism_check))
+        
+        self._rs_species = np.array(row_species, dtype=np.intp)
+        (self._rs_min_gravity, self._rs_max_gravity,
+         self._rs_min_temperature, self._rs_max_temperature,
+         self._rs_min_pressure, self._rs_max_pressure) = (
+            np.array(row_bounds[key], dtype=np.float64) for key, _ in _RULESET_BOUNDS
+        )
+        self._atmosphere_masks, self._rs_any_atmosphere = self._build_value_masks(row_atmospheres)
+        self._body_type_masks, self._rs_any_body_type = self._build_value_masks(row_body_types)
+        # Only rows with a real volcanism requirement need checking per volcanism string
+        self._rs_volcanism_rows = np.array([row for row, _ in volcanism_checks], dtype=np.intp)
+        self._rs_volcanism_checks = [check for _, check in volcanism_checks]
+        self._volcanism_vocabulary = frozenset(volcanism_vocabulary)
+        self._volcanism_masks: Dict[str, np.ndarray] = {}
+        self._candidate_buckets: Dict[Tuple[str, str], Tuple[np.ndarray, ...]] = {}
+        
+        # Distinct finite bounds per dimension. A value's position among them decides
+        # every min/max check, so it serves as an exact detection cache key.
+        self._bound_cells = tuple(
+            self._finite_sorted(bounds) for bounds in (
+                self._rs_min_gravity, self._rs_max_gravity,
+                self._rs_min_temperature, self._rs_max_temperature,
+                self._rs_min_pressure, self._rs_max_pressure,
+            )
+        )
+        self._detect_cache: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def _finite_sorted(bounds: np.ndarray) -> List[float]:
+        """Sorted distinct finite values of a bound array."""
+        return np.unique(bounds[np.isfinite(bounds)]).tolist()
+    
+    def _detection_cache_key(self, atmosphere_type: str, body_type: str, volcanism: str,
+                             gravity: float, surface_temp: float, surface_pressure: float) -> Optional[Tuple]:
+        """Key identifying which rulesets a body can match, or None if it cannot be cached.
+        
+        Each numeric value is replaced by the number of minimum bounds it meets
+        and the number of maximum bounds it exceeds, so bodies share a key
+        exactly when every ruleset check gives the same result.
+        """
+        if gravity != gravity or surface_temp != surface_temp or surface_pressure != surface_pressure:
+            # NaN fails every bound check but has no position among the bounds
+            return None
+        (min_gravity, max_gravity, min_temperature, max_temperature,
+         min_pressure, max_pressure) = self._bound_cells
+        return (
+            atmosphere_type, body_type, volcanism,
+            bisect_right(min_gravity, gravity), bisect_left(max_gravity, gravity),
+            bisect_right(min_temperature, surface_temp), bisect_left(max_temperature, surface_temp),
+            bisect_right(min_pressure, surface_pressure), bisect_left(max_pressure, surface_pressure),
+        )
+    
+    @staticmethod
+    def _ruleset_value_set(ruleset: Dict, key: str) -> Optional[frozenset]:
+        """Return the allowed values for a categorical ruleset key, or None if unconstrained."""
+        if key not in ruleset:
+            return None
+        required = ruleset[key]
+        return frozenset(required) if isinstance(required, list) else frozenset((required,))
+    
+    @staticmethod
+    def _build_value_masks(row_values: List[Optional[frozenset]]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Build a row mask per categorical value, plus the mask of unconstrained rows."""
+        any_mask = np.array([allowed is None for allowed in row_values], dtype=bool)
+        names = set().union(*(allowed for allowed in row_values if allowed is not None))
+        masks = {
+            name: any_mask | np.array([allowed is not None and name in allowed for allowed in row_values], dtype=bool)
+            for name in names
+        }
+        return masks, any_mask
+    
+    def _volcanism_mask(self, volcanism: str) -> np.ndarray:
+        """Row mask of rulesets whose volcanism requirement the body's volcanism meets."""
+        mask = self._volcanism_masks.get(volcanism)
+        if mask is None:
+            volcanism_tokens = self._volcanism_tokens(volcanism, self._volcanism_vocabulary)
+            mask = np.ones(len(self._rs_species), dtype=bool)
+            mask[self._rs_volcanism_rows] = [
+                check(volcanism, volcanism_tokens) for check in self._rs_volcanism_checks
+            ]
+            self._volcanism_masks[volcanism] = mask
+        return mask
+    
+    def _candidate_bucket(self, atmosphere_type: str, body_type: str) -> Tuple[np.ndarray, ...]:
+        """Rulesets compatible with an (atmosphere, body type) pair, with their bounds.
+        
+        Unconstrained rulesets are included in every bucket. Buckets are built on
+        first use and cached, so the numeric checks only ever run over the rows
+        that can possibly match.
+        
+        Returns:
+            Tuple of (rows, species, min/max gravity, min/max temperature, min/max pressure)
+        """
+        key = (atmosphere_type, body_type)
+        bucket = self._candidate_buckets.get(key)
+        if bucket is None:
+            rows = np.flatnonzero(
+                self._atmosphere_masks.get(atmosphere_type, self._rs_any_atmosphere)
+                & self._body_type_masks.get(body_type, self._rs_any_body_type)
+            )
+            bucket = (
+                rows, self._rs_species[rows],
+                self._rs_min_gravity[rows], self._rs_max_gravity[rows],
+                self._rs_min_temperature[rows], self._rs_max_temperature[rows],
+                self._rs_min_pressure[rows], self._rs_max_pressure[rows],
+            )
+            self._candidate_buckets[key] = bucket
+        return bucket
+    
+    @staticmethod
+    def _volcanism_requirement_tokens(volcanism_req) -> frozenset:
+        """Lowercased volcanism types a requirement looks for; empty for 'Any' and 'None'."""
+        if volcanism_req in ('Any', 'None'):
+            return frozenset()
+        if isinstance(volcanism_req, list):
+            return frozenset(vol_type.lower() for vol_type in volcanism_req)
+        return frozenset((volcanism_req.lower(),))
+    
+    @staticmethod
+    def _volcanism_tokens(volcanism: str, vocabulary: frozenset) -> frozenset:
+        """Required volcanism types that occur in a body's volcanism string."""
+        volcanism_lower = volcanism.lower()
+        return frozenset(vol_type for vol_type in vocabulary if vol_type in volcanism_lower)
+    
+    @classmethod
+    def _compile_volcanism_requirement(cls, volcanism_req) -> Optional[Callable[[str, frozenset], bool]]:
+        """Compile a ruleset volcanism requirement into a predicate.
+        
+        The predicate takes the body's volcanism string and its volcanism
+        tokens, which must cover every type this requirement looks for.
+        Returns None for 'Any', which every body satisfies.
+        """
+        if volcanism_req == 'Any':
+            # Any volcanism including none is acceptable
+            return None
+        if volcanism_req == 'None':
+            return lambda volcanism, volcanism_tokens: not volcanism or volcanism.lower() == 'none'
+        required = cls._volcanism_requirement_tokens(volcanism_req)
+        if len(required) == 1:
+            # Single volcanism type requirement
+            (required_type,) = required
+            return lambda volcanism, volcanism_tokens: required_type in volcanism_tokens
+        # Check if any of the required volcanism types are present
+        return lambda volcanism, volcanism_tokens: not required.isdisjoint(volcanism_tokens)
+    
     def _normalize_atmosphere(self, atmosphere_type: str) -> str:
         """Normalize atmosphere type string."""
-        if not atmosphere_type:
-            return ""
-        return atmosphere_type.replace(" atmosphere", "").replace("_", "").strip()
+        return _normalize_atmosphere_type(atmosphere_type)
+    
+    def _prepare_body(self, body: Dict) -> Tuple[str, str, float, float, float, str]:
+        """Extract the body characteristics used by ruleset matching.
+        
+        Returns:
+            Tuple of (normalized atmosphere, body type, gravity, surface temperature,
+            surface pressure, volcanism) with missing values replaced by defaults
+        """
+        gravity = body.get('gravity')
+        surface_temp = body.get('surfaceTemperature')
+        surface_pressure = body.get('surfacePressure')
+        return (
+            _normalize_atmosphere_type(body.get('atmosphereType') or ''),
+            body.get('subType') or '',
+            0 if gravity is None else gravity,
+            0 if surface_temp is None else surface_temp,
+            0 if surface_pressure is None else surface_pressure,
+            body.get('volcanism') or '',
+        )
     
     def _check_ruleset_match(self, body: Dict, ruleset: Dict) -> bool:
         """Check if a body matches a specific species ruleset."""
         # Extract body characteristics
-        atmosphere_type = self._normalize_atmosphere(body.get('atmosphereType', '') or '')
-        surface_temp = body.get('surfaceTemperature', 0) or 0
-        gravity = body.get('gravity', 0) or 0
-        body_type = body.get('subType', '') or ''
-        surface_pressure = body.get('surfacePressure', 0) or 0
-        volcanism = body.get('volcanism', '') or ''
+        (atmosphere_type, body_type, gravity, surface_temp,
+         surface_pressure, volcanism) = self._prepare_body(body)
         
         # Check atmosphere requirement
         if 'atmosphere' in ruleset:
@@ -155,60 +602,94 @@ Value Tiers (Minimum Guaranteed):
         # Check volcanism requirement
         if 'volcanism' in ruleset:
             volcanism_req = ruleset['volcanism']
-            if volcanism_req == 'Any':
-                # Any volcanism including none is acceptable
-                pass
-            elif volcanism_req == 'None':
-                if volcanism and volcanism.lower() != 'none':
-                    return False
-            elif isinstance(volcanism_req, list):
-                # Check if any of the required volcanism types are present
-                volcanism_lower = volcanism.lower()
-                if not any(vol_type.lower() in volcanism_lower for vol_type in volcanism_req):
-                    return False
-            else:
-                # Single volcanism type requirement
-                if volcanism_req.lower() not in volcanism.lower():
+            volcanism_check = self._compile_volcanism_requirement(volcanism_req)
+            if volcanism_check is not None:
+                volcanism_tokens = self._volcanism_tokens(
+                    volcanism, self._volcanism_requirement_tokens(volcanism_req))
+                if not volcanism_check(volcanism, volcanism_tokens):
                     return False
         
         return True
     
     def detect_species_on_body(self, body: Dict) -> List[Dict]:
-        """Detect all possible species on a body based on its characteristics."""
-        detected_species = []
-        
-        for species_name, species_info in self.species_rulesets.items():
-            rulesets = species_info.get('rulesets', [])
-            
-            # Check if any ruleset matches this body
-            for ruleset in rulesets:
-                if self._check_ruleset_match(body, ruleset):
-                    detected_species.append({
-                        'name': species_name,
-                        'genus': species_info.get('genus', 'Unknown'),
-                        'value': species_info.get('value', 0)
-                    })
-                    break  # Only need one matching ruleset per species
+        """Detect all possible species on a body based on its characteristics.
+        
+        Only rulesets compatible with the body's atmosphere and body type are
+        considered; those are matched at once against the flattened ruleset
+        arrays, and a species is detected if any of its rulesets matches.
+        Results are cached per distinct set of ruleset outcomes. The returned
+        species dicts are shared across bodies and must not be modified.
+        """
+        # Extract body characteristics
+        (atmosphere_type, body_type, gravity, surface_temp,
+         surface_pressure, volcanism) = self._prepare_body(body)
+        
+        # Most bodies (e.g. airless ones) have no candidate rulesets at all, so
+        # reject those before building a cache key
+        bucket = self._candidate_bucket(atmosphere_type, body_type)
+        if not len(bucket[0]):
+            return []
+        
+        key = self._detection_cache_key(atmosphere_type, body_type, volcanism,
+                                        gravity, surface_temp, surface_pressure)
+        cached = self._detect_cache.get(key)
+        if cached is not None:
+            self._detect_cache.move_to_end(key)
+            return list(cached)
+        
+        (rows, species, min_gravity, max_gravity, min_temperature, max_temperature,
+         min_pressure, max_pressure) = bucket
+        
+        mask = (min_gravity <= gravity) & (gravity <= max_gravity)
+        mask &= (min_temperature <= surface_temp) & (surface_temp <= max_temperature)
+        mask &= (min_pressure <= surface_pressure) & (surface_pressure <= max_pressure)
+        mask &= self._volcanism_mask(volcanism)[rows]
+        
+        species_entries = self._species_entries
+        detected_species = [species_entries[species_idx] for species_idx in np.unique(species[mask]).tolist()]
                 
+        return self._cache_detection(key, detected_species)
+    
+    def _cache_detection(self, key: Optional[Tuple], detected_species: List[Dict]) -> List[Dict]:
+        """Store a detection result in the bounded LRU cache and return it."""
+        if key is not None:
+            self._detect_cache[key] = tuple(detected_species)
+            if len(self._detect_cache) > _DETECTION_CACHE_SIZE:
+                self._detect_cache.popitem(last=False)
         return detected_species
     
     def has_suitable_atmosphere(self, body: Dict) -> bool:
         """Check if body has suitable atmospheric pressure (0-0.1 atm)."""
-        surface_pressure = body.get('surfacePressure', 0) or 0
+        surface_pressure = body.get('surfacePressure')
+        if surface_pressure is None:
+            return True
         return 0.0 <= surface_pressure <= 0.1
     
     def passes_date_filter(self, body: Dict, date_threshold: datetime) -> bool:
-        """Check if body hasn't been updated after the threshold date."""
+        """Check if body hasn't been updated after the threshold date.
+        
+        Naive timestamps and thresholds are treated as UTC. Whole-second UTC
+        strings ("2021-05-18 22:11:16", optionally with 'Z' or '+00:00') are
+        compared as strings; anything else goes through the cached parser.
+        """
         update_time = body.get('updateTime')
         if not update_time:
             return True
             
         try:
             if isinstance(update_time, str):
-                body_date = datetime.fromisoformat(update_time.replace('Z', '+00:00'))
+                if (len(update_time) >= 19 and update_time[19:] in _UTC_SUFFIXES
+                        and update_time[4] == '-' and update_time[7] == '-'
+                        and update_time[10] in ' T' and update_time[13] == ':'):
+                    threshold_date, threshold_time = _threshold_strings(date_threshold)
+                    body_date = update_time[:10]
+                    if body_date != threshold_date:
+                        return body_date < threshold_date
+                    return update_time[11:19] <= threshold_time
+                body_date = _parse_update_time(update_time)
             else:
-                body_date = update_time
-            return body_date <= date_threshold
+                body_date = _naive_utc(update_time)
+            return body_date <= _naive_utc(date_threshold)
         except (ValueError, TypeError):
             return True
     
@@ -219,11 +700,9 @@ Value Tiers (Minimum Guaranteed):
         for species in detected_species:
             genus = species['genus']
             value = species['value']
-            
-            if genus not in genus_min_values:
+            current = genus_min_values.get(genus)
+            if current is None or value < current:
                 genus_min_values[genus] = value
-            else:
-                genus_min_values[genus] = min(genus_min_values[genus], value)
         
         return genus_min_values
     
@@ -248,16 +727,50 @@ Value Tiers (Minimum Guaranteed):
         
         return categories
     
-    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool) -> bool:
-        """Check if body meets the high-value criteria (lowered threshold)."""
-        genus_min_values = self.get_genus_minimum_values(detected_species)
-        genus_categories = self.categorize_genera_by_min_value(genus_min_values)
+    def _count_genus_tiers(self, genus_min_values: Dict[str, int]) -> Tuple[int, int, int, int]:
+        """Count genera per minimum-value tier without building the category lists.
+        
+        Returns:
+            Tuple of (extremely_high, high, moderate, low) genus counts
+        """
+        extremely_high = high = moderate = low = 0
+        for min_value in genus_min_values.values():
+            if min_value >= self.EXTREMELY_HIGH_VALUE_MIN:
+                extremely_high += 1
+            elif min_value >= self.HIGH_VALUE_MIN:
+                high += 1
+            elif min_value >= self.MODERATE_VALUE_MIN:
+                moderate += 1
+            elif min_value >= self.LOW_VALUE_MIN:
+                low += 1
+        return extremely_high, high, moderate, low
+    
+    def _body_genus_tiers(self, body_info: BodyInfo) -> Tuple[int, int, int, int]:
+        """Tier counts for a qualifying body, computed on first use and kept on body_info."""
+        tiers = body_info.genus_tiers
+        if tiers is None:
+            tiers = body_info.genus_tiers = self._count_genus_tiers(body_info.genus_min_values)
+        return tiers
+    
+    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool,
+                                  genus_min_values: Optional[Dict[str, int]] = None,
+                                  genus_tiers: Optional[Tuple[int, int, int, int]] = None) -> bool:
+        """Check if body meets the high-value criteria (lowered threshold).
+        
+        Args:
+            detected_species: Species detected on the body
+            has_bacterium: Whether the body can host a competing bacterium
+            genus_min_values: Precomputed genus minima for detected_species, if available
+            genus_tiers: Precomputed tier counts for genus_min_values, if available
+        """
+        if genus_min_values is None:
+            genus_min_values = self.get_genus_minimum_values(detected_species)
+        if genus_tiers is None:
+            genus_tiers = self._count_genus_tiers(genus_min_values)
+        extremely_high_genera, high_genera, moderate_min_genera, _ = genus_tiers
         
         # Count genera with high minimum values (10M+ guaranteed) - THIS IS THE KEY CHANGE
-        high_or_extremely_high_genera = len(genus_categories['high_min']) + len(genus_categories['extremely_high_min'])
-        
-        # Count genera with moderate minimum values (5-10M guaranteed)  
-        moderate_min_genera = len(genus_categories['moderate_min'])
+        high_or_extremely_high_genera = high_genera + extremely_high_genera
         
         # If body has bacterium, it needs an additional non-bacterium genus
         required_genera = 2 if has_bacterium else 1
@@ -273,73 +786,49 @@ Value Tiers (Minimum Guaranteed):
     
     def has_competing_bacterium(self, body: Dict) -> bool:
         """Check if body is eligible for bacterium aurasus or cerbrus."""
-        atmosphere_type = self._normalize_atmosphere(body.get('atmosphereType', '') or '')
-        surface_temp = body.get('surfaceTemperature', 0) or 0
-        gravity = body.get('gravity', 0) or 0
-        body_type = body.get('subType', '') or ''
-        
-        # Check Bacterium Aurasus eligibility
-        if (atmosphere_type == 'CarbonDioxide' and 
-            body_type in ['Rocky body', 'High metal content body', 'Rocky ice body'] and
-            0.039 <= gravity <= 0.608 and
-            145.0 <= surface_temp <= 400.0):
-            return True
+        atmosphere_type, body_type, gravity, surface_temp, _, _ = self._prepare_body(body)
         
-        # Check Bacterium Cerbrus eligibility  
-        if (atmosphere_type == 'SulphurDioxide' and
-            body_type in ['Rocky body', 'High metal content body', 'Rocky ice body'] and
-            0.042 <= gravity <= 0.605 and
-            132.0 <= surface_temp <= 500.0):
-            return True
-            
-        return False
+        # Aurasus and Cerbrus share the body type requirement; only the ranges differ
+        ranges = _COMPETING_BACTERIUM_RANGES.get(atmosphere_type)
+        if ranges is None:
+            return False
+        
+        min_gravity, max_gravity, min_temp, max_temp = ranges
+        return (body_type in _BACTERIUM_BODY_TYPES and
+                min_gravity <= gravity <= max_gravity and
+                min_temp <= surface_temp <= max_temp)
     
-    def meets_system_criteria(self, qualifying_bodies: List[Dict]) -> bool:
+    def meets_system_criteria(self, qualifying_bodies: List[BodyInfo]) -> bool:
         """Check if system meets the high-value criteria (lowered thresholds)."""
-        if len(qualifying_bodies) < 2:
+        if len(qualifying_bodies) < self.MIN_QUALIFYING_BODIES:
             return False
         
-        # Analyze each body's genus minimum values
-        body_analyses = []
+        # Count qualifying bodies while scanning and stop as soon as either condition holds
+        high_value_bodies = 0
+        condition2_bodies = 0
         for body in qualifying_bodies:
-            genus_min_values = self.get_genus_minimum_values(body['detected_species'])
-            genus_categories = self.categorize_genera_by_min_value(genus_min_values)
+            extremely_high_genera, high_genera, moderate_min_genera, _ = self._body_genus_tiers(body)
+            if high_genera + extremely_high_genera < 1:
+                continue
             
-            body_analyses.append({
-                'body': body,
-                'genus_min_values': genus_min_values,
-                'genus_categories': genus_categories,
-                'high_or_extremely_high_genera': len(genus_categories['high_min']) + len(genus_categories['extremely_high_min']),
-                'moderate_min_genera': len(genus_categories['moderate_min']),
-                'has_bacterium': body.get('has_bacterium', False)
-            })
-        
-        # Condition 1: 3 bodies with at least 1 genus whose minimum is high value (10M+) - LOWERED THRESHOLD
-        high_value_bodies = [
-            body_analysis for body_analysis in body_analyses 
-            if body_analysis['high_or_extremely_high_genera'] >= 1
-        ]
-        
-        if len(high_value_bodies) >= 3:
-            return True
-        
-        # Condition 2: 2 bodies with high genus + moderate minimum value genus - LOWERED THRESHOLD  
-        condition2_bodies = []
-        for body_analysis in body_analyses:
-            has_high = body_analysis['high_or_extremely_high_genera'] >= 1
-            has_moderate_min = body_analysis['moderate_min_genera'] >= 1
+            # Condition 1: 3 bodies with at least 1 genus whose minimum is high value (10M+) - LOWERED THRESHOLD
+            high_value_bodies += 1
+            if high_value_bodies >= 3:
+                return True
             
-            if has_high and has_moderate_min:
-                condition2_bodies.append(body_analysis)
-        
-        if len(condition2_bodies) >= 2:
-            return True
+            # Condition 2: 2 bodies with high genus + moderate minimum value genus - LOWERED THRESHOLD
+            if moderate_min_genera >= 1:
+                condition2_bodies += 1
+                if condition2_bodies >= 2:
+                    return True
         
         return False
     
     def filter_system(self, system_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Filter systems based on rule-based exobiology criteria."""
         bodies = system_data.get('bodies', [])
+        if len(bodies) < self.MIN_QUALIFYING_BODIES:
+            return None  # Too few bodies for the system criteria
         qualifying_bodies = []
         
         for body in bodies:
@@ -359,27 +848,32 @@ Value Tiers (Minimum Guaranteed):
             # Check if body has competing bacterium
             has_bacterium = self.has_competing_bacterium(body)
             
+            # Genus minima and tier counts are computed once per body and reused by the system checks
+            genus_min_values = self.get_genus_minimum_values(detected_species)
+            genus_tiers = self._count_genus_tiers(genus_min_values)
+            
             # Check for valuable co-occurrence using high-value criteria (lowered threshold)
-            if not self.has_valuable_cooccurrence(detected_species, has_bacterium):
+            if not self.has_valuable_cooccurrence(detected_species, has_bacterium, genus_min_values, genus_tiers):
                 continue
             
             # Calculate total value and prepare body info
-            total_value = sum(species['value'] for species in detected_species)
-            unique_genera = set(species['genus'] for species in detected_species)
+            total_value = sum(map(_species_value, detected_species))
             
-            body_info = {
-                'body_name': body.get('bodyName', body.get('name', 'Unknown')),
-                'detected_species': detected_species,
-                'genus_count': len(unique_genera),
-                'species_count': len(detected_species),
-                'total_value': total_value,
-                'has_bacterium': has_bacterium,
-                'atmosphere_type': body.get('atmosphereType', ''),
-                'surface_pressure': body.get('surfacePressure', 0),
-                'surface_temperature': body.get('surfaceTemperature', 0),
-                'gravity': body.get('gravity', 0),
-                'body_type': body.get('subType', '')
-            }
+            body_info = BodyInfo(
+                body_name=body.get('bodyName', body.get('name', 'Unknown')),
+                detected_species=detected_species,
+                genus_min_values=genus_min_values,
+                genus_count=len(genus_min_values),
+                species_count=len(detected_species),
+                total_value=total_value,
+                has_bacterium=has_bacterium,
+                atmosphere_type=body.get('atmosphereType', ''),
+                surface_pressure=body.get('surfacePressure', 0),
+                surface_temperature=body.get('surfaceTemperature', 0),
+                gravity=body.get('gravity', 0),
+                body_type=body.get('subType', ''),
+                genus_tiers=genus_tiers,
+            )
             
             qualifying_bodies.append(body_info)
         
@@ -396,20 +890,19 @@ Value Tiers (Minimum Guaranteed):
             'coords_z': round(system_data.get('coords', {}).get('z', 0), 1)
         }
         
-        # Calculate system-level statistics
+        # Calculate system-level statistics from the per-body totals
         total_genera = set()
-        total_species = []
+        total_species = 0
         total_system_value = 0
         
         for body_info in qualifying_bodies:
-            for species in body_info['detected_species']:
-                total_genera.add(species['genus'])
-                total_species.append(species)
-                total_system_value += species['value']
+            total_genera.update(body_info.genus_min_values)
+            total_species += body_info.species_count
+            total_system_value += body_info.total_value
         
         result.update({
             'total_genera': len(total_genera),
-            'total_species': len(total_species),
+            'total_species': total_species,
             'total_system_value': total_system_value
         })
         
@@ -417,31 +910,31 @@ Value Tiers (Minimum Guaranteed):
         for i, body_info in enumerate(qualifying_bodies[:3]):
             body_num = i + 1
             
-            # Calculate genus categories for this body
-            genus_min_values = self.get_genus_minimum_values(body_info['detected_species'])
-            genus_categories = self.categorize_genera_by_min_value(genus_min_values)
+            # Count genus tiers for this body
+            genus_min_values = body_info.genus_min_values
+            extremely_high_genera, high_genera, moderate_min_genera, low_min_genera = self._body_genus_tiers(body_info)
             
             # Find minimum guaranteed value (worst case)
             min_guaranteed_value = min(genus_min_values.values()) if genus_min_values else 0
             
             # Get top genera for this body (by minimum value)
-            top_genera = sorted(genus_min_values.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_genera_str = ', '.join([f"{genus}({value//1000000}M)" for genus, value in top_genera])
+            top_genera = heapq.nlargest(3, genus_min_values.items(), key=_genus_min_value)
+            top_genera_str = ', '.join([_format_genus_value(genus, value) for genus, value in top_genera])
             
             result.update({
-                f'body_{body_num}_name': body_info['body_name'],
-                f'body_{body_num}_atmosphere': body_info['atmosphere_type'],
-                f'body_{body_num}_pressure': round(body_info['surface_pressure'], 3),
-                f'body_{body_num}_temperature': round(body_info['surface_temperature'], 1),
-                f'body_{body_num}_gravity': round(body_info['gravity'], 3),
-                f'body_{body_num}_body_type': body_info['body_type'],
-                f'body_{body_num}_species_count': body_info['species_count'],
-                f'body_{body_num}_genus_count': body_info['genus_count'],
-                f'body_{body_num}_value': body_info['total_value'],
-                f'body_{body_num}_high_or_extremely_high_genera': len(genus_categories['high_min']) + len(genus_categories['extremely_high_min']),
-                f'body_{body_num}_moderate_min_genera': len(genus_categories['moderate_min']),
-                f'body_{body_num}_low_min_genera': len(genus_categories['low_min']),
-                f'body_{body_num}_has_bacterium': body_info['has_bacterium'],
+                f'body_{body_num}_name': body_info.body_name,
+                f'body_{body_num}_atmosphere': body_info.atmosphere_type,
+                f'body_{body_num}_pressure': round(body_info.surface_pressure, 3),
+                f'body_{body_num}_temperature': round(body_info.surface_temperature, 1),
+                f'body_{body_num}_gravity': round(body_info.gravity, 3),
+                f'body_{body_num}_body_type': body_info.body_type,
+                f'body_{body_num}_species_count': body_info.species_count,
+                f'body_{body_num}_genus_count': body_info.genus_count,
+                f'body_{body_num}_value': body_info.total_value,
+                f'body_{body_num}_high_or_extremely_high_genera': high_genera + extremely_high_genera,
+                f'body_{body_num}_moderate_min_genera': moderate_min_genera,
+                f'body_{body_num}_low_min_genera': low_min_genera,
+                f'body_{body_num}_has_bacterium': body_info.has_bacterium,
                 f'body_{body_num}_min_guaranteed_value': min_guaranteed_value,
                 f'body_{body_num}_top_genera': top_genera_str
             })
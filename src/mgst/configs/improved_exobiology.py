@@ -10,12 +10,24 @@ Key Improvements:
 - Fallback to basic filtering when empirical data is unreliable
 """
 
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime
+import functools
+import sys
+from typing import Dict, List, Optional, Any, Tuple
 
-from .high_value_exobiology import HighValueExobiologyConfig
+from .high_value_exobiology import ClassRanges, HighValueExobiologyConfig, UNKNOWN_STELLAR_CLASS, load_species_ranges, primary_star_info
+
+
+# Range entry for species without empirical data: every check passes
+_NO_RANGE_DATA = ClassRanges(None, None, None, None, None, None)
+
+# Tolerance multiplier per thermal regulation quality
+_QUALITY_MULTIPLIERS = {
+    'excellent': 1.0,    # Use base tolerance
+    'good': 1.5,         # 50% more tolerance
+    'fair': 2.0,         # 100% more tolerance
+    'poor': 3.0,         # 300% more tolerance
+    'unknown': 2.0       # Default to fair tolerance
+}
 
 
 class ImprovedExobiologyConfig(HighValueExobiologyConfig):
@@ -45,9 +57,6 @@ Improvements over temperature-range approach:
 - Falls back to basic filtering for species with poor thermal regulation
 """
 
-        # Load species stellar ranges
-        self.species_ranges = self._load_species_ranges()
-
         # Improved tolerance factors based on test results
         self.STELLAR_TEMP_TOLERANCE = 1.5  # 50% expansion for stellar temp
         self.BODY_TEMP_TOLERANCE = 2.0     # 100% expansion for body temp
@@ -59,213 +68,168 @@ Improvements over temperature-range approach:
         self.MIN_DISTANCE = 100.0          # Minimum 100ls for realistic bodies
         self.MAX_DISTANCE = 1000000.0      # Maximum ~1M ls reasonable limit
 
-    def _load_species_ranges(self) -> Dict[str, Any]:
-        """Load species stellar ranges data."""
-        # Look for the ranges file in the expected location
-        ranges_file = Path(__file__).parent.parent.parent.parent / "output"
+    @functools.cached_property
+    def species_ranges(self) -> Dict[str, Any]:
+        """Species stellar ranges, loaded on first use rather than at construction."""
+        return self._load_species_ranges()
 
-        # Try to find the ranges file
-        ranges_files = list(ranges_file.glob("*/species_stellar_ranges.json"))
-        if ranges_files:
-            latest_file = max(ranges_files, key=lambda x: x.stat().st_mtime)
+    @functools.cached_property
+    def _has_unknown_class_ranges(self) -> bool:
+        """Whether any species has ranges for systems without primary star data."""
+        return any(
+            UNKNOWN_STELLAR_CLASS in species_data.get('stellar_class_ranges', {})
+            for species_data in self.species_ranges.values()
+        )
 
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+    @functools.cached_property
+    def _class_range_table(self) -> Dict[Tuple[str, str], ClassRanges]:
+        """Adjusted bounds per (species, stellar class), dropped when tolerances change."""
+        return self._build_class_ranges()
+
+    def _load_species_ranges(self) -> Dict[str, Any]:
+        """Load species stellar ranges data."""
+        species_ranges = load_species_ranges()
+        if species_ranges is not None:
+            return species_ranges
 
         print("Warning: Could not load species stellar ranges. Using basic filtering only.")
         return {}
 
     def _get_stellar_class(self, system_data: Dict[str, Any]) -> str:
         """Extract the stellar class of the primary star."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            spectral_class = primary_star.get('spectralClass', primary_star.get('subType', ''))
-            if spectral_class:
-                return spectral_class[0] if spectral_class else 'Unknown'
-
-        # Fallback: check bodies for stellar data (from enriched dataset)
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_spectral_class'):
-            spectral_class = bodies[0]['stellar_spectral_class']
-            return spectral_class[0] if spectral_class else 'Unknown'
-
-        return 'Unknown'
+        return primary_star_info(system_data)[0]
 
     def _get_stellar_temperature(self, system_data: Dict[str, Any]) -> float:
         """Extract stellar surface temperature."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            return primary_star.get('surfaceTemperature', 0.0)
-
-        # Fallback: check bodies for stellar data
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_surface_temperature'):
-            return bodies[0]['stellar_surface_temperature']
-
-        return 0.0
+        return primary_star_info(system_data)[1]
 
     def _get_quality_multiplier(self, thermal_regulation: str) -> float:
         """Get tolerance multiplier based on thermal regulation quality."""
-        quality_multipliers = {
-            'excellent': 1.0,    # Use base tolerance
-            'good': 1.5,         # 50% more tolerance
-            'fair': 2.0,         # 100% more tolerance
-            'poor': 3.0,         # 300% more tolerance
-            'unknown': 2.0       # Default to fair tolerance
-        }
-        return quality_multipliers.get(thermal_regulation, 2.0)
-
-    def _validate_stellar_temperature(self, species_name: str, stellar_class: str, stellar_temp: float) -> bool:
-        """Validate stellar temperature with improved bounds and tolerance."""
-        if not self.species_ranges or species_name not in self.species_ranges:
-            return True  # No data, allow by default
-
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
-            return False  # Species not found in this stellar class
-
-        class_data = stellar_class_ranges[stellar_class]
+        return _QUALITY_MULTIPLIERS.get(thermal_regulation, 2.0)
+
+    def _build_class_ranges(self) -> Dict[Tuple[str, str], ClassRanges]:
+        """Precompute adjusted (stellar temp, body temp, distance) bounds for every species and class.
+        
+        Tolerances, quality multipliers and realistic bounds are applied once here,
+        so validation is a plain ``lo <= x <= hi`` comparison.
+        """
+        table = {}
+        for species_name, species_data in self.species_ranges.items():
+            for stellar_class, class_data in species_data.get('stellar_class_ranges', {}).items():
+                # Get quality-based multiplier
+                thermal_quality = class_data.get('thermal_regulation_quality', 'unknown')
+                quality_multiplier = self._get_quality_multiplier(thermal_quality)
+
+                table[(sys.intern(species_name), sys.intern(stellar_class))] = ClassRanges.from_bounds(
+                    self._stellar_temperature_bounds(class_data, quality_multiplier),
+                    self._bounded_range(class_data.get('body_temp_range'), self.MIN_BODY_TEMP,
+                                        self.MAX_BODY_TEMP, self.BODY_TEMP_TOLERANCE * quality_multiplier),
+                    self._bounded_range(class_data.get('distance_range'), self.MIN_DISTANCE,
+                                        self.MAX_DISTANCE, self.DISTANCE_TOLERANCE * quality_multiplier),
+                )
+        return table
+
+    def _class_ranges(self, species_name: str, stellar_class: str) -> Optional[ClassRanges]:
+        """Adjusted (stellar temp, body temp, distance) bounds for a species in a stellar class.
+        
+        Returns:
+            None if the species has data but was never seen around this stellar
+            class, otherwise its adjusted ranges
+        """
+        if species_name not in self.species_ranges:
+            return _NO_RANGE_DATA  # No data, allow by default
+        return self._class_range_table.get((species_name, stellar_class))
+
+    def _stellar_temperature_bounds(self, class_data: Dict[str, Any],
+                                    quality_multiplier: float) -> Optional[Tuple[float, float]]:
+        """Stellar temperature range expanded by the quality-adjusted tolerance."""
         stellar_temp_range = class_data.get('stellar_temp_range')
 
         if not stellar_temp_range:
-            return True  # No temperature data, allow
+            return None  # No temperature data, allow
 
         min_temp, max_temp = stellar_temp_range
 
-        # Get quality-based multiplier
-        thermal_quality = class_data.get('thermal_regulation_quality', 'unknown')
-        quality_multiplier = self._get_quality_multiplier(thermal_quality)
-
         # Apply tolerance factor with quality adjustment
         tolerance = self.STELLAR_TEMP_TOLERANCE * quality_multiplier
         temp_tolerance = (max_temp - min_temp) * (tolerance - 1.0) * 0.5
-        adjusted_min = min_temp - temp_tolerance
-        adjusted_max = max_temp + temp_tolerance
-
-        return adjusted_min <= stellar_temp <= adjusted_max
-
-    def _validate_body_temperature(self, species_name: str, stellar_class: str, body_temp: float) -> bool:
-        """Validate body temperature with realistic bounds and improved tolerance."""
-        if not self.species_ranges or species_name not in self.species_ranges:
-            return True  # No data, allow by default
-
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
-            return False  # Species not found in this stellar class
-
-        class_data = stellar_class_ranges[stellar_class]
-        body_temp_range = class_data.get('body_temp_range')
+        return min_temp - temp_tolerance, max_temp + temp_tolerance
 
-        if not body_temp_range:
-            return True  # No temperature data, allow
+    @staticmethod
+    def _bounded_range(value_range: Optional[List[float]], lower: float, upper: float,
+                       tolerance: float) -> Optional[Tuple[float, float]]:
+        """Clamp a range to realistic bounds, then expand it by a tolerance factor.
+        
+        Returns None (allow) when there is no range or it is invalid after clamping.
+        """
+        if not value_range:
+            return None  # No data, allow
 
-        min_temp, max_temp = body_temp_range
+        min_value, max_value = value_range
 
         # Apply realistic bounds first
-        min_temp = max(self.MIN_BODY_TEMP, min_temp)
-        max_temp = min(self.MAX_BODY_TEMP, max_temp)
+        min_value = max(lower, min_value)
+        max_value = min(upper, max_value)
 
         # Skip validation if range becomes invalid after bounds correction
-        if min_temp >= max_temp:
-            return True  # Range is invalid, allow by default
-
-        # Get quality-based multiplier
-        thermal_quality = class_data.get('thermal_regulation_quality', 'unknown')
-        quality_multiplier = self._get_quality_multiplier(thermal_quality)
+        if min_value >= max_value:
+            return None  # Range is invalid, allow by default
 
         # Apply tolerance factor with quality adjustment
-        tolerance = self.BODY_TEMP_TOLERANCE * quality_multiplier
-        temp_tolerance = (max_temp - min_temp) * (tolerance - 1.0) * 0.5
-        adjusted_min = max(self.MIN_BODY_TEMP, min_temp - temp_tolerance)
-        adjusted_max = min(self.MAX_BODY_TEMP, max_temp + temp_tolerance)
+        value_tolerance = (max_value - min_value) * (tolerance - 1.0) * 0.5
+        return max(lower, min_value - value_tolerance), min(upper, max_value + value_tolerance)
+
+    def _validate_stellar_temperature(self, species_name: str, stellar_class: str, stellar_temp: float) -> bool:
+        """Validate stellar temperature with improved bounds and tolerance."""
+        ranges = self._class_ranges(species_name, stellar_class)
+        if ranges is None:
+            return False  # Species not found in this stellar class
+
+        return ranges.stellar_lo is None or ranges.stellar_lo <= stellar_temp <= ranges.stellar_hi
+
+    def _validate_body_temperature(self, species_name: str, stellar_class: str, body_temp: float) -> bool:
+        """Validate body temperature with realistic bounds and improved tolerance."""
+        ranges = self._class_ranges(species_name, stellar_class)
+        if ranges is None:
+            return False  # Species not found in this stellar class
 
-        return adjusted_min <= body_temp <= adjusted_max
+        return ranges.body_lo is None or ranges.body_lo <= body_temp <= ranges.body_hi
 
     def _validate_orbital_distance(self, species_name: str, stellar_class: str, distance: float) -> bool:
         """Validate orbital distance with realistic bounds and improved tolerance."""
-        if not self.species_ranges or species_name not in self.species_ranges:
+        ranges = self._class_ranges(species_name, stellar_class)
+        if ranges is _NO_RANGE_DATA:
             return True  # No data, allow by default
 
         if distance <= 0:
             return True  # No distance data, allow
 
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
+        if ranges is None:
             return False  # Species not found in this stellar class
 
-        class_data = stellar_class_ranges[stellar_class]
-        distance_range = class_data.get('distance_range')
-
-        if not distance_range:
-            return True  # No distance data, allow
+        return ranges.distance_lo is None or ranges.distance_lo <= distance <= ranges.distance_hi
 
-        min_dist, max_dist = distance_range
-
-        # Apply realistic bounds
-        min_dist = max(self.MIN_DISTANCE, min_dist)
-        max_dist = min(self.MAX_DISTANCE, max_dist)
-
-        # Skip validation if range becomes invalid after bounds correction
-        if min_dist >= max_dist:
-            return True  # Range is invalid, allow by default
-
-        # Get quality-based multiplier
-        thermal_quality = class_data.get('thermal_regulation_quality', 'unknown')
-        quality_multiplier = self._get_quality_multiplier(thermal_quality)
-
-        # Apply tolerance factor with quality adjustment
-        tolerance = self.DISTANCE_TOLERANCE * quality_multiplier
-        dist_tolerance = (max_dist - min_dist) * (tolerance - 1.0) * 0.5
-        adjusted_min = max(self.MIN_DISTANCE, min_dist - dist_tolerance)
-        adjusted_max = min(self.MAX_DISTANCE, max_dist + dist_tolerance)
-
-        return adjusted_min <= distance <= adjusted_max
-
-    def _is_species_valid_for_system(self, body: Dict, species_info: Dict, system_data: Dict) -> bool:
-        """Validate species against improved range criteria."""
-        species_name = species_info['name']
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
+    def _is_species_valid(self, body: Dict, species_name: str, stellar_class: str, stellar_temp: float) -> bool:
+        """Validate species against improved range criteria for a known primary star."""
+        ranges = self._class_ranges(species_name, stellar_class)
+        if ranges is _NO_RANGE_DATA:
+            return True  # No data, allow by default
+        if ranges is None:
+            return False  # Species not found in this stellar class
 
         # Check stellar temperature range
-        if not self._validate_stellar_temperature(species_name, stellar_class, stellar_temp):
+        if ranges.stellar_lo is not None and not ranges.stellar_lo <= stellar_temp <= ranges.stellar_hi:
             return False
 
         # Check body temperature range
-        body_temp = body.get('surfaceTemperature', 0.0)
-        if not self._validate_body_temperature(species_name, stellar_class, body_temp):
+        if ranges.body_lo is not None and not ranges.body_lo <= body.get('surfaceTemperature', 0.0) <= ranges.body_hi:
             return False
 
         # Check orbital distance range
         distance = body.get('distanceToArrival', 0.0)
-        if not self._validate_orbital_distance(species_name, stellar_class, distance):
-            return False
-
-        return True
+        if distance <= 0:
+            return True  # No distance data, allow
+        return ranges.distance_lo is None or ranges.distance_lo <= distance <= ranges.distance_hi
 
     def detect_species_on_body(self, body: Dict, system_data: Dict = None) -> List[Dict]:
         """Enhanced species detection using improved validation."""
@@ -277,17 +241,22 @@ Improvements over temperature-range approach:
 
         # Filter species based on improved range validation
         valid_species = []
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
-
-        for species in base_species:
-            if self._is_species_valid_for_system(body, species, system_data):
-                valid_species.append({
-                    **species,
-                    'stellar_class': stellar_class,
-                    'stellar_temperature': stellar_temp,
-                    'validation_method': 'improved_empirical_ranges'
-                })
+        stellar_class, stellar_temp = primary_star_info(system_data)
+
+        if stellar_class == UNKNOWN_STELLAR_CLASS and not self._has_unknown_class_ranges:
+            # No species has ranges for an unknown primary star, so only species
+            # without range data can pass and they need no range checks
+            accepted = (species for species in base_species if species['name'] not in self.species_ranges)
+        else:
+            accepted = (species for species in base_species
+                        if self._is_species_valid(body, species['name'], stellar_class, stellar_temp))
+
+        for species in accepted:
+            validated = species.copy()
+            validated['stellar_class'] = stellar_class
+            validated['stellar_temperature'] = stellar_temp
+            validated['validation_method'] = 'improved_empirical_ranges'
+            valid_species.append(validated)
 
         return valid_species
 
@@ -330,6 +299,9 @@ Improvements over temperature-range approach:
         self.BODY_TEMP_TOLERANCE = body_temp_tol
         self.DISTANCE_TOLERANCE = distance_tol
 
+        # Rebuilt with the new tolerances on next use
+        self.__dict__.pop('_class_range_table', None)
+
         print(f"Updated improved tolerance factors:")
         print(f"  Stellar temperature: {stellar_temp_tol}")
         print(f"  Body temperature: {body_temp_tol}")
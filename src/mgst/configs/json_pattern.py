@@ -5,11 +5,24 @@ This configuration allows using JSON pattern files for filtering systems.
 
 import json
 import math
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
+
+import numpy as np
 
 from .base import BaseConfig
-from ..core.json_pattern_matcher import JSONPatternMatcher
+from ..core.json_pattern_matcher import JSONPatternMatcher, match_pattern
+
+
+# Number of systems whose corridor distances are computed together by filter_systems
+_CORRIDOR_BATCH_SIZE = 65536
+
+# Body subtypes whose counts are output columns, mapped to their column names
+_SUBTYPE_COUNT_COLUMNS = {
+    subtype: f'{subtype}_count'
+    for subtype in ('Earth-like world', 'Water world', 'Ammonia world', 'Black Hole', 'Neutron Star')
+}
 
 
 class JSONPatternConfig(BaseConfig):
@@ -40,12 +53,69 @@ class JSONPatternConfig(BaseConfig):
 
         if corridor_params:
             description += f" (Corridor: radius {corridor_params['radius']} LY)"
+            self._prepare_corridor(corridor_params)
 
         super().__init__(
             name=f"json_pattern_{self.pattern_file.stem}",
             description=description
         )
 
+    def _prepare_corridor(self, corridor_params: Dict[str, Any]):
+        """Precompute corridor line-segment invariants used for every system.
+
+        Args:
+            corridor_params: Corridor filtering parameters
+
+        Raises:
+            ValueError: If the corridor radius is negative
+        """
+        if corridor_params['radius'] < 0:
+            raise ValueError(f"Corridor radius must be non-negative, got {corridor_params['radius']}")
+
+        start = tuple(float(c) for c in corridor_params['start_coords'])
+        end = tuple(float(c) for c in corridor_params['end_coords'])
+        line = (end[0] - start[0], end[1] - start[1], end[2] - start[2])
+        line_length = math.sqrt(line[0]**2 + line[1]**2 + line[2]**2)
+
+        self._corr_start = start
+        self._corr_length = line_length
+        self._corr_unit = tuple(c / line_length for c in line) if line_length else (0.0, 0.0, 0.0)
+        self._corr_radius_sq = corridor_params['radius'] ** 2
+        self._corr_start_array = np.array(start)
+        self._corr_unit_array = np.array(self._corr_unit)
+
+        # Axis-aligned box around the corridor, padded slightly so rounding never
+        # rejects a point the exact distance check would accept
+        reach = corridor_params['radius'] * (1 + 1e-9) + 1e-9
+        self._corr_box = tuple(
+            bound
+            for axis in range(3)
+            for bound in (min(start[axis], end[axis]) - reach, max(start[axis], end[axis]) + reach)
+        )
+
+    def _corridor_distance_sq(self, point: Tuple[float, float, float]) -> float:
+        """Calculate the squared distance from a point to the corridor line segment.
+
+        Args:
+            point: (x, y, z) coordinates
+
+        Returns:
+            Squared distance in light years
+        """
+        sx, sy, sz = self._corr_start
+        px = point[0] - sx
+        py = point[1] - sy
+        pz = point[2] - sz
+
+        if self._corr_length:
+            ux, uy, uz = self._corr_unit
+            projection_length = max(0, min(self._corr_length, px * ux + py * uy + pz * uz))
+            px = point[0] - (sx + ux * projection_length)
+            py = point[1] - (sy + uy * projection_length)
+            pz = point[2] - (sz + uz * projection_length)
+
+        return px * px + py * py + pz * pz
+
     def _distance_to_line_segment(self, point: Tuple[float, float, float],
                                   start: Tuple[float, float, float],
                                   end: Tuple[float, float, float]) -> float:
@@ -87,6 +157,31 @@ class JSONPatternConfig(BaseConfig):
         dz = point[2] - closest_z
         return math.sqrt(dx**2 + dy**2 + dz**2)
 
+    def _corridor_distances_sq(self, points: np.ndarray) -> np.ndarray:
+        """Calculate squared distances from many points to the corridor line segment.
+
+        Vectorized counterpart of _corridor_distance_sq.
+
+        Args:
+            points: Array of shape (n, 3) with system coordinates
+
+        Returns:
+            Array of n squared distances in light years
+        """
+        start = self._corr_start_array
+        if self._corr_length:
+            projection_length = np.clip((points - start) @ self._corr_unit_array, 0, self._corr_length)
+            deltas = points - (start + np.outer(projection_length, self._corr_unit_array))
+        else:
+            deltas = points - start
+        return np.einsum('ij,ij->i', deltas, deltas)
+
+    @staticmethod
+    def _system_point(system_data: Dict[str, Any]) -> Tuple[float, float, float]:
+        """Extract (x, y, z) coordinates, defaulting missing axes to 0."""
+        coords = system_data.get('coords', {})
+        return (coords.get('x', 0.0), coords.get('y', 0.0), coords.get('z', 0.0))
+
     def filter_system(self, system_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Filter systems using JSON pattern matching.
 
@@ -96,25 +191,78 @@ class JSONPatternConfig(BaseConfig):
         Returns:
             System summary if it matches pattern, None otherwise
         """
-        # Get coordinates
-        coords = system_data.get('coords', {})
-        point = (coords.get('x', 0.0), coords.get('y', 0.0), coords.get('z', 0.0))
+        point = self._system_point(system_data)
 
         # Apply corridor filtering if enabled
+        distance = None
         if self.corridor_params:
-            distance = self._distance_to_line_segment(
-                point,
-                self.corridor_params['start_coords'],
-                self.corridor_params['end_coords']
-            )
-            if distance > self.corridor_params['radius']:
+            # Most systems lie far outside the corridor's bounding box
+            x_min, x_max, y_min, y_max, z_min, z_max = self._corr_box
+            if not (x_min <= point[0] <= x_max and y_min <= point[1] <= y_max and z_min <= point[2] <= z_max):
                 return None
 
-        # Reset matcher variables for each system
-        self.matcher.reset()
+            distance_sq = self._corridor_distance_sq(point)
+            if distance_sq > self._corr_radius_sq:
+                return None
+            distance = math.sqrt(distance_sq)
+
+        return self._match_system(system_data, point, distance)
+
+    def filter_systems(self, systems: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Filter many systems, rejecting corridor misses in vectorized batches.
 
-        # Check if system matches pattern
-        if not self.matcher.matches(system_data):
+        Corridor distances are computed with NumPy for up to
+        _CORRIDOR_BATCH_SIZE systems at a time, so only systems inside the
+        corridor reach pattern matching.
+
+        Args:
+            systems: Iterable of complete system records
+
+        Yields:
+            System summaries for matching systems, in input order
+        """
+        if not self.corridor_params:
+            for system_data in systems:
+                result = self.filter_system(system_data)
+                if result:
+                    yield result
+            return
+
+        batch: List[Dict[str, Any]] = []
+        points: List[Tuple[float, float, float]] = []
+
+        def flush() -> Iterator[Dict[str, Any]]:
+            distances_sq = self._corridor_distances_sq(np.array(points, dtype=np.float64))
+            for index in np.flatnonzero(distances_sq <= self._corr_radius_sq).tolist():
+                result = self._match_system(batch[index], points[index], math.sqrt(distances_sq[index]))
+                if result:
+                    yield result
+
+        for system_data in systems:
+            batch.append(system_data)
+            points.append(self._system_point(system_data))
+            if len(batch) == _CORRIDOR_BATCH_SIZE:
+                yield from flush()
+                batch.clear()
+                points.clear()
+
+        if batch:
+            yield from flush()
+
+    def _match_system(self, system_data: Dict[str, Any], point: Tuple[float, float, float],
+                      distance: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Match a system already inside the corridor and build its summary.
+
+        Args:
+            system_data: Complete system record
+            point: System (x, y, z) coordinates
+            distance: Corridor distance, or None when corridor filtering is off
+
+        Returns:
+            System summary if it matches pattern, None otherwise
+        """
+        # Check if system matches pattern; compiled matching keeps no state between systems
+        if not match_pattern(self.matcher.compiled, system_data):
             return None
 
         # Create summary with essential system info
@@ -129,26 +277,21 @@ class JSONPatternConfig(BaseConfig):
         result['z'] = point[2]
 
         # Add corridor distance if applicable
-        if self.corridor_params:
-            distance = self._distance_to_line_segment(
-                point,
-                self.corridor_params['start_coords'],
-                self.corridor_params['end_coords']
-            )
+        if distance is not None:
             result['corridor_distance'] = round(distance, 2)
 
         # Count matching bodies by type
-        body_types = {}
-        for body in system_data.get('bodies', []):
-            subtype = body.get('subType', 'Unknown')
-            body_types[subtype] = body_types.get(subtype, 0) + 1
+        bodies = system_data.get('bodies', [])
+        body_types = Counter(body.get('subType', 'Unknown') for body in bodies)
 
-        # Add body type counts to result
+        # Add counts for the body types that are output columns
         for body_type, count in body_types.items():
-            result[f'{body_type}_count'] = count
+            column = _SUBTYPE_COUNT_COLUMNS.get(body_type)
+            if column:
+                result[column] = count
 
         # Add total bodies count
-        result['total_bodies'] = len(system_data.get('bodies', []))
+        result['total_bodies'] = len(bodies)
 
         return result
 
@@ -169,13 +312,7 @@ class JSONPatternConfig(BaseConfig):
         if self.corridor_params:
             columns.append('corridor_distance')
 
-        columns.extend([
-            'total_bodies',
-            'Earth-like world_count',
-            'Water world_count',
-            'Ammonia world_count',
-            'Black Hole_count',
-            'Neutron Star_count'
-        ])
+        columns.append('total_bodies')
+        columns.extend(_SUBTYPE_COUNT_COLUMNS.values())
 
         return columns
@@ -13,13 +13,16 @@ This approach ensures systems provide substantial value by requiring either dive
 within a single body or multiple qualifying bodies across the system.
 """
 
-from typing import Dict, Any, List, Optional
-from .high_value_exobiology import HighValueExobiologyConfig
+from typing import Dict, List, Optional, Tuple
+from .high_value_exobiology import BodyInfo, HighValueExobiologyConfig
 
 
 class RuleBasedExobiologySelectiveConfig(HighValueExobiologyConfig):
     """High-Value Rule-Based Exobiology Configuration - SELECTIVE (10M+ Threshold)"""
     
+    # A single body with 2+ high-value genera is enough
+    MIN_QUALIFYING_BODIES = 1
+    
     def __init__(self):
         super().__init__()
         
@@ -42,21 +45,24 @@ class RuleBasedExobiologySelectiveConfig(HighValueExobiologyConfig):
             "This selective version ensures high returns by requiring multiple high-value genera OR multiple qualifying bodies."
         )
     
-    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool) -> bool:
+    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool,
+                                  genus_min_values: Optional[Dict[str, int]] = None,
+                                  genus_tiers: Optional[Tuple[int, int, int, int]] = None) -> bool:
         """Check if body meets the selective criteria."""
-        genus_min_values = self.get_genus_minimum_values(detected_species)
-        genus_categories = self.categorize_genera_by_min_value(genus_min_values)
-        
+        if genus_tiers is None:
+            if genus_min_values is None:
+                genus_min_values = self.get_genus_minimum_values(detected_species)
+            genus_tiers = self._count_genus_tiers(genus_min_values)
         # Count genera with extremely high minimum values (>10M guaranteed)
-        extremely_high_genera = len(genus_categories['extremely_high_min'])
+        extremely_high_genera = genus_tiers[0]
         
         # SELECTIVE CRITERIA: Body qualifies if it has 1+ genera with >10M minimum values
         # System-level logic will determine final qualification criteria
         return extremely_high_genera >= 1
     
-    def meets_system_criteria(self, qualifying_bodies: List[Dict]) -> bool:
+    def meets_system_criteria(self, qualifying_bodies: List[BodyInfo]) -> bool:
         """Check if system meets the selective criteria."""
-        if len(qualifying_bodies) < 1:
+        if len(qualifying_bodies) < self.MIN_QUALIFYING_BODIES:
             return False
         
         # SELECTIVE LOGIC: System qualifies if it has:
@@ -64,29 +70,21 @@ class RuleBasedExobiologySelectiveConfig(HighValueExobiologyConfig):
         #    OR
         # 2. 3+ bodies where each body has 1+ genus with >10M minimum values
         
-        # Count bodies by their high-value genus count
-        multi_genus_bodies = 0  # Bodies with 2+ high-value genera
-        qualifying_bodies_count = 0  # Bodies with at least 1 high-value genus
+        # Count bodies with at least 1 high-value genus, stopping once the system qualifies
+        qualifying_bodies_count = 0
         
         for body_data in qualifying_bodies:
-            # Use already calculated detected_species to avoid expensive recalculation
-            detected_species = body_data.get('detected_species', [])
-            genus_min_values = self.get_genus_minimum_values(detected_species)
-            genus_categories = self.categorize_genera_by_min_value(genus_min_values)
-            extremely_high_count = len(genus_categories['extremely_high_min'])
+            # Use already calculated genus tiers to avoid expensive recalculation
+            extremely_high_count = self._body_genus_tiers(body_data)[0]
             
+            # Criteria 1: Any body with 2+ high-value genera qualifies the system
             if extremely_high_count >= 2:
-                multi_genus_bodies += 1
-                qualifying_bodies_count += 1
-            elif extremely_high_count >= 1:
+                return True
+            
+            # Criteria 2: 3+ bodies each with at least 1 high-value genus
+            if extremely_high_count >= 1:
                 qualifying_bodies_count += 1
-        
-        # Criteria 1: Any body with 2+ high-value genera qualifies the system
-        if multi_genus_bodies >= 1:
-            return True
-        
-        # Criteria 2: 3+ bodies each with at least 1 high-value genus
-        if qualifying_bodies_count >= 3:
-            return True
+                if qualifying_bodies_count >= 3:
+                    return True
         
         return False
\ No newline at end of file
@@ -12,12 +12,125 @@ Key Enhancements:
 4. Enhanced prediction accuracy using empirical data from systematic survey analysis
 """
 
-import json
+import functools
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from .high_value_exobiology import HighValueExobiologyConfig, primary_star_info
+from ..utils.file_utils import load_json_file
+
+
+# Species-specific stellar class filters based on empirical observations
+_SPECIES_STELLAR_FILTERS = {
+    'Bacterium Vesicula': frozenset(['M', 'K']),           # M-dwarf specialist (88.1% of obs)
+    'Bacterium Acies': frozenset(['M', 'T', 'Y', 'L']),   # Cool star specialist (90.3% of obs)
+    'Fonticulua Campestris': frozenset(['M', 'K']),       # M-dwarf specialist (84.4% of obs)
+    'Stratum Paleas': frozenset(['K', 'F']),              # K/F specialist (95.3% of obs)
+    'Stratum Tectonicas': frozenset(['K', 'F']),          # K/F specialist (91.5% of obs)
+    'Osseus Spiralis': frozenset(['K', 'F', 'G', 'A']),  # Main sequence only
+    'Bacterium Alcyoneum': frozenset(['K', 'F', 'G', 'A']), # Main sequence only
+    # Bacterium Aurasus and Cerbrus: No restrictions (naturally broad)
+}
+
+
+# Pointer file in the output directory naming the latest stellar analysis directory
+_LATEST_ANALYSIS_POINTER = '.latest_stellar_analysis'
+
+
+def _output_dir() -> Path:
+    """Repository output directory holding analysis runs."""
+    return Path(__file__).parent.parent.parent.parent / "output"
+
+
+def mark_latest_stellar_analysis(analysis_dir: Path) -> Path:
+    """Record an analysis directory as the latest, so configs load it without scanning.
+
+    The stellar analysis is produced outside this package, so whatever writes
+    stellar_preferences_detailed.json must call this afterwards. While the
+    pointer names an existing file it takes precedence over newer analysis
+    directories, so a stale pointer keeps older results in use.
+
+    Args:
+        analysis_dir: Directory containing stellar_preferences_detailed.json
+
+    Returns:
+        Path of the pointer file
+    """
+    output_dir = _output_dir()
+    analysis_dir = Path(analysis_dir).resolve()
+    try:
+        target = analysis_dir.relative_to(output_dir.resolve())
+    except ValueError:
+        target = analysis_dir
+
+    pointer = output_dir / _LATEST_ANALYSIS_POINTER
+    temp_pointer = pointer.with_name(pointer.name + '.tmp')
+    temp_pointer.write_text(f"{target}\n")
+    os.replace(temp_pointer, pointer)
+
+    _latest_stellar_analysis_file.cache_clear()
+    return pointer
+
+
+def _pointed_stellar_analysis_file(output_dir: Path) -> Optional[str]:
+    """stellar_preferences_detailed.json of the directory named by the pointer file, if valid."""
+    try:
+        target = (output_dir / _LATEST_ANALYSIS_POINTER).read_text().strip()
+    except OSError:
+        return None
+    if not target:
+        return None
+
+    detailed_file = os.path.join(output_dir, target, "stellar_preferences_detailed.json")
+    return detailed_file if os.path.exists(detailed_file) else None
+
+
+@functools.lru_cache(maxsize=1)
+def _latest_stellar_analysis_file() -> Optional[str]:
+    """Find the newest stellar_preferences_detailed.json, resolved once per process.
+
+    The pointer file written by mark_latest_stellar_analysis is used whenever
+    it names an existing file, even if a newer run exists. Otherwise analysis directories are output/*stellar_analysis*, or
+    output/*/stellar_analysis when there are none; the output directory is
+    scanned once and each candidate is stat'ed once.
+    """
+    output_dir = _output_dir()
+
+    detailed_file = _pointed_stellar_analysis_file(output_dir)
+    if detailed_file is not None:
+        return detailed_file
+
+    # Try to find the most recent stellar analysis
+    analysis_dirs = []
+    nested_dirs = []
+    try:
+        entries = os.scandir(output_dir)
+    except OSError:
+        return None
+
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(_LATEST_ANALYSIS_POINTER):
+                continue
+            try:
+                if 'stellar_analysis' in entry.name:
+                    analysis_dirs.append((entry.stat().st_mtime, entry.path))
+                elif not analysis_dirs and entry.is_dir():
+                    nested = os.path.join(entry.path, 'stellar_analysis')
+                    nested_dirs.append((os.stat(nested).st_mtime, nested))
+            except OSError:
+                continue
+
+    if not analysis_dirs:
+        analysis_dirs = nested_dirs
+    if not analysis_dirs:
+        return None
 
-from .high_value_exobiology import HighValueExobiologyConfig
+    # Use the most recent analysis directory
+    latest_dir = max(analysis_dirs, key=lambda item: item[0])[1]
+    detailed_file = os.path.join(latest_dir, "stellar_preferences_detailed.json")
+    return detailed_file if os.path.exists(detailed_file) else None
 
 
 class StellarAdaptedExobiologyConfig(HighValueExobiologyConfig):
@@ -50,108 +163,82 @@ Stellar Class Preferences Incorporated:
 - M-class: Challenging thermal conditions, fewer suitable species
 """
 
-        # Load our stellar analysis data
-        self.stellar_analysis = self._load_stellar_analysis()
-
-        # Species-specific stellar class filters based on empirical observations
-        self.SPECIES_STELLAR_FILTERS = {
-            'Bacterium Vesicula': ['M', 'K'],           # M-dwarf specialist (88.1% of obs)
-            'Bacterium Acies': ['M', 'T', 'Y', 'L'],   # Cool star specialist (90.3% of obs)
-            'Fonticulua Campestris': ['M', 'K'],       # M-dwarf specialist (84.4% of obs)
-            'Stratum Paleas': ['K', 'F'],              # K/F specialist (95.3% of obs)
-            'Stratum Tectonicas': ['K', 'F'],          # K/F specialist (91.5% of obs)
-            'Osseus Spiralis': ['K', 'F', 'G', 'A'],  # Main sequence only
-            'Bacterium Alcyoneum': ['K', 'F', 'G', 'A'], # Main sequence only
-            # Bacterium Aurasus and Cerbrus: No restrictions (naturally broad)
-        }
+        # Orbital distance ranges per (species, stellar class), filled on first use
+        self._distance_ranges: Dict[Tuple[str, str], Optional[Tuple[float, float]]] = {}
 
-    def _load_stellar_analysis(self) -> Dict[str, Any]:
-        """Load stellar adaptation analysis data."""
-        # Look for the analysis file in the expected location
-        analysis_file = Path(__file__).parent.parent.parent.parent / "output"
+        # Per-instance copy so filters can be adjusted without affecting other configs
+        self.SPECIES_STELLAR_FILTERS = dict(_SPECIES_STELLAR_FILTERS)
 
-        # Try to find the most recent stellar analysis
-        analysis_dirs = list(analysis_file.glob("*stellar_analysis*"))
-        if not analysis_dirs:
-            analysis_dirs = list(analysis_file.glob("*/stellar_analysis"))
+        # Genus spellings that denote bacteria, matched case-insensitively once here
+        self._bacterium_genera = frozenset(
+            entry['genus'] for entry in self._species_entries if entry['genus'].lower() == 'bacterium'
+        )
 
-        if analysis_dirs:
-            # Use the most recent analysis directory
-            latest_dir = max(analysis_dirs, key=lambda x: x.stat().st_mtime)
-            detailed_file = latest_dir / "stellar_preferences_detailed.json"
+    @functools.cached_property
+    def stellar_analysis(self) -> Dict[str, Any]:
+        """Stellar adaptation analysis data, loaded on first use rather than at construction."""
+        return self._load_stellar_analysis()
 
-            if detailed_file.exists():
-                with open(detailed_file, 'r') as f:
-                    return json.load(f)
+    def _load_stellar_analysis(self) -> Dict[str, Any]:
+        """Load stellar adaptation analysis data.
+
+        The analysis file is located once per process (MGST_REFRESH_STELLAR_ANALYSIS=1
+        looks again on every load) and parsed once per file version.
+        """
+        if os.environ.get('MGST_REFRESH_STELLAR_ANALYSIS'):
+            _latest_stellar_analysis_file.cache_clear()
+
+        detailed_file = _latest_stellar_analysis_file()
+        if detailed_file is not None:
+            try:
+                return load_json_file(Path(detailed_file))
+            except FileNotFoundError:
+                # The cached file was removed; look again
+                _latest_stellar_analysis_file.cache_clear()
+                detailed_file = _latest_stellar_analysis_file()
+                if detailed_file is not None:
+                    return load_json_file(Path(detailed_file))
 
         print("Warning: Could not load stellar analysis data. Using basic rules only.")
         return {}
 
     def _get_stellar_class(self, system_data: Dict[str, Any]) -> str:
         """Extract the stellar class of the primary star."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            spectral_class = primary_star.get('spectralClass', primary_star.get('subType', ''))
-            if spectral_class:
-                return spectral_class[0] if spectral_class else 'Unknown'
-
-        # Fallback: check bodies for stellar data (from our enriched dataset)
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_spectral_class'):
-            spectral_class = bodies[0]['stellar_spectral_class']
-            return spectral_class[0] if spectral_class else 'Unknown'
-
-        return 'Unknown'
+        return primary_star_info(system_data)[0]
 
     def _get_stellar_temperature(self, system_data: Dict[str, Any]) -> float:
         """Extract stellar surface temperature."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            return primary_star.get('surfaceTemperature', 0.0)
-
-        # Fallback: check bodies for stellar data
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_surface_temperature'):
-            return bodies[0]['stellar_surface_temperature']
-
-        return 0.0
+        return primary_star_info(system_data)[1]
 
     def _is_species_compatible_with_stellar_class(self, species_name: str, stellar_class: str) -> bool:
         """Check if species is compatible with the stellar class based on empirical observations."""
         # Check species-specific stellar class filters
-        if species_name in self.SPECIES_STELLAR_FILTERS:
-            allowed_classes = self.SPECIES_STELLAR_FILTERS[species_name]
+        allowed_classes = self.SPECIES_STELLAR_FILTERS.get(species_name)
+        if allowed_classes is not None:
             return stellar_class in allowed_classes
 
         # No specific filter for this species - allow all stellar classes
         return True
 
-    def _validate_orbital_distance(self, body: Dict, stellar_temp: float, species_key: str, stellar_class: str) -> bool:
-        """Validate if body's orbital distance is suitable for species given stellar temperature."""
-        if not self.stellar_analysis or species_key not in self.stellar_analysis:
-            return True  # No data, allow it
+    def _has_compatible_species(self, stellar_class: str) -> bool:
+        """Check if any known species is compatible with the stellar class."""
+        filters = self.SPECIES_STELLAR_FILTERS
+        return any(species_name not in filters or stellar_class in filters[species_name]
+                   for species_name in self._species_names)
 
-        distance_to_arrival = body.get('distanceToArrival', 0.0)
-        if distance_to_arrival == 0:
-            return True  # No distance data
+    def _distance_range(self, species_key: str, stellar_class: str) -> Optional[Tuple[float, float]]:
+        """Suitable orbital distance range for a species around a stellar class.
+
+        Computed once per (species, stellar class) from the stellar analysis and
+        memoized, since the analysis does not change after loading.
+
+        Returns:
+            (min_dist, max_dist) of the most common matching stellar type, or
+            None if there is no usable data
+        """
+        key = (species_key, stellar_class)
+        if key in self._distance_ranges:
+            return self._distance_ranges[key]
 
         species_data = self.stellar_analysis[species_key]
         star_analysis = species_data.get('star_type_analysis', {})
@@ -169,33 +256,38 @@ Stellar Class Preferences Incorporated:
                     max_dist = mean_dist + 2 * std_dist
                     suitable_distances.append((min_dist, max_dist, analysis['count']))
 
-        if not suitable_distances:
-            return True  # No specific data for this stellar class
+        distance_range = None
+        if suitable_distances:
+            # Use the range from the most common stellar type
+            best_range = max(suitable_distances, key=lambda x: x[2])
+            distance_range = (best_range[0], best_range[1])
 
-        # Use the range from the most common stellar type
-        best_range = max(suitable_distances, key=lambda x: x[2])
-        min_dist, max_dist = best_range[0], best_range[1]
+        self._distance_ranges[key] = distance_range
+        return distance_range
 
-        return min_dist <= distance_to_arrival <= max_dist
+    def _validate_orbital_distance(self, body: Dict, stellar_temp: float, species_key: str, stellar_class: str) -> bool:
+        """Validate if body's orbital distance is suitable for species given stellar temperature."""
+        if not self.stellar_analysis or species_key not in self.stellar_analysis:
+            return True  # No data, allow it
 
-    def _is_species_valid_for_system(self, body: Dict, species_info: Dict, system_data: Dict) -> bool:
-        """Check if species is valid for this system based on stellar adaptation data."""
-        species_name = species_info['name']
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
+        distance_to_arrival = body.get('distanceToArrival', 0.0)
+        if distance_to_arrival == 0:
+            return True  # No distance data
 
-        # Check stellar class compatibility using empirical filters
-        if not self._is_species_compatible_with_stellar_class(species_name, stellar_class):
-            return False
+        distance_range = self._distance_range(species_key, stellar_class)
+        if distance_range is None:
+            return True  # No specific data for this stellar class
 
-        # Optional: Check orbital distance suitability (can be enabled if needed)
-        # if not self._validate_orbital_distance(body, stellar_temp, species_name.replace(' ', '_'), stellar_class):
-        #     return False
+        min_dist, max_dist = distance_range
+        return min_dist <= distance_to_arrival <= max_dist
 
-        return True
+    def detect_species_on_body(self, body: Dict, system_data: Dict = None,
+                               stellar_class: Optional[str] = None) -> List[Dict]:
+        """Enhanced species detection incorporating stellar adaptation patterns.
 
-    def detect_species_on_body(self, body: Dict, system_data: Dict = None) -> List[Dict]:
-        """Enhanced species detection incorporating stellar adaptation patterns."""
+        Callers handling many bodies of one system can pass the primary star's
+        stellar_class to avoid resolving it again for every body.
+        """
         # Get base species detections
         base_species = super().detect_species_on_body(body)
 
@@ -204,28 +296,44 @@ Stellar Class Preferences Incorporated:
 
         # Filter species based on stellar adaptation compatibility
         valid_species = []
+        if stellar_class is None:
+            stellar_class = self._get_stellar_class(system_data)
+
         for species in base_species:
-            if self._is_species_valid_for_system(body, species, system_data):
-                valid_species.append({
-                    **species,
-                    'stellar_class': self._get_stellar_class(system_data),
-                    'enhancement_note': 'Validated with stellar adaptation data'
-                })
+            # Check stellar class compatibility using empirical filters
+            if not self._is_species_compatible_with_stellar_class(species['name'], stellar_class):
+                continue
+
+            # Optional: Check orbital distance suitability (can be enabled if needed)
+            # if not self._validate_orbital_distance(body, self._get_stellar_temperature(system_data),
+            #                                        species['name'].replace(' ', '_'), stellar_class):
+            #     continue
+
+            validated = species.copy()
+            validated['stellar_class'] = stellar_class
+            validated['enhancement_note'] = 'Validated with stellar adaptation data'
+            valid_species.append(validated)
 
         return valid_species
 
-    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool) -> bool:
+    def has_valuable_cooccurrence(self, detected_species: List[Dict], has_bacterium: bool,
+                                  genus_min_values: Optional[Dict[str, int]] = None,
+                                  genus_tiers: Optional[Tuple[int, int, int, int]] = None) -> bool:
         """Enhanced co-occurrence detection using stellar-validated species only."""
         # Use parent class logic but with stellar-filtered species list
-        return super().has_valuable_cooccurrence(detected_species, has_bacterium)
+        return super().has_valuable_cooccurrence(detected_species, has_bacterium, genus_min_values, genus_tiers)
 
     def filter_system(self, system_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Enhanced system filtering with stellar adaptation analysis."""
         bodies = system_data.get('bodies', [])
+        if len(bodies) < self.MIN_QUALIFYING_BODIES:
+            return None  # Too few bodies to qualify
         qualifying_bodies = []
 
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
+        stellar_class, stellar_temp = primary_star_info(system_data)
+        if not self._has_compatible_species(stellar_class):
+            return None  # Every species would be filtered out on every body
+        bacterium_genera = self._bacterium_genera
 
         for body in bodies:
             # Basic filters
@@ -235,12 +343,12 @@ Stellar Class Preferences Incorporated:
                 continue
 
             # Enhanced species detection (filters out incompatible species)
-            detected_species = self.detect_species_on_body(body, system_data)
+            detected_species = self.detect_species_on_body(body, system_data, stellar_class)
             if not detected_species:
                 continue
 
             # Check for valuable co-occurrence using stellar-filtered species
-            has_bacterium = any(s['genus'].lower() == 'bacterium' for s in detected_species)
+            has_bacterium = any(s['genus'] in bacterium_genera for s in detected_species)
 
             if self.has_valuable_cooccurrence(detected_species, has_bacterium):
                 body_info = {
@@ -251,7 +359,7 @@ Stellar Class Preferences Incorporated:
                 }
                 qualifying_bodies.append(body_info)
 
-        if len(qualifying_bodies) < 2:
+        if len(qualifying_bodies) < self.MIN_QUALIFYING_BODIES:
             return None
 
         # Calculate system-level statistics
@@ -11,12 +11,11 @@ Key Features:
 - Iterative refinement capability for testing and validation
 """
 
-import json
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
-from datetime import datetime
+import functools
+import sys
+from typing import Dict, List, Any, Tuple
 
-from .high_value_exobiology import HighValueExobiologyConfig
+from .high_value_exobiology import ClassRanges, HighValueExobiologyConfig, UNKNOWN_STELLAR_CLASS, load_species_ranges, primary_star_info
 
 
 class TemperatureRangeExobiologyConfig(HighValueExobiologyConfig):
@@ -44,179 +43,109 @@ Range Sources:
 - Distance ranges validated against actual observations
 """
 
-        # Load species stellar ranges
-        self.species_ranges = self._load_species_ranges()
-
         # Range tolerance factors (can be adjusted for testing)
         self.STELLAR_TEMP_TOLERANCE = 1.0  # 1.0 = use exact empirical ranges
         self.BODY_TEMP_TOLERANCE = 1.0     # 1.0 = use exact empirical ranges
         self.DISTANCE_TOLERANCE = 1.0      # 1.0 = use exact empirical ranges
 
-    def _load_species_ranges(self) -> Dict[str, Any]:
-        """Load species stellar ranges data."""
-        # Look for the ranges file in the expected location
-        ranges_file = Path(__file__).parent.parent.parent.parent / "output"
+    @functools.cached_property
+    def species_ranges(self) -> Dict[str, Any]:
+        """Species stellar ranges, loaded on first use rather than at construction."""
+        return self._load_species_ranges()
 
-        # Try to find the ranges file
-        ranges_files = list(ranges_file.glob("*/species_stellar_ranges.json"))
-        if ranges_files:
-            latest_file = max(ranges_files, key=lambda x: x.stat().st_mtime)
+    @functools.cached_property
+    def _has_unknown_class_ranges(self) -> bool:
+        """Whether any species has ranges for systems without primary star data."""
+        return any(
+            UNKNOWN_STELLAR_CLASS in species_data.get('stellar_class_ranges', {})
+            for species_data in self.species_ranges.values()
+        )
 
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+    @functools.cached_property
+    def _class_bounds(self) -> Dict[Tuple[str, str], ClassRanges]:
+        """Adjusted bounds per (species, stellar class), dropped when tolerances change."""
+        return self._build_class_bounds()
+
+    def _load_species_ranges(self) -> Dict[str, Any]:
+        """Load species stellar ranges data."""
+        species_ranges = load_species_ranges()
+        if species_ranges is not None:
+            return species_ranges
 
         print("Warning: Could not load species stellar ranges. Using basic filtering only.")
         return {}
 
-    def _get_stellar_class(self, system_data: Dict[str, Any]) -> str:
-        """Extract the stellar class of the primary star."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            spectral_class = primary_star.get('spectralClass', primary_star.get('subType', ''))
-            if spectral_class:
-                return spectral_class[0] if spectral_class else 'Unknown'
-
-        # Fallback: check bodies for stellar data (from enriched dataset)
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_spectral_class'):
-            spectral_class = bodies[0]['stellar_spectral_class']
-            return spectral_class[0] if spectral_class else 'Unknown'
-
-        return 'Unknown'
+    def _build_class_bounds(self) -> Dict[Tuple[str, str], ClassRanges]:
+        """Precompute tolerance-adjusted ranges for every (species, stellar class) pair."""
+        table = {}
+        for species_name, species_data in self.species_ranges.items():
+            for stellar_class, class_data in species_data.get('stellar_class_ranges', {}).items():
+                stellar_bounds = body_bounds = distance_bounds = None
 
-    def _get_stellar_temperature(self, system_data: Dict[str, Any]) -> float:
-        """Extract stellar surface temperature."""
-        # Look for primary star data
-        stars = system_data.get('stars', [])
-        if stars:
-            primary_star = None
-            for star in stars:
-                if star.get('mainStar', False):
-                    primary_star = star
-                    break
-            if not primary_star:
-                primary_star = stars[0]
-
-            return primary_star.get('surfaceTemperature', 0.0)
-
-        # Fallback: check bodies for stellar data
-        bodies = system_data.get('bodies', [])
-        if bodies and bodies[0].get('stellar_surface_temperature'):
-            return bodies[0]['stellar_surface_temperature']
-
-        return 0.0
-
-    def _validate_stellar_temperature(self, species_name: str, stellar_class: str, stellar_temp: float) -> bool:
-        """Validate stellar temperature against empirical ranges."""
-        if not self.species_ranges or species_name not in self.species_ranges:
-            return True  # No data, allow by default
+                stellar_temp_range = class_data.get('stellar_temp_range')
+                if stellar_temp_range:
+                    min_temp, max_temp = stellar_temp_range
 
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
-            return False  # Species not found in this stellar class
+                    # Apply tolerance factor
+                    temp_tolerance = (max_temp - min_temp) * (self.STELLAR_TEMP_TOLERANCE - 1.0) * 0.5
+                    stellar_bounds = (min_temp - temp_tolerance, max_temp + temp_tolerance)
 
-        class_data = stellar_class_ranges[stellar_class]
-        stellar_temp_range = class_data.get('stellar_temp_range')
+                body_temp_range = class_data.get('body_temp_range')
+                if body_temp_range:
+                    min_temp, max_temp = body_temp_range
 
-        if not stellar_temp_range:
-            return True  # No temperature data, allow
+                    # Apply tolerance factor and ensure reasonable bounds
+                    temp_tolerance = (max_temp - min_temp) * (self.BODY_TEMP_TOLERANCE - 1.0) * 0.5
+                    body_bounds = (max(50, min_temp - temp_tolerance),   # Minimum 50K for habitability
+                                   min(1000, max_temp + temp_tolerance))  # Maximum 1000K for life
 
-        min_temp, max_temp = stellar_temp_range
+                distance_range = class_data.get('distance_range')
+                if distance_range:
+                    min_dist, max_dist = distance_range
 
-        # Apply tolerance factor
-        temp_tolerance = (max_temp - min_temp) * (self.STELLAR_TEMP_TOLERANCE - 1.0) * 0.5
-        adjusted_min = min_temp - temp_tolerance
-        adjusted_max = max_temp + temp_tolerance
-
-        return adjusted_min <= stellar_temp <= adjusted_max
-
-    def _validate_body_temperature(self, species_name: str, stellar_class: str, body_temp: float) -> bool:
-        """Validate body temperature against empirical ranges."""
-        if not self.species_ranges or species_name not in self.species_ranges:
-            return True  # No data, allow by default
-
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
-            return False  # Species not found in this stellar class
+                    # Apply tolerance factor
+                    dist_tolerance = (max_dist - min_dist) * (self.DISTANCE_TOLERANCE - 1.0) * 0.5
+                    distance_bounds = (max(0, min_dist - dist_tolerance), max_dist + dist_tolerance)
 
-        class_data = stellar_class_ranges[stellar_class]
-        body_temp_range = class_data.get('body_temp_range')
+                table[(sys.intern(species_name), sys.intern(stellar_class))] = ClassRanges.from_bounds(stellar_bounds, body_bounds, distance_bounds)
+        return table
 
-        if not body_temp_range:
-            return True  # No temperature data, allow
-
-        min_temp, max_temp = body_temp_range
-
-        # Apply tolerance factor and ensure reasonable bounds
-        temp_tolerance = (max_temp - min_temp) * (self.BODY_TEMP_TOLERANCE - 1.0) * 0.5
-        adjusted_min = max(50, min_temp - temp_tolerance)  # Minimum 50K for habitability
-        adjusted_max = min(1000, max_temp + temp_tolerance)  # Maximum 1000K for life
+    def _get_stellar_class(self, system_data: Dict[str, Any]) -> str:
+        """Extract the stellar class of the primary star."""
+        return primary_star_info(system_data)[0]
 
-        return adjusted_min <= body_temp <= adjusted_max
+    def _get_stellar_temperature(self, system_data: Dict[str, Any]) -> float:
+        """Extract stellar surface temperature."""
+        return primary_star_info(system_data)[1]
 
-    def _validate_orbital_distance(self, species_name: str, stellar_class: str, distance: float) -> bool:
-        """Validate orbital distance against empirical ranges."""
-        if not self.species_ranges or species_name not in self.species_ranges:
+    def _validate_all(self, species_name: str, stellar_class: str, stellar_temp: float,
+                      body_temp: float, distance: float) -> bool:
+        """Validate stellar temperature, body temperature and orbital distance against empirical ranges."""
+        if species_name not in self.species_ranges:
             return True  # No data, allow by default
 
-        if distance <= 0:
-            return True  # No distance data, allow
-
-        species_data = self.species_ranges[species_name]
-        stellar_class_ranges = species_data.get('stellar_class_ranges', {})
-
-        if stellar_class not in stellar_class_ranges:
+        ranges = self._class_bounds.get((species_name, stellar_class))
+        if ranges is None:
             return False  # Species not found in this stellar class
 
-        class_data = stellar_class_ranges[stellar_class]
-        distance_range = class_data.get('distance_range')
-
-        if not distance_range:
-            return True  # No distance data, allow
-
-        min_dist, max_dist = distance_range
-
-        # Apply tolerance factor
-        dist_tolerance = (max_dist - min_dist) * (self.DISTANCE_TOLERANCE - 1.0) * 0.5
-        adjusted_min = max(0, min_dist - dist_tolerance)
-        adjusted_max = max_dist + dist_tolerance
-
-        return adjusted_min <= distance <= adjusted_max
-
-    def _is_species_valid_for_system(self, body: Dict, species_info: Dict, system_data: Dict) -> bool:
-        """Validate species against all empirical range criteria."""
-        species_name = species_info['name']
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
-
         # Check stellar temperature range
-        if not self._validate_stellar_temperature(species_name, stellar_class, stellar_temp):
+        if ranges.stellar_lo is not None and not ranges.stellar_lo <= stellar_temp <= ranges.stellar_hi:
             return False
 
         # Check body temperature range
-        body_temp = body.get('surfaceTemperature', 0.0)
-        if not self._validate_body_temperature(species_name, stellar_class, body_temp):
+        if ranges.body_lo is not None and not ranges.body_lo <= body_temp <= ranges.body_hi:
             return False
 
         # Check orbital distance range
-        distance = body.get('distanceToArrival', 0.0)
-        if not self._validate_orbital_distance(species_name, stellar_class, distance):
-            return False
+        if distance <= 0:
+            return True  # No distance data, allow
+        return ranges.distance_lo is None or ranges.distance_lo <= distance <= ranges.distance_hi
 
-        return True
+    def _is_species_valid(self, body: Dict, species_name: str, stellar_class: str, stellar_temp: float) -> bool:
+        """Validate species against all empirical range criteria for a known primary star."""
+        return self._validate_all(species_name, stellar_class, stellar_temp,
+                                  body.get('surfaceTemperature', 0.0),
+                                  body.get('distanceToArrival', 0.0))
 
     def detect_species_on_body(self, body: Dict, system_data: Dict = None) -> List[Dict]:
         """Enhanced species detection using temperature and distance range validation."""
@@ -228,17 +157,22 @@ Range Sources:
 
         # Filter species based on empirical range validation
         valid_species = []
-        stellar_class = self._get_stellar_class(system_data)
-        stellar_temp = self._get_stellar_temperature(system_data)
-
-        for species in base_species:
-            if self._is_species_valid_for_system(body, species, system_data):
-                valid_species.append({
-                    **species,
-                    'stellar_class': stellar_class,
-                    'stellar_temperature': stellar_temp,
-                    'validation_method': 'empirical_temperature_ranges'
-                })
+        stellar_class, stellar_temp = primary_star_info(system_data)
+
+        if stellar_class == UNKNOWN_STELLAR_CLASS and not self._has_unknown_class_ranges:
+            # No species has ranges for an unknown primary star, so only species
+            # without range data can pass and they need no range checks
+            accepted = (species for species in base_species if species['name'] not in self.species_ranges)
+        else:
+            accepted = (species for species in base_species
+                        if self._is_species_valid(body, species['name'], stellar_class, stellar_temp))
+
+        for species in accepted:
+            validated = species.copy()
+            validated['stellar_class'] = stellar_class
+            validated['stellar_temperature'] = stellar_temp
+            validated['validation_method'] = 'empirical_temperature_ranges'
+            valid_species.append(validated)
 
         return valid_species
 
@@ -271,6 +205,7 @@ Range Sources:
         self.STELLAR_TEMP_TOLERANCE = stellar_temp_tol
         self.BODY_TEMP_TOLERANCE = body_temp_tol
         self.DISTANCE_TOLERANCE = distance_tol
+        self.__dict__.pop('_class_bounds', None)  # Rebuilt with the new tolerances on next use
 
         print(f"Updated tolerance factors:")
         print(f"  Stellar temperature: {stellar_temp_tol}")
@@ -2,27 +2,78 @@
 
 import numpy as np
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from sklearn.cluster import MiniBatchKMeans
+from threadpoolctl import threadpool_limits
+
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
 
 from .routing import nearest_neighbor_route, calculate_route_metrics
 from ..utils.file_utils import sanitize_filename, ensure_output_dir
 
+# Below this many systems Mini-Batch K-Means is fast enough that faiss is not worth using
+FAISS_MIN_SYSTEMS = 100000
+
+# Below this many systems the elbow sweep costs more than it is worth; k comes from the target size
+AUTO_K_MIN_SYSTEMS = 1000
+
+def _init_k_worker():
+    """Limit each k-sweep worker to one native thread so parallel fits don't oversubscribe cores."""
+    threadpool_limits(1)
+
+def _fit_inertia(sample_coords: np.ndarray, k: int, batch_size: int) -> float:
+    """Fit Mini-Batch K-Means for one candidate k and return its inertia."""
+    kmeans = MiniBatchKMeans(
+        n_clusters=k, 
+        batch_size=batch_size,
+        random_state=42,
+        n_init=3  # Reduced for speed
+    )
+    kmeans.fit(sample_coords)
+    return kmeans.inertia_
+
+def _elbow_index(k_values: np.ndarray, inertias: np.ndarray) -> int:
+    """Locate the elbow of a decreasing inertia curve with the kneedle method.
+    
+    Both axes are scaled to [0, 1]; the elbow is the point lying furthest
+    below the straight line joining the first and last points. Unlike the
+    discrete second derivative this does not amplify noise between
+    neighbouring k values.
+    
+    Returns:
+        Index of the elbow, or the middle index if the curve is flat
+    """
+    k_span = k_values[-1] - k_values[0]
+    inertia_span = inertias.max() - inertias.min()
+    if k_span <= 0 or inertia_span <= 0:
+        return len(k_values) // 2
+    
+    k_norm = (k_values - k_values[0]) / k_span
+    inertia_norm = (inertias - inertias.min()) / inertia_span
+    return int(np.argmax(1.0 - k_norm - inertia_norm))
+
 def find_optimal_k(
     coords: np.ndarray, 
     k_range: Optional[List[int]] = None, 
     sample_size: int = 50000, 
-    batch_size: int = 10000
+    batch_size: int = 10000,
+    workers: Optional[int] = None
 ) -> int:
-    """Find optimal number of clusters using elbow method.
+    """Find optimal number of clusters using elbow method (kneedle).
     
     Args:
         coords: System coordinates as numpy array (N, 3)
         k_range: Range of k values to test. If None, auto-determined
         sample_size: Maximum systems to sample for k optimization
         batch_size: Mini-batch size for K-means
+        workers: Worker processes fitting candidate k values in parallel.
+            If None, one per CPU
         
     Returns:
         Optimal number of clusters
@@ -41,7 +92,8 @@ def find_optimal_k(
     
     # Sample data for k optimization if dataset is large
     if n_systems > sample_size:
-        indices = np.random.choice(n_systems, sample_size, replace=False)
+        # Generator.choice draws without replacement in O(sample_size), not a full permutation
+        indices = np.random.default_rng(42).choice(n_systems, sample_size, replace=False, shuffle=False)
         sample_coords = coords[indices]
         print(f"Using {sample_size} sample points for k optimization")
     else:
@@ -50,40 +102,27 @@ def find_optimal_k(
     inertias = []
     k_values = []
     
-    for k in k_range:
-        print(f"  Testing k={k}...", end=' ')
-        try:
-            kmeans = MiniBatchKMeans(
-                n_clusters=k, 
-                batch_size=batch_size,
-                random_state=42,
-                n_init=3  # Reduced for speed
-            )
-            kmeans.fit(sample_coords)
-            inertia = kmeans.inertia_
-            inertias.append(inertia)
-            k_values.append(k)
-            print(f"inertia: {inertia:.1f}")
-        except Exception as e:
-            print(f"failed: {e}")
+    # Each candidate k is an independent fit on the same sample
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_k_worker) as executor:
+        futures = [executor.submit(_fit_inertia, sample_coords, k, batch_size) for k in k_range]
+        
+        for k, future in zip(k_range, futures):
+            print(f"  Testing k={k}...", end=' ')
+            try:
+                inertia = future.result()
+                inertias.append(inertia)
+                k_values.append(k)
+                print(f"inertia: {inertia:.1f}")
+            except Exception as e:
+                print(f"failed: {e}")
     
     if len(inertias) < 3:
         print("Insufficient k values tested, using default")
         return k_range[0] if len(k_range) > 0 else 100
     
-    # Find elbow using second derivative
-    inertias = np.array(inertias)
+    # Find elbow of the inertia curve
     k_values = np.array(k_values)
-    
-    # Calculate second derivative (curvature)
-    if len(inertias) >= 3:
-        second_deriv = np.diff(inertias, 2)
-        # Find point of maximum curvature (most negative second derivative)
-        elbow_idx = np.argmin(second_deriv) + 1  # +1 because diff reduces length
-        optimal_k = k_values[elbow_idx]
-    else:
-        # Fallback to middle value
-        optimal_k = k_values[len(k_values) // 2]
+    optimal_k = k_values[_elbow_index(k_values.astype(float), np.array(inertias, dtype=float))]
     
     print(f"Optimal k selected: {optimal_k}")
     return optimal_k
@@ -91,58 +130,95 @@ def find_optimal_k(
 def cluster_systems(
     df: pd.DataFrame, 
     k: Optional[int] = None, 
-    batch_size: int = 10000
+    batch_size: int = 10000,
+    target_cluster_size: int = 100,
+    auto_k: bool = False,
+    init_centers: Optional[np.ndarray] = None
 ) -> Tuple[np.ndarray, Dict]:
     """Cluster systems using Mini-Batch K-Means.
     
+    Datasets of FAISS_MIN_SYSTEMS or more are clustered with faiss K-means
+    instead when faiss is installed; clustering_info['kmeans_model'] is then
+    the faiss.Kmeans object.
+    
     Args:
         df: DataFrame with system data including coordinates
-        k: Number of clusters. If None, auto-determined
+        k: Number of clusters. If None, derived from target_cluster_size
         batch_size: Mini-batch size for K-means
+        target_cluster_size: Systems per cluster aimed for when k is None
+        auto_k: Find k with the elbow method sweep instead when k is None,
+            for datasets of at least AUTO_K_MIN_SYSTEMS systems
+        init_centers: Cluster centers from a previous run (k, 3) to warm-start
+            Mini-Batch K-Means from. Sets k to their number
         
     Returns:
         Tuple of (cluster_labels, clustering_info)
     """
-    # Prepare coordinates
-    coords = df[['coords_x', 'coords_y', 'coords_z']].values
+    # Prepare coordinates in the C order K-means works in, so it need not copy them
+    coords = np.ascontiguousarray(df[['coords_x', 'coords_y', 'coords_z']].to_numpy(), dtype=np.float64)
+    mins = coords.min(axis=0)
+    maxs = coords.max(axis=0)
     print(f"Coordinate ranges:")
-    print(f"  X: {coords[:, 0].min():.1f} to {coords[:, 0].max():.1f}")
-    print(f"  Y: {coords[:, 1].min():.1f} to {coords[:, 1].max():.1f}")  
-    print(f"  Z: {coords[:, 2].min():.1f} to {coords[:, 2].max():.1f}")
+    print(f"  X: {mins[0]:.1f} to {maxs[0]:.1f}")
+    print(f"  Y: {mins[1]:.1f} to {maxs[1]:.1f}")  
+    print(f"  Z: {mins[2]:.1f} to {maxs[2]:.1f}")
     
     # Determine optimal k if not provided
-    if k is None:
+    if init_centers is not None:
+        optimal_k = len(init_centers)
+        print(f"\nWarm-starting from {optimal_k} previous cluster centers")
+    elif k is None and auto_k and len(coords) >= AUTO_K_MIN_SYSTEMS:
         print(f"\nFinding optimal number of clusters...")
         optimal_k = find_optimal_k(coords, batch_size=batch_size)
+    elif k is None:
+        # Same 10-1000 cluster bounds as the elbow sweep, without fitting K-means per candidate
+        optimal_k = min(len(coords), max(10, min(1000, len(coords) // target_cluster_size)))
+        print(f"\nUsing k={optimal_k} for ~{target_cluster_size} systems per cluster")
     else:
         optimal_k = k
         print(f"\nUsing specified k: {optimal_k}")
     
-    # Perform Mini-Batch K-Means clustering
-    print(f"\nRunning Mini-Batch K-Means clustering...")
-    print(f"  k (clusters): {optimal_k}")
-    print(f"  batch_size: {batch_size}")
-    
-    kmeans = MiniBatchKMeans(
-        n_clusters=optimal_k,
-        batch_size=batch_size,
-        random_state=42,
-        n_init=10
-    )
-    
-    cluster_labels = kmeans.fit_predict(coords)
-    
-    # Analyze results
-    unique_labels = np.unique(cluster_labels)
-    n_clusters = len(unique_labels)
-    
-    # Analyze cluster sizes
-    cluster_sizes = []
-    for label in unique_labels:
-        size = list(cluster_labels).count(label)
-        cluster_sizes.append(size)
+    if HAS_FAISS and len(coords) >= FAISS_MIN_SYSTEMS and init_centers is None:
+        # faiss K-means with SIMD assignment, for large datasets when installed
+        print(f"\nRunning faiss K-means clustering...")
+        print(f"  k (clusters): {optimal_k}")
+        
+        coords32 = np.ascontiguousarray(coords, dtype=np.float32)
+        kmeans = faiss.Kmeans(coords32.shape[1], optimal_k, niter=20, seed=42)
+        kmeans.train(coords32)
+        _, nearest = kmeans.index.search(coords32, 1)
+        cluster_labels = nearest.ravel()
+        cluster_centers = kmeans.centroids.astype(np.float64)
+    else:
+        # Perform Mini-Batch K-Means clustering
+        print(f"\nRunning Mini-Batch K-Means clustering...")
+        print(f"  k (clusters): {optimal_k}")
+        print(f"  batch_size: {batch_size}")
+        
+        if init_centers is not None:
+            # Previous centers are already close, so a single initialization suffices
+            kmeans = MiniBatchKMeans(
+                n_clusters=optimal_k,
+                batch_size=batch_size,
+                random_state=42,
+                init=np.ascontiguousarray(init_centers, dtype=np.float64),
+                n_init=1
+            )
+        else:
+            kmeans = MiniBatchKMeans(
+                n_clusters=optimal_k,
+                batch_size=batch_size,
+                random_state=42,
+                n_init=10
+            )
+        
+        cluster_labels = kmeans.fit_predict(coords)
+        cluster_centers = kmeans.cluster_centers_
     
-    cluster_sizes = np.array(cluster_sizes)
+    # Analyze cluster sizes in one pass, excluding empty clusters
+    cluster_sizes = np.bincount(cluster_labels, minlength=optimal_k)
+    cluster_sizes = cluster_sizes[cluster_sizes > 0]
+    n_clusters = cluster_sizes.size
     
     clustering_info = {
         'n_clusters': n_clusters,
@@ -153,6 +229,7 @@ def cluster_systems(
             'mean': cluster_sizes.mean(),
             'median': np.median(cluster_sizes)
         },
+        'cluster_centers': cluster_centers,
         'kmeans_model': kmeans
     }
     
@@ -193,10 +270,9 @@ def process_cluster(cluster_data: pd.DataFrame, cluster_id: int, output_dir: Pat
         routed_systems.to_csv(output_file, sep='\t', index=False)
         
         # Calculate cluster center coordinates
-        coords = routed_systems[['coords_x', 'coords_y', 'coords_z']].values
-        center_x = round(coords[:, 0].mean(), 1)
-        center_y = round(coords[:, 1].mean(), 1)
-        center_z = round(coords[:, 2].mean(), 1)
+        center_x, center_y, center_z = (
+            round(value, 1) for value in routed_systems[['coords_x', 'coords_y', 'coords_z']].to_numpy().mean(axis=0)
+        )
         
         # Calculate distance from cluster center to galactic origin
         from ..utils.math_utils import distance_to_origin
@@ -225,16 +301,22 @@ def cluster_and_route_systems(
     output_dir: Path = Path("auto_clusters"),
     k: Optional[int] = None,
     batch_size: int = 10000,
-    workers: int = 4
+    workers: int = 4,
+    warm_start_centers: Optional[Path] = None
 ) -> Dict:
     """Complete clustering and routing pipeline.
     
+    The fitted cluster centers are saved to kmeans_centers.npy in output_dir,
+    so a later run on updated data can warm-start from them.
+    
     Args:
         input_file: Path to input TSV file with systems
         output_dir: Directory for output cluster files
         k: Number of clusters (auto-determined if None)
         batch_size: Mini-batch size for K-means
-        workers: Number of worker threads for processing
+        workers: Number of worker processes for routing clusters
+        warm_start_centers: kmeans_centers.npy from a previous run to start
+            clustering from; k is then taken from it
         
     Returns:
         Dictionary with clustering results and summary
@@ -244,45 +326,50 @@ def cluster_and_route_systems(
     print(f"Loaded {len(df)} systems")
     
     # Perform clustering
-    cluster_labels, clustering_info = cluster_systems(df, k=k, batch_size=batch_size)
+    init_centers = np.load(warm_start_centers) if warm_start_centers is not None else None
+    cluster_labels, clustering_info = cluster_systems(
+        df, k=k, batch_size=batch_size, init_centers=init_centers
+    )
     
     # Create output directory
     ensure_output_dir(output_dir)
+    centers_file = output_dir / "kmeans_centers.npy"
+    np.save(centers_file, clustering_info['cluster_centers'])
     
-    # Prepare clusters for processing
-    clusters_data = []
-    unique_labels = np.unique(cluster_labels)
-    for label in unique_labels:
-        cluster_mask = cluster_labels == label
-        cluster_df = df[cluster_mask].copy()
-        if len(cluster_df) > 0:
-            clusters_data.append(cluster_df)
+    # Group row positions by label with one stable sort; each group keeps input order
+    order = np.argsort(cluster_labels, kind='stable')
+    split_points = np.flatnonzero(np.diff(cluster_labels[order])) + 1
+    clusters_data = [df.iloc[rows] for rows in np.split(order, split_points) if len(rows) > 0]
     
     print(f"\nProcessing {len(clusters_data)} clusters with {workers} workers...")
     
-    # Process clusters in parallel
-    cluster_summaries = []
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = []
-        for i, cluster_data in enumerate(clusters_data):
-            future = executor.submit(process_cluster, cluster_data, i, output_dir)
-            futures.append(future)
+    # Process clusters in parallel; routing holds the GIL, so use processes rather than threads
+    # Results are reported as clusters finish but kept in cluster order for the summary
+    results = [None] * len(clusters_data)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        future_to_index = {
+            executor.submit(process_cluster, cluster_data, i, output_dir): i
+            for i, cluster_data in enumerate(clusters_data)
+        }
         
-        for i, future in enumerate(futures):
-            result = future.result()
+        for future in as_completed(future_to_index):
+            i = future_to_index[future]
+            result = results[i] = future.result()
             if 'error' not in result:
-                cluster_summaries.append(result)
                 print(f"  Cluster {i:3d}: {result['system_count']:3d} systems, "
                       f"{result['total_distance']:7.1f} LY total, "
                       f"{result['avg_distance_per_jump']:5.1f} LY/jump")
             else:
                 print(f"  {result['error']}")
     
+    cluster_summaries = [result for result in results if 'error' not in result]
+    
     # Create summary
     summary_results = {
         'clustering_info': clustering_info,
         'cluster_summaries': cluster_summaries,
-        'output_dir': output_dir
+        'output_dir': output_dir,
+        'centers_file': centers_file
     }
     
     if cluster_summaries:
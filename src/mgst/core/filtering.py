@@ -16,6 +16,7 @@ from dataclasses import dataclass
 from ..configs.base import BaseConfig
 from .spatial import SpatialRange, SectorIndex, SpatialPrefilter
 from ..data.compressed_reader import CompressedFileReader
+from ..utils.file_utils import json_loads
 
 try:
     from tqdm import tqdm
@@ -161,17 +162,41 @@ def write_result_to_file(result: Dict[str, Any], system_data: Dict[str, Any],
         pass
 
 
+# Configuration and spatial prefilter shared by every file a worker process handles
+_worker_config: Optional[BaseConfig] = None
+_worker_spatial_prefilter: Optional[SpatialPrefilter] = None
+
+
+def _init_worker(config: BaseConfig, spatial_prefilter: Optional[SpatialPrefilter]):
+    """Install the configuration once per worker process.
+    
+    The configuration is then unpickled once per worker instead of once per
+    file, and its caches stay warm across all files the worker processes.
+    """
+    global _worker_config, _worker_spatial_prefilter
+    _worker_config = config
+    _worker_spatial_prefilter = spatial_prefilter
+
+
 def process_jsonl_file(args: Tuple) -> Dict[str, Any]:
     """Process a single JSONL file with filtering.
     
     Args:
-        args: Tuple containing processing parameters
+        args: Tuple containing processing parameters. A config of None uses the
+            configuration and spatial prefilter installed by _init_worker.
         
     Returns:
         Dictionary with processing results
+        
+    Raises:
+        RuntimeError: If config is None outside a worker set up by _init_worker
     """
     (input_file, config, chunk_size, test_mode, max_test_systems, 
      output_path, output_format, write_directly, spatial_prefilter) = args
+    if config is None:
+        config, spatial_prefilter = _worker_config, _worker_spatial_prefilter
+        if config is None:
+            raise RuntimeError("process_jsonl_file needs a config or a worker initialized by _init_worker")
     
     try:
         total_processed = 0
@@ -179,9 +204,9 @@ def process_jsonl_file(args: Tuple) -> Dict[str, Any]:
         errors = []
         matched_systems = []
         
-        # Use compressed file reader for transparent gzip support
-        with CompressedFileReader(input_file, encoding='utf-8') as f:
-            buffer = ""
+        # Use compressed file reader for transparent gzip support; lines stay
+        # undecoded bytes, which the raw probe and the JSON parser both accept
+        with CompressedFileReader(input_file, buffer_size=chunk_size, binary=True) as f:
             systems_processed_this_file = 0
             
             # Get compression info for statistics
@@ -193,79 +218,50 @@ def process_jsonl_file(args: Tuple) -> Dict[str, Any]:
                     ratio = compression_info['compression_ratio']
                     print(f"  📦 Compressed file: {compressed_size_mb:.1f}MB → {original_size_mb:.1f}MB (ratio: {ratio:.2f})")
             
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-                    
-                buffer += chunk
-                lines = buffer.split('\n')
-                buffer = lines[-1]  # Keep incomplete line
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
                 
-                for line in lines[:-1]:
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    try:
-                        system_data = json.loads(line)
-                        total_processed += 1
-                        systems_processed_this_file += 1
-                        
-                        # Apply spatial pre-filtering if enabled
-                        if spatial_prefilter and not spatial_prefilter.should_process_system(system_data):
-                            continue
-                        
-                        # Apply filter
-                        filtered_result = config.filter_system(system_data)
-                        if filtered_result:
-                            matches_found += 1
-                            if write_directly and output_path:
-                                # Write directly to file with locking
-                                write_result_to_file(filtered_result, system_data, output_path, output_format, config)
-                            else:
-                                # Store result for batch writing
-                                filtered_result['_complete_system_record'] = system_data
-                                matched_systems.append(filtered_result)
-                        
-                        # Test mode limit
-                        if test_mode and systems_processed_this_file >= max_test_systems:
-                            break
-                            
-                    except json.JSONDecodeError as e:
-                        errors.append(f"JSON decode error in {input_file}: {e}")
-                        continue
-                    except Exception as e:
-                        errors.append(f"Filter error in {input_file} for system {system_data.get('name', 'Unknown')}: {e}")
-                        continue
-                
-                if test_mode and systems_processed_this_file >= max_test_systems:
-                    break
-            
-            # Process remaining buffer
-            if buffer.strip() and not (test_mode and systems_processed_this_file >= max_test_systems):
+                # Cheap raw-text rejection before paying for json parsing
+                if not config.may_match_raw(line):
+                    total_processed += 1
+                    systems_processed_this_file += 1
+                    if test_mode and systems_processed_this_file >= max_test_systems:
+                        break
+                    continue
+                    
                 try:
-                    system_data = json.loads(buffer.strip())
+                    system_data = json_loads(line)
                     total_processed += 1
+                    systems_processed_this_file += 1
                     
                     # Apply spatial pre-filtering if enabled
                     if spatial_prefilter and not spatial_prefilter.should_process_system(system_data):
-                        pass  # Skip this system
-                    else:
-                        filtered_result = config.filter_system(system_data)
-                        if filtered_result:
-                            matches_found += 1
-                            if write_directly and output_path:
-                                # Write directly to file with locking
-                                write_result_to_file(filtered_result, system_data, output_path, output_format, config)
-                            else:
-                                filtered_result['_complete_system_record'] = system_data
-                                matched_systems.append(filtered_result)
+                        continue
+                    
+                    # Apply filter
+                    filtered_result = config.filter_system(system_data)
+                    if filtered_result:
+                        matches_found += 1
+                        if write_directly and output_path:
+                            # Write directly to file with locking
+                            write_result_to_file(filtered_result, system_data, output_path, output_format, config)
+                        else:
+                            # Store result for batch writing
+                            filtered_result['_complete_system_record'] = system_data
+                            matched_systems.append(filtered_result)
+                    
+                    # Test mode limit
+                    if test_mode and systems_processed_this_file >= max_test_systems:
+                        break
                         
                 except json.JSONDecodeError as e:
-                    errors.append(f"JSON decode error in {input_file} (final): {e}")
+                    errors.append(f"JSON decode error in {input_file}: {e}")
+                    continue
                 except Exception as e:
-                    errors.append(f"Filter error in {input_file} (final): {e}")
+                    errors.append(f"Filter error in {input_file} for system {system_data.get('name', 'Unknown')}: {e}")
+                    continue
         
         # Force garbage collection
         gc.collect()
@@ -424,18 +420,20 @@ def filter_galaxy_data(
             with open(output_path, 'w', encoding='utf-8') as f:
                 pass
 
-    # Prepare worker arguments - enable streaming for non-test mode
+    # Prepare worker arguments - enable streaming for non-test mode. The config and
+    # spatial prefilter are sent to each worker once by _init_worker, not per file.
     write_directly = not test_mode
     worker_args = [
-        (input_file, config, chunk_size, test_mode, max_test_systems, 
-         str(output_path) if not test_mode else "", output_format, write_directly, spatial_prefilter)
+        (input_file, None, chunk_size, test_mode, max_test_systems, 
+         str(output_path) if not test_mode else "", output_format, write_directly, None)
         for input_file in input_files
     ]
     
     print(f"Processing with {workers} workers...")
     
     try:
-        with ProcessPoolExecutor(max_workers=workers) as executor:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(config, spatial_prefilter)) as executor:
             # Submit all tasks
             future_to_file = {
                 executor.submit(process_jsonl_file, arg): arg[0]
@@ -31,266 +31,335 @@ Pattern structure mirrors database exactly:
 }
 """
 
-from typing import Dict, Any, List, Optional, Set
-import re
+from typing import Dict, Any, Callable, List, Optional, Set
 
 
-class JSONPatternMatcher:
-    """Matches system data against JSON patterns that mirror database structure."""
+# Pattern keys that document a pattern rather than constrain it
+_METADATA_PREFIXES = ("comment", "description", "note", "_")
 
-    def __init__(self, pattern: Dict[str, Any]):
-        """Initialize matcher with a pattern.
+# A compiled check takes the value under test and the variable bindings of the
+# current match; it may add bindings but never changes or removes them
+Check = Callable[[Any, Dict[str, Any]], bool]
 
-        Args:
-            pattern: JSON pattern dict mirroring database structure
-        """
-        self.pattern = pattern
-        self.variables: Dict[str, Any] = {}
 
-    def reset(self):
-        """Reset variable bindings.
+def _match_any(data_value: Any, variables: Dict[str, Any]) -> bool:
+    """Wildcard check."""
+    return True
 
-        This is called between systems to ensure variable bindings
-        don't leak from one system to another.
-        """
-        self.variables = {}
 
-    def matches(self, system_data: Dict[str, Any]) -> bool:
-        """Check if system matches the pattern.
+def _match_null(data_value: Any, variables: Dict[str, Any]) -> bool:
+    """Null check: matches null or missing values."""
+    return data_value is None
 
-        Args:
-            system_data: System data from database
 
-        Returns:
-            True if system matches pattern
-        """
-        self.variables = {}  # Reset variable bindings
-        return self._match_dict(self.pattern, system_data)
+def _compile_value(pattern_value: Any) -> Check:
+    """Compile a single pattern value into a check.
 
-    def _match_value(self, pattern_value: Any, data_value: Any) -> bool:
-        """Match a single value against a pattern value.
+    Args:
+        pattern_value: Pattern value (can be literal, dict with min/max, list, *, $var)
 
-        Args:
-            pattern_value: Pattern value (can be literal, dict with min/max, list, *, $var)
-            data_value: Actual data value
+    Returns:
+        Check matching a data value against pattern_value
+    """
+    # Wildcard matches anything
+    if pattern_value == "*":
+        return _match_any
 
-        Returns:
-            True if value matches pattern
-        """
-        # Wildcard matches anything
-        if pattern_value == "*":
-            return True
+    # Null pattern matches null or missing
+    if pattern_value is None:
+        return _match_null
 
-        # Null pattern matches null or missing
-        if pattern_value is None:
-            return data_value is None
+    # Variable binding
+    if isinstance(pattern_value, str) and pattern_value.startswith("$"):
+        var_name = pattern_value
 
-        # Variable binding
-        if isinstance(pattern_value, str) and pattern_value.startswith("$"):
-            var_name = pattern_value
-            if var_name in self.variables:
+        def match_variable(data_value: Any, variables: Dict[str, Any]) -> bool:
+            if var_name in variables:
                 # Variable already bound - must match bound value
-                return self.variables[var_name] == data_value
-            else:
-                # Bind variable to this value
-                self.variables[var_name] = data_value
-                return True
+                return variables[var_name] == data_value
+            # Bind variable to this value
+            variables[var_name] = data_value
+            return True
+
+        return match_variable
 
-        # Range matching for numeric values
-        if isinstance(pattern_value, dict) and ("min" in pattern_value or "max" in pattern_value):
+    # Range matching for numeric values
+    if isinstance(pattern_value, dict) and ("min" in pattern_value or "max" in pattern_value):
+        min_val = pattern_value.get("min", float("-inf"))
+        max_val = pattern_value.get("max", float("inf"))
+
+        def match_range(data_value: Any, variables: Dict[str, Any]) -> bool:
             if data_value is None:
                 return False
-            min_val = pattern_value.get("min", float("-inf"))
-            max_val = pattern_value.get("max", float("inf"))
             return min_val <= data_value <= max_val
 
-        # List matching (OR semantics)
-        if isinstance(pattern_value, list):
-            return data_value in pattern_value
+        return match_range
 
-        # Dict matching (recursive)
-        if isinstance(pattern_value, dict):
-            if not isinstance(data_value, dict):
-                return False
-            return self._match_dict(pattern_value, data_value)
+    # List matching (OR semantics)
+    if isinstance(pattern_value, list):
+        options = pattern_value
+        try:
+            option_set = frozenset(options)
+        except TypeError:
+            # Unhashable options (e.g. nested dicts) can only be scanned
+            return lambda data_value, variables: data_value in options
 
-        # Exact match
-        return pattern_value == data_value
+        def match_option(data_value: Any, variables: Dict[str, Any]) -> bool:
+            try:
+                return data_value in option_set
+            except TypeError:
+                return data_value in options
 
-    def _match_dict(self, pattern_dict: Dict[str, Any], data_dict: Dict[str, Any]) -> bool:
-        """Match a dictionary against a pattern dictionary.
+        return match_option
 
-        Args:
-            pattern_dict: Pattern dictionary
-            data_dict: Data dictionary
+    # Dict matching (recursive)
+    if isinstance(pattern_value, dict):
+        match_fields = _compile_dict(pattern_value)
 
-        Returns:
-            True if all pattern keys match corresponding data
-        """
-        for key, pattern_value in pattern_dict.items():
-            # Skip documentation/metadata fields (any key starting with comment, description, note, etc.)
-            if key.startswith(("comment", "description", "note", "_")):
-                continue
+        def match_nested(data_value: Any, variables: Dict[str, Any]) -> bool:
+            if not isinstance(data_value, dict):
+                return False
+            return match_fields(data_value, variables)
 
-            # Special handling for bodies array
-            if key == "bodies" and isinstance(pattern_value, list):
-                if not self._match_bodies(pattern_value, data_dict.get("bodies", [])):
-                    return False
-                continue
+        return match_nested
 
-            # Get data value (missing keys treated as None)
-            data_value = data_dict.get(key)
+    # Exact match
+    return lambda data_value, variables: pattern_value == data_value
 
-            if not self._match_value(pattern_value, data_value):
-                return False
 
+def _compile_dict(pattern_dict: Dict[str, Any]) -> Check:
+    """Compile a pattern dictionary into a check over a data dictionary.
+
+    Every non-metadata pattern key must match the corresponding data value;
+    missing keys are treated as None and a ``bodies`` list is matched against
+    the system's bodies.
+    """
+    checks = []
+    for key, pattern_value in pattern_dict.items():
+        # Skip documentation/metadata fields
+        if key.startswith(_METADATA_PREFIXES):
+            continue
+
+        # Special handling for bodies array
+        if key == "bodies" and isinstance(pattern_value, list):
+            checks.append((key, _compile_bodies(pattern_value)))
+        else:
+            checks.append((key, _compile_value(pattern_value)))
+
+    def match_dict(data_dict: Dict[str, Any], variables: Dict[str, Any]) -> bool:
+        for key, check in checks:
+            if not check(data_dict.get(key), variables):
+                return False
         return True
 
-    def _match_bodies(self, pattern_bodies: List[Dict], data_bodies: List[Dict]) -> bool:
-        """Match body patterns against system bodies.
+    return match_dict
 
-        Each pattern in pattern_bodies must match at least one body in data_bodies.
-        Bodies can be matched by multiple patterns, but variable bindings create constraints.
 
-        Args:
-            pattern_bodies: List of body patterns to match
-            data_bodies: List of actual bodies in system
+def _compile_bodies(pattern_bodies: List[Dict[str, Any]]) -> Check:
+    """Compile body patterns into a check over a system's bodies.
 
-        Returns:
-            True if all body patterns can be satisfied
-        """
-        if not pattern_bodies:
+    Each pattern must match a distinct body. Bodies are assigned to patterns
+    with backtracking, so variable bindings can constrain the assignment.
+    """
+    body_checks = [_compile_body(pattern) for pattern in pattern_bodies]
+
+    def match_bodies(data_bodies: Optional[List[Dict[str, Any]]], variables: Dict[str, Any]) -> bool:
+        if not body_checks:
             return True
 
         if not data_bodies:
             return False
 
         # Try to find a valid assignment of bodies to patterns
-        return self._find_body_assignment(pattern_bodies, data_bodies, 0, set())
+        return _assign_bodies(body_checks, data_bodies, 0, set(), variables)
 
-    def _find_body_assignment(self, patterns: List[Dict], bodies: List[Dict],
-                             pattern_idx: int, used_bodies: Set[int]) -> bool:
-        """Recursively find valid assignment of bodies to patterns with backtracking.
+    return match_bodies
 
-        Args:
-            patterns: List of body patterns
-            bodies: List of actual bodies
-            pattern_idx: Current pattern index being matched
-            used_bodies: Set of body indices already assigned
 
-        Returns:
-            True if valid assignment exists for remaining patterns
-        """
-        # All patterns matched successfully
-        if pattern_idx >= len(patterns):
-            return True
+def _assign_bodies(body_checks: List[Check], bodies: List[Dict[str, Any]], pattern_idx: int,
+                   used_bodies: Set[int], variables: Dict[str, Any]) -> bool:
+    """Recursively find a valid assignment of bodies to body patterns.
 
-        pattern = patterns[pattern_idx]
+    Args:
+        body_checks: Compiled body patterns
+        bodies: List of actual bodies
+        pattern_idx: Current pattern index being matched
+        used_bodies: Set of body indices already assigned
+        variables: Variable bindings of the current match
 
-        # Try matching this pattern against each unused body
-        for body_idx, body in enumerate(bodies):
-            if body_idx in used_bodies:
-                continue
+    Returns:
+        True if valid assignment exists for remaining patterns
+    """
+    # All patterns matched successfully
+    if pattern_idx >= len(body_checks):
+        return True
 
-            # Save current variable state for backtracking
-            saved_vars = self.variables.copy()
+    check = body_checks[pattern_idx]
 
-            # Try to match this pattern against this body
-            if self._match_body_pattern(pattern, body):
-                # Mark body as used
-                used_bodies.add(body_idx)
+    # Try matching this pattern against each unused body
+    for body_idx, body in enumerate(bodies):
+        if body_idx in used_bodies:
+            continue
 
-                # Try to match remaining patterns
-                if self._find_body_assignment(patterns, bodies, pattern_idx + 1, used_bodies):
-                    return True
+        # Bindings are only ever added, so remembering the count is enough to backtrack
+        bound_count = len(variables)
 
-                # Backtrack
-                used_bodies.remove(body_idx)
+        if check(body, variables):
+            # Mark body as used
+            used_bodies.add(body_idx)
 
-            # Restore variable state
-            self.variables = saved_vars
+            # Try to match remaining patterns
+            if _assign_bodies(body_checks, bodies, pattern_idx + 1, used_bodies, variables):
+                return True
 
-        return False
+            # Backtrack
+            used_bodies.remove(body_idx)
 
-    def _match_body_pattern(self, pattern: Dict[str, Any], body: Dict[str, Any]) -> bool:
-        """Match a single body pattern against a body.
+        # Drop bindings made while trying this body
+        while len(variables) > bound_count:
+            variables.popitem()
 
-        Args:
-            pattern: Body pattern dict
-            body: Actual body data
+    return False
 
-        Returns:
-            True if body matches pattern
-        """
-        for key, pattern_value in pattern.items():
-            # Skip documentation/metadata fields
-            if key.startswith(("comment", "description", "note", "_")):
-                continue
 
-            body_value = body.get(key)
+def _compile_body(pattern: Dict[str, Any]) -> Check:
+    """Compile a single body pattern into a check over one body."""
+    checks = []
+    for key, pattern_value in pattern.items():
+        # Skip documentation/metadata fields
+        if key.startswith(_METADATA_PREFIXES):
+            continue
 
+        if key == "parents" and isinstance(pattern_value, list):
             # Special handling for parents array
-            if key == "parents" and isinstance(pattern_value, list):
-                if not self._match_parents(pattern_value, body.get("parents", [])):
-                    return False
-                continue
-
+            checks.append((key, _compile_parents(pattern_value)))
+        elif key == "rings" and pattern_value == []:
             # Special handling for rings (empty array means no rings)
-            if key == "rings" and pattern_value == []:
-                if body.get("rings"):
-                    return False
-                continue
+            checks.append((key, _match_no_rings))
+        else:
+            checks.append((key, _compile_value(pattern_value)))
 
-            if not self._match_value(pattern_value, body_value):
+    def match_body(body: Dict[str, Any], variables: Dict[str, Any]) -> bool:
+        for key, check in checks:
+            if not check(body.get(key), variables):
                 return False
-
         return True
 
-    def _match_parents(self, pattern_parents: List[Dict], data_parents: List[Dict]) -> bool:
-        """Match parent patterns against body parents.
+    return match_body
 
-        Args:
-            pattern_parents: Pattern parent list
-            data_parents: Actual parent list
 
-        Returns:
-            True if parents match pattern
-        """
-        # Each pattern parent must match at least one data parent
-        for pattern_parent in pattern_parents:
-            found_match = False
+def _match_no_rings(rings: Any, variables: Dict[str, Any]) -> bool:
+    """Check that a body has no rings."""
+    return not rings
+
+
+def _compile_parents(pattern_parents: List[Dict[str, Any]]) -> Check:
+    """Compile parent patterns; each must match at least one of the body's parents.
+
+    A parent entry matches when it has exactly the pattern's keys and every
+    value matches.
+    """
+    parent_checks = [
+        (frozenset(pattern_parent), [(key, _compile_value(value)) for key, value in pattern_parent.items()])
+        for pattern_parent in pattern_parents
+    ]
+
+    def match_parents(data_parents: Optional[List[Dict[str, Any]]], variables: Dict[str, Any]) -> bool:
+        if data_parents is None:
+            data_parents = []
+
+        for keys, checks in parent_checks:
             for data_parent in data_parents:
-                if self._match_parent_entry(pattern_parent, data_parent):
-                    found_match = True
+                # Pattern and data must have same keys
+                if keys != data_parent.keys():
+                    continue
+                if all(check(data_parent.get(key), variables) for key, check in checks):
                     break
-
-            if not found_match:
+            else:
                 return False
 
         return True
 
-    def _match_parent_entry(self, pattern_parent: Dict[str, Any],
-                           data_parent: Dict[str, Any]) -> bool:
-        """Match a single parent entry.
+    return match_parents
+
+
+class CompiledPattern:
+    """Immutable, compiled form of a JSON pattern.
+
+    Compiling resolves wildcards, ranges, lists and special keys once, so
+    matching only walks the data. Instances hold no per-match state and can be
+    shared freely; they pickle as their source pattern.
+    """
+
+    __slots__ = ('pattern', '_check')
+
+    def __init__(self, pattern: Dict[str, Any]):
+        self.pattern = pattern
+        self._check = _compile_dict(pattern)
+
+    def __reduce__(self):
+        return (CompiledPattern, (self.pattern,))
+
+
+def compile_pattern(pattern: Dict[str, Any]) -> CompiledPattern:
+    """Compile a JSON pattern for repeated matching.
+
+    Args:
+        pattern: JSON pattern dict mirroring database structure
+
+    Returns:
+        Compiled pattern
+    """
+    return CompiledPattern(pattern)
+
+
+def match_pattern(compiled: CompiledPattern, system_data: Dict[str, Any],
+                  variables: Optional[Dict[str, Any]] = None) -> bool:
+    """Check if a system matches a compiled pattern.
+
+    Args:
+        compiled: Compiled pattern
+        system_data: System data from database
+        variables: Optional dict that receives the variable bindings of the match
+
+    Returns:
+        True if system matches pattern
+    """
+    return compiled._check(system_data, {} if variables is None else variables)
+
+
+class JSONPatternMatcher:
+    """Matches system data against JSON patterns that mirror database structure."""
+
+    def __init__(self, pattern: Dict[str, Any]):
+        """Initialize matcher with a pattern.
 
         Args:
-            pattern_parent: Pattern parent dict (e.g., {"Planet": "$var"} or {"Null": 25})
-            data_parent: Actual parent dict
+            pattern: JSON pattern dict mirroring database structure
+        """
+        self.pattern = pattern
+        self.compiled = compile_pattern(pattern)
+        self.variables: Dict[str, Any] = {}
 
-        Returns:
-            True if parent entry matches
+    def reset(self):
+        """Reset variable bindings.
+
+        Matching no longer carries state between systems; this only clears
+        the bindings kept from the last match.
         """
-        # Pattern and data must have same keys
-        if set(pattern_parent.keys()) != set(data_parent.keys()):
-            return False
+        self.variables = {}
 
-        # Match each key-value pair
-        for key, pattern_value in pattern_parent.items():
-            data_value = data_parent.get(key)
-            if not self._match_value(pattern_value, data_value):
-                return False
+    def matches(self, system_data: Dict[str, Any]) -> bool:
+        """Check if system matches the pattern.
 
-        return True
+        Args:
+            system_data: System data from database
+
+        Returns:
+            True if system matches pattern
+        """
+        self.variables = {}  # Bindings of this match
+        return match_pattern(self.compiled, system_data, self.variables)
 
 
 def load_pattern_from_file(pattern_file: str) -> Dict[str, Any]:
@@ -317,5 +386,5 @@ def search_systems(pattern: Dict[str, Any], systems: List[Dict[str, Any]]) -> Li
     Returns:
         List of systems matching the pattern
     """
-    matcher = JSONPatternMatcher(pattern)
-    return [system for system in systems if matcher.matches(system)]
+    compiled = compile_pattern(pattern)
+    return [system for system in systems if match_pattern(compiled, system)]
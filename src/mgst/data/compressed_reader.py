@@ -6,7 +6,7 @@ Provides transparent gzip decompression while maintaining streaming capabilities
 import gzip
 import os
 from pathlib import Path
-from typing import TextIO, Union, Optional
+from typing import IO, Union, Optional
 import io
 
 
@@ -17,7 +17,8 @@ class CompressedFileReader:
     """
     
     def __init__(self, file_path: Union[str, Path], encoding: str = 'utf-8', 
-                 buffer_size: int = 64 * 1024 * 1024):  # 64MB buffer for better performance
+                 buffer_size: int = 64 * 1024 * 1024,  # 64MB buffer for better performance
+                 binary: bool = False):
         """
         Initialize compressed file reader.
         
@@ -25,11 +26,14 @@ class CompressedFileReader:
             file_path: Path to file (compressed or uncompressed)
             encoding: Text encoding (default: utf-8)
             buffer_size: Internal buffer size for decompression (default: 64MB)
+            binary: Return undecoded bytes instead of text, reading through a
+                buffer of buffer_size bytes (encoding is then unused)
         """
         self.file_path = Path(file_path)
         self.encoding = encoding
         self.buffer_size = buffer_size
-        self.file_handle: Optional[TextIO] = None
+        self.binary = binary
+        self.file_handle: Optional[IO] = None
         self.is_compressed = False
         self.original_size: Optional[int] = None
         self.compressed_size: Optional[int] = None
@@ -78,14 +82,19 @@ class CompressedFileReader:
         self.compressed_size = self.file_path.stat().st_size
         
         if self.is_compressed:
-            # Open gzip file with larger buffer for better performance
-            self.file_handle = gzip.open(
-                self.file_path, 
-                'rt', 
-                encoding=self.encoding,
-                compresslevel=6,  # Default compression level
-                newline=None      # Handle different line endings
-            )
+            if self.binary:
+                # Buffer the decompressed stream so lines are split from large blocks
+                self.file_handle = io.BufferedReader(gzip.open(self.file_path, 'rb'),
+                                                     buffer_size=self.buffer_size)
+            else:
+                # Open gzip file with larger buffer for better performance
+                self.file_handle = gzip.open(
+                    self.file_path, 
+                    'rt', 
+                    encoding=self.encoding,
+                    compresslevel=6,  # Default compression level
+                    newline=None      # Handle different line endings
+                )
             
             # Try to get original size from gzip header (last 4 bytes)
             try:
@@ -94,6 +103,10 @@ class CompressedFileReader:
                     self.original_size = int.from_bytes(f.read(4), byteorder='little')
             except (OSError, ValueError):
                 self.original_size = None
+        elif self.binary:
+            # Open regular file for undecoded reads
+            self.file_handle = open(self.file_path, 'rb', buffering=self.buffer_size)
+            self.original_size = self.compressed_size
         else:
             # Open regular file
             self.file_handle = open(self.file_path, 'r', encoding=self.encoding)
@@ -105,22 +118,22 @@ class CompressedFileReader:
             self.file_handle.close()
             self.file_handle = None
     
-    def read(self, size: int = -1) -> str:
+    def read(self, size: int = -1) -> Union[str, bytes]:
         """
         Read data from file with transparent decompression.
         
         Args:
-            size: Number of characters to read (-1 for all)
+            size: Number of characters (bytes in binary mode) to read (-1 for all)
             
         Returns:
-            Decompressed text data
+            Decompressed text data, or bytes in binary mode
         """
         if not self.file_handle:
             raise ValueError("File not open. Use 'with' statement or call open() first.")
         
         return self.file_handle.read(size)
     
-    def readline(self) -> str:
+    def readline(self) -> Union[str, bytes]:
         """Read a single line from the file."""
         if not self.file_handle:
             raise ValueError("File not open. Use 'with' statement or call open() first.")
@@ -1,8 +1,19 @@
 """File handling utilities."""
 
+import functools
+import json
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# JSON text parser, orjson when installed; its decode error subclasses json.JSONDecodeError
+json_loads = orjson.loads if HAS_ORJSON else json.loads
 
 def sanitize_filename(name: str, max_length: int = 50) -> str:
     """Sanitize system name for use in filename.
@@ -45,4 +56,25 @@ def get_file_stem_with_prefix(filepath: Path, prefix: str) -> str:
     Returns:
         New filename with prefix
     """
-    return f"{prefix}_{filepath.stem}"
\ No newline at end of file
+    return f"{prefix}_{filepath.stem}"
+
+@functools.lru_cache(maxsize=None)
+def _parse_json_file(path: str, mtime_ns: int) -> Any:
+    """Parse a JSON file once per (path, mtime) per process."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return json_loads(data)
+
+def load_json_file(path: Path) -> Any:
+    """Load a JSON data file, reusing the parsed result until the file changes.
+    
+    Uses orjson when it is installed. The returned object is shared between
+    callers and must be treated as read-only.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    return _parse_json_file(str(path), Path(path).stat().st_mtime_ns)
@@ -0,0 +1 @@
+# Configuration tests
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Tests for dynamic configuration loading."""
+
+import pickle
+
+import pytest
+
+from mgst.configs.config_loader import ConfigurationLoader, LegacyConfigWrapper
+
+
+LEGACY_CONFIG = '''"""Legacy test configuration."""
+
+EXECUTIONS = []
+EXECUTIONS.append(1)
+
+OUTPUT_COLUMNS = [('system_name', None), ('executions', None)]
+
+
+def filter_system(system_data):
+    return {'system_name': system_data['name'], 'executions': len(EXECUTIONS)}
+'''
+
+
+@pytest.fixture
+def legacy_config_file(temp_dir):
+    """Write a legacy filter_system style configuration file."""
+    file_path = temp_dir / "legacy_config.py"
+    file_path.write_text(LEGACY_CONFIG)
+    return file_path
+
+
+class TestLegacyConfigWrapper:
+    """Test legacy configuration wrapping."""
+
+    def test_load_legacy_config(self, legacy_config_file):
+        """Test that filter_system modules are wrapped."""
+        config = ConfigurationLoader().load_config_from_file(legacy_config_file)
+
+        assert isinstance(config, LegacyConfigWrapper)
+        assert config.get_output_columns() == ['system_name', 'executions']
+        assert config.filter_system({'name': 'Sol'})['system_name'] == 'Sol'
+
+    def test_pickle_round_trip_reuses_module(self, legacy_config_file):
+        """Test that unpickled wrappers do not re-execute the user module."""
+        config = ConfigurationLoader().load_config_from_file(legacy_config_file)
+        first = config.filter_system({'name': 'Sol'})
+
+        restored = pickle.loads(pickle.dumps(config))
+        second = restored.filter_system({'name': 'Sol'})
+
+        assert first['executions'] == second['executions'] == 1
+
+
+class TestConfigClassConvention:
+    """Test explicit __config_class__ declarations."""
+
+    def test_imported_config_class(self, temp_dir):
+        """Test that __config_class__ may point at an imported class."""
+        file_path = temp_dir / "explicit_config.py"
+        file_path.write_text(
+            "from mgst.configs.faction_search import FactionSearchConfig\n"
+            "__config_class__ = FactionSearchConfig\n"
+        )
+
+        config = ConfigurationLoader().load_config_from_file(file_path)
+
+        assert config.name == 'faction-search'
+
+    def test_invalid_config_class(self, temp_dir):
+        """Test that non-BaseConfig declarations are rejected."""
+        file_path = temp_dir / "invalid_config.py"
+        file_path.write_text("__config_class__ = dict\n")
+
+        with pytest.raises(ValueError, match="__config_class__"):
+            ConfigurationLoader().load_config_from_file(file_path)
+
+
+class TestBuiltinConfigs:
+    """Test built-in configuration registration."""
+
+    def test_load_builtin_by_name(self):
+        """Test that lazily registered built-ins resolve to their classes."""
+        from mgst.configs.faction_search import FactionSearchConfig
+
+        config = ConfigurationLoader().load_config_by_name('faction-search')
+
+        assert type(config) is FactionSearchConfig
+
+    def test_unknown_config_name(self):
+        """Test that unknown names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown configuration"):
+            ConfigurationLoader().load_config_by_name('no-such-config')
+
+
+class TestSharedLoader:
+    """Test the shared configuration loader accessors."""
+
+    def test_get_config_loader_is_shared(self):
+        """Test that the shared loader is created once and aliased."""
+        from mgst.configs import config_loader as loader_module
+
+        loader = loader_module.get_config_loader()
+
+        assert loader is loader_module.get_config_loader()
+        assert loader_module.config_loader is loader
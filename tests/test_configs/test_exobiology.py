@@ -0,0 +1,98 @@
+"""Tests for the co-occurrence exobiology configuration."""
+
+import copy
+
+import pytest
+
+from mgst.configs.exobiology import ExobiologyConfig
+
+
+def make_system(bodies):
+    """Build a minimal system record around a list of bodies."""
+    return {
+        'name': 'Test System',
+        'coords': {'x': 1.0, 'y': 2.0, 'z': 3.0},
+        'bodies': bodies
+    }
+
+
+def make_body(body, name, species):
+    """Copy a template body with a new name and predicted species list."""
+    new_body = copy.deepcopy(body)
+    new_body['bodyName'] = name
+    new_body['bioscan_predictions']['predicted_species'] = species
+    return new_body
+
+
+@pytest.fixture
+def high_value_species():
+    """Four high-value species across three genera."""
+    return [
+        {'genus': 'Stratum', 'species': 'Tectonicas', 'name': 'Stratum Tectonicas', 'value': 19010800},
+        {'genus': 'Fonticulua', 'species': 'Fluctus', 'name': 'Fonticulua Fluctus', 'value': 20000900},
+        {'genus': 'Concha', 'species': 'Biconcavis', 'name': 'Concha Biconcavis', 'value': 16777100},
+        {'genus': 'Bacterium', 'species': 'Informem', 'name': 'Bacterium Informem', 'value': 8418000},
+    ]
+
+
+class TestExobiologyConfig:
+    """Test exobiology system filtering."""
+
+    def test_three_qualifying_bodies(self, sample_exobiology_body, high_value_species):
+        """Test that three qualifying bodies pass the original rule."""
+        config = ExobiologyConfig()
+        bodies = [
+            make_body(sample_exobiology_body, f'Body {i}', high_value_species)
+            for i in range(3)
+        ]
+
+        result = config.filter_system(make_system(bodies))
+
+        assert result is not None
+        assert result['qualifying_bodies'] == 3
+        assert result['qualification_type'] == '3+ bodies (original)'
+        assert result['genera_list'] == 'Concha, Fonticulua, Stratum'
+        assert result['body_1_genera'] == 'Concha, Fonticulua, Stratum'
+        assert result['body_1_species_count'] == 3
+        assert result['coords_x'] == 1.0
+
+    def test_two_bodies_with_cooccurrence(self, sample_exobiology_body, high_value_species):
+        """Test the two-body expansion rule with a co-occurrence body."""
+        config = ExobiologyConfig()
+        moderate = high_value_species + [
+            {'genus': 'Tussock', 'species': 'Virgam', 'name': 'Tussock Virgam', 'value': 14313700}
+        ]
+        bodies = [
+            make_body(sample_exobiology_body, 'Body A', high_value_species),
+            make_body(sample_exobiology_body, 'Body B', moderate),
+        ]
+
+        result = config.filter_system(make_system(bodies))
+
+        assert result is not None
+        assert result['qualifying_bodies'] == 2
+        assert result['cooccurrence_bodies'] == 1
+        assert result['body_2_cooccurrence'] == 'Yes'
+        assert result['body_3_name'] == ''
+        assert set(config.get_output_columns()) <= set(result)
+
+    def test_competing_bacterium_needs_three_genera(self, sample_exobiology_body):
+        """Test that competing bacterium bodies require three genera."""
+        config = ExobiologyConfig()
+        bodies = [make_body(sample_exobiology_body, f'Body {i}',
+                            sample_exobiology_body['bioscan_predictions']['predicted_species'])
+                  for i in range(3)]
+
+        assert config.has_competing_bacterium(bodies[0])
+        assert config.filter_system(make_system(bodies)) is None
+
+    def test_recent_bodies_excluded(self, sample_exobiology_body, high_value_species):
+        """Test that bodies updated after the threshold are skipped."""
+        config = ExobiologyConfig()
+        bodies = [
+            make_body(sample_exobiology_body, f'Body {i}', high_value_species)
+            for i in range(3)
+        ]
+        bodies[0]['updateTime'] = '2022-01-01 00:00:00+00:00'
+
+        assert config.filter_system(make_system(bodies)) is None
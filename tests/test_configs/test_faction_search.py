@@ -0,0 +1,71 @@
+"""Tests for the faction search configuration."""
+
+import json
+
+import pytest
+
+from mgst.configs.faction_search import FactionSearchConfig
+from mgst.core.filtering import process_jsonl_file
+
+
+@pytest.fixture
+def faction_systems():
+    """Systems with and without the target faction."""
+    return [
+        {
+            'name': 'Mikunn',
+            'coords': {'x': 1.0, 'y': 2.0, 'z': 3.0},
+            'controllingFaction': {'name': 'The Dukes of Mikunn', 'allegiance': 'Independent'},
+            'factions': [{'name': 'The Dukes of Mikunn', 'influence': 0.6}],
+        },
+        {
+            'name': 'Shinrarta Dezhra',
+            'coords': {'x': 55.7, 'y': 17.6, 'z': 27.2},
+            'controllingFaction': {'name': 'The Pilots Federation'},
+            'factions': [
+                {'name': 'Pilots Federation Local Branch', 'influence': 0.9},
+                {'name': 'The Dukes of Mikunn', 'influence': 0.1, 'state': 'Boom'},
+            ],
+        },
+        {
+            'name': 'Sol',
+            'coords': {'x': 0.0, 'y': 0.0, 'z': 0.0},
+            'controllingFaction': {'name': 'Mother Gaia'},
+            'factions': [{'name': 'Sol Workers\' Party', 'influence': 0.2}],
+        },
+    ]
+
+
+class TestFactionSearchConfig:
+    """Test faction search filtering."""
+
+    def test_raw_probe(self, faction_systems):
+        """Test the raw-line probe for str and bytes input."""
+        config = FactionSearchConfig()
+        lines = [json.dumps(system) for system in faction_systems]
+
+        assert [config.may_match_raw(line) for line in lines] == [True, True, False]
+        assert config.may_match_raw(lines[0].encode('utf-8'))
+        assert not config.may_match_raw(lines[2].encode('utf-8'))
+
+    def test_raw_probe_disabled_for_escaped_names(self):
+        """Test that names JSON may escape never get rejected raw."""
+        config = FactionSearchConfig(target_faction='Café "Society"')
+
+        assert config.may_match_raw('{"name": "Anything"}')
+
+    def test_process_jsonl_file(self, faction_systems, temp_dir):
+        """Test that raw rejection keeps counts and matches consistent."""
+        input_file = temp_dir / "systems.jsonl"
+        input_file.write_text('\n'.join(json.dumps(s) for s in faction_systems) + '\n')
+        config = FactionSearchConfig(output_format='tsv')
+
+        result = process_jsonl_file(
+            (input_file, config, 1024, False, 1000, "", 'tsv', False, None)
+        )
+
+        assert result['errors'] == []
+        assert result['total_processed'] == 3
+        assert result['matches_found'] == 2
+        influences = [m['faction_influence'] for m in result['matched_systems']]
+        assert influences == [1.0, 0.1]
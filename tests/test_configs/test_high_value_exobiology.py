@@ -0,0 +1,256 @@
+"""Tests for the high-value rule-based exobiology configuration."""
+
+import itertools
+
+import pytest
+
+from mgst.configs.high_value_exobiology import BodyInfo, HighValueExobiologyConfig, _load_ruleset_catalogs
+
+
+SPECIES_RULESETS = {
+    'Stratum Tectonicas': {
+        'genus': '$Codex_Ent_Stratum_Genus_Name;',
+        'value': 19010800,
+        'rulesets': [{
+            'atmosphere': ['CarbonDioxide', 'SulphurDioxide'],
+            'body_type': 'High metal content body',
+            'min_gravity': 0.045, 'max_gravity': 0.38,
+            'min_temperature': 165,
+        }],
+    },
+    'Concha Biconcavis': {
+        'genus': '$Codex_Ent_Conchas_Genus_Name;',
+        'value': 16777100,
+        'rulesets': [{
+            'atmosphere': 'Nitrogen',
+            'body_type': ['Rocky body', 'High metal content body'],
+            'max_gravity': 0.276,
+            'min_temperature': 42, 'max_temperature': 52,
+            'volcanism': 'None',
+        }],
+    },
+    'Bacterium Aurasus': {
+        'genus': '$Codex_Ent_Bacterial_Genus_Name;',
+        'value': 1000000,
+        'rulesets': [{
+            'atmosphere': 'CarbonDioxide',
+            'body_type': ['Rocky body', 'High metal content body', 'Rocky ice body'],
+            'min_gravity': 0.039, 'max_gravity': 0.608,
+            'min_temperature': 145, 'max_temperature': 400,
+        }],
+    },
+    'Fumerola Carbosis': {
+        'genus': '$Codex_Ent_Fumerolas_Genus_Name;',
+        'value': 6284600,
+        'rulesets': [
+            {'atmosphere': 'CarbonDioxide', 'max_gravity': 0.276, 'volcanism': ['carbon', 'methane']},
+            {'atmosphere': 'Argon', 'min_pressure': 0.01, 'volcanism': 'water'},
+        ],
+    },
+    'Osseus Discus': {
+        'genus': '$Codex_Ent_Osseus_Genus_Name;',
+        'value': 12934900,
+        'rulesets': [
+            {'body_type': 'Rocky body', 'min_gravity': 0.04, 'max_gravity': 0.2, 'volcanism': 'Any'},
+            {'atmosphere': 'Water', 'max_pressure': 0.05},
+        ],
+    },
+}
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """High-value config loaded from the in-memory test catalog."""
+    monkeypatch.setattr(HighValueExobiologyConfig, '_load_all_rulesets',
+                        lambda self: SPECIES_RULESETS)
+    return HighValueExobiologyConfig()
+
+
+def make_body(name, **overrides):
+    """Build a body dict with sensible exobiology defaults."""
+    body = {
+        'bodyName': name,
+        'atmosphereType': 'CarbonDioxide',
+        'subType': 'High metal content body',
+        'gravity': 0.1,
+        'surfaceTemperature': 180.0,
+        'surfacePressure': 0.02,
+        'volcanism': '',
+        'updateTime': '2021-05-18 22:11:16',
+    }
+    body.update(overrides)
+    return body
+
+
+class TestRulesetLoading:
+    """Test loading species catalogs from ruleset files."""
+
+    def test_catalogs_loaded_once_per_file_version(self, temp_dir):
+        """Test that ruleset files are executed once until they change."""
+        ruleset_file = temp_dir / 'osseus.py'
+        ruleset_file.write_text(
+            "catalog = {'$Codex_Ent_Osseus_Genus_Name;': {'discus': "
+            "{'name': 'Osseus Discus', 'value': 12934900, 'rulesets': [{'body_type': 'Rocky body'}]}}}\n"
+        )
+        ruleset_files = ((str(ruleset_file), ruleset_file.stat().st_mtime_ns),)
+
+        species_data = _load_ruleset_catalogs(ruleset_files)
+
+        assert species_data == {'Osseus Discus': {
+            'genus': '$Codex_Ent_Osseus_Genus_Name;',
+            'value': 12934900,
+            'rulesets': [{'body_type': 'Rocky body'}],
+        }}
+        assert _load_ruleset_catalogs(ruleset_files) is species_data
+
+
+class TestSpeciesDetection:
+    """Test ruleset-based species detection."""
+
+    def test_detect_species_on_body(self, config):
+        """Test that every species with a matching ruleset is detected."""
+        body = make_body('A 1', volcanism='Minor Carbon Dioxide Geysers volcanism')
+
+        detected = config.detect_species_on_body(body)
+
+        assert [s['name'] for s in detected] == [
+            'Stratum Tectonicas', 'Bacterium Aurasus', 'Fumerola Carbosis'
+        ]
+        assert detected[0] == {
+            'name': 'Stratum Tectonicas',
+            'genus': '$Codex_Ent_Stratum_Genus_Name;',
+            'value': 19010800,
+        }
+
+    def test_detection_matches_scalar_rulesets(self, config):
+        """Test that vectorized detection agrees with _check_ruleset_match."""
+        atmospheres = ['CarbonDioxide', 'Nitrogen', 'Argon', 'Water', '', None]
+        body_types = ['Rocky body', 'High metal content body', 'Icy body']
+        gravities = [0.039, 0.045, 0.2, 0.276, 0.5]
+        temperatures = [45.0, 145.0, 170.0, 400.0]
+        volcanisms = ['', 'No volcanism', 'Major Water Geysers volcanism', 'Carbon Dioxide Geysers']
+
+        for atm, body_type, gravity, temp, volcanism in itertools.product(
+                atmospheres, body_types, gravities, temperatures, volcanisms):
+            body = make_body('B 1', atmosphereType=atm, subType=body_type, gravity=gravity,
+                             surfaceTemperature=temp, volcanism=volcanism)
+            expected = [
+                name for name, info in SPECIES_RULESETS.items()
+                if any(config._check_ruleset_match(body, rs) for rs in info['rulesets'])
+            ]
+            assert [s['name'] for s in config.detect_species_on_body(body)] == expected
+
+    def test_detection_cache_respects_bounds(self, config):
+        """Test that cached results are reused only when every bound check agrees."""
+        volcanism = 'Carbon Dioxide Geysers volcanism'
+        inside = config.detect_species_on_body(make_body('C 1', gravity=0.1, volcanism=volcanism))
+        same_cell = config.detect_species_on_body(make_body('C 2', gravity=0.15, volcanism=volcanism))
+        past_bound = config.detect_species_on_body(make_body('C 3', gravity=0.2761, volcanism=volcanism))
+
+        assert same_cell == inside
+        assert same_cell is not inside
+        assert 'Fumerola Carbosis' in [s['name'] for s in inside]
+        assert 'Fumerola Carbosis' not in [s['name'] for s in past_bound]
+
+        # Each hit hands back a new list, so callers may modify it freely
+        same_cell.clear()
+        assert config.detect_species_on_body(make_body('C 4', gravity=0.12, volcanism=volcanism)) == inside
+
+
+class TestGenusTiers:
+    """Test genus minimum-value tiers."""
+
+    def test_tier_counts_match_categories(self, config):
+        """Test that tier counts agree with the categorized genus lists."""
+        genus_min_values = {'a': 19010800, 'b': 15000000, 'c': 12934900, 'd': 6284600, 'e': 1000000, 'f': 500}
+
+        categories = config.categorize_genera_by_min_value(genus_min_values)
+
+        assert config._count_genus_tiers(genus_min_values) == (
+            len(categories['extremely_high_min']), len(categories['high_min']),
+            len(categories['moderate_min']), len(categories['low_min']),
+        ) == (2, 1, 1, 1)
+
+
+class TestSystemFiltering:
+    """Test system-level high-value criteria."""
+
+    def test_three_high_value_bodies(self, config):
+        """Test that three bodies with a 10M+ genus qualify the system."""
+        system = {
+            'name': 'Test System',
+            'coords': {'x': 1.04, 'y': -2.06, 'z': 3.0},
+            'bodies': [make_body(f'Test System {i}') for i in range(3)],
+        }
+
+        result = config.filter_system(system)
+
+        assert result is not None
+        assert result['qualifying_bodies'] == 3
+        assert result['coords_x'] == 1.0
+        assert result['body_1_high_or_extremely_high_genera'] == 1
+        assert result['body_1_top_genera'] == '$Codex_Ent_Stratum_Genus_Name;(19M), $Codex_Ent_Bacterial_Genus_Name;(1M)'
+        assert result['body_1_min_guaranteed_value'] == 1000000
+
+    def test_too_few_bodies(self, config, monkeypatch):
+        """Test that a single body is rejected without running species detection."""
+        system = {'name': 'Lonely', 'coords': {}, 'bodies': [make_body('Lonely 1')]}
+        monkeypatch.setattr(config, 'detect_species_on_body', lambda body: pytest.fail('body was examined'))
+
+        assert config.filter_system(system) is None
+
+    def test_two_bodies_with_moderate_genus(self, config):
+        """Test that two bodies with a high and a moderate genus qualify the system."""
+        volcanism = 'Minor Carbon Dioxide Geysers volcanism'
+        system = {
+            'name': 'Pair',
+            'coords': {},
+            'bodies': [make_body(f'Pair {i}', volcanism=volcanism) for i in range(2)],
+        }
+
+        result = config.filter_system(system)
+
+        assert result is not None
+        assert result['qualifying_bodies'] == 2
+        assert result['body_2_moderate_min_genera'] == 1
+
+    def test_system_criteria_stop_at_first_qualifying_body(self, config):
+        """Test that bodies after the deciding one are never inspected."""
+        def body_info(name, genus_min_values):
+            return BodyInfo(
+                body_name=name, detected_species=[], genus_min_values=genus_min_values,
+                genus_count=len(genus_min_values), species_count=0, total_value=0, has_bacterium=False,
+                atmosphere_type='', surface_pressure=0, surface_temperature=0, gravity=0, body_type='',
+                genus_tiers=None,
+            )
+        bodies = [
+            body_info('A', {'stratum': 19010800, 'fumerola': 6284600}),
+            body_info('B', {'bacterium': 1000000}),
+            body_info('C', {'osseus': 12934900, 'fumerola': 6284600}),
+            body_info('D', {'osseus': 12934900}),
+        ]
+
+        assert config.meets_system_criteria(bodies)
+        assert bodies[2].genus_tiers == (0, 1, 1, 0)
+        assert bodies[3].genus_tiers is None
+        assert not config.meets_system_criteria(bodies[:2])
+
+
+class TestDateFilter:
+    """Test the updateTime cutoff."""
+
+    @pytest.mark.parametrize('update_time, expected', [
+        ('2021-05-18 22:11:16', True),
+        ('2021-11-29 00:00:00+00:00', True),
+        ('2021-11-29T00:00:01Z', False),
+        ('2022-01-01 00:00:00+00:00', False),
+        ('2021-11-29 01:30:00+02:00', True),
+        ('2021-11-28 23:59:59.500000', True),
+        ('not a date', True),
+        (None, True),
+    ])
+    def test_passes_date_filter(self, config, update_time, expected):
+        """Test that bodies updated after the threshold are rejected, comparing in UTC."""
+        body = make_body('D 1', updateTime=update_time)
+
+        assert config.passes_date_filter(body, config.date_threshold) is expected
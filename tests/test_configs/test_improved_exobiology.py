@@ -0,0 +1,97 @@
+"""Tests for the improved empirical-range exobiology configuration."""
+
+import pytest
+
+from mgst.configs.high_value_exobiology import HighValueExobiologyConfig
+from mgst.configs.improved_exobiology import ImprovedExobiologyConfig
+
+
+SPECIES_RANGES = {
+    'Stratum Tectonicas': {
+        'stellar_class_ranges': {
+            'K': {
+                'thermal_regulation_quality': 'excellent',
+                'stellar_temp_range': [4000, 5000],
+                'body_temp_range': [160, 200],
+                'distance_range': [100, 2000],
+            },
+            'M': {
+                'thermal_regulation_quality': 'poor',
+                'body_temp_range': [300, 100],  # Inverted range, ignored
+            },
+        },
+    },
+}
+
+
+@pytest.fixture
+def config(monkeypatch):
+    monkeypatch.setattr(ImprovedExobiologyConfig, '_load_all_rulesets', lambda self: {})
+    monkeypatch.setattr(ImprovedExobiologyConfig, '_load_species_ranges', lambda self: SPECIES_RANGES)
+    return ImprovedExobiologyConfig()
+
+
+def _system(spectral_class, temperature):
+    return {'stars': [{'mainStar': True, 'spectralClass': spectral_class, 'surfaceTemperature': temperature}]}
+
+
+class TestLazyLoading:
+    """Test that range data is loaded on first use."""
+
+    def test_construction_does_not_load_ranges(self, monkeypatch):
+        """Test that building a config and listing its columns leaves ranges unloaded."""
+        loads = []
+        monkeypatch.setattr(ImprovedExobiologyConfig, '_load_all_rulesets', lambda self: {})
+        monkeypatch.setattr(ImprovedExobiologyConfig, '_load_species_ranges',
+                            lambda self: loads.append(1) or SPECIES_RANGES)
+
+        config = ImprovedExobiologyConfig()
+        config.get_output_columns()
+        assert loads == []
+
+        assert config._class_ranges('Stratum Tectonicas', 'K') is not None
+        assert config.species_ranges is SPECIES_RANGES
+        assert loads == [1]
+
+
+class TestRangeValidation:
+    """Test validation against precomputed per-class ranges."""
+
+    def test_ranges_fold_in_tolerance(self, config):
+        """Test that stored bounds include the quality-adjusted tolerance."""
+        ranges = config._class_ranges('Stratum Tectonicas', 'K')
+        assert (ranges.stellar_lo, ranges.stellar_hi) == (3750.0, 5250.0)
+        assert (ranges.body_lo, ranges.body_hi) == (140.0, 220.0)
+        assert (ranges.distance_lo, ranges.distance_hi) == (100, 2950.0)
+
+    def test_missing_data(self, config):
+        """Test unknown species pass and unseen stellar classes fail."""
+        assert config._is_species_valid({}, 'Osseus Discus', 'G', 5800)
+        assert not config._is_species_valid({}, 'Stratum Tectonicas', 'G', 5800)
+        assert config._is_species_valid({'surfaceTemperature': 1000}, 'Stratum Tectonicas', 'M', 3000)
+
+    def test_detection_validates_primary_star(self, config, monkeypatch):
+        """Test that detected species are checked against the system's primary star."""
+        species = [{'name': 'Stratum Tectonicas'}, {'name': 'Osseus Discus'}]
+        monkeypatch.setattr(HighValueExobiologyConfig, 'detect_species_on_body', lambda self, body: species)
+
+        def detected(body, system):
+            return [s['name'] for s in config.detect_species_on_body(body, system)]
+
+        body = {'surfaceTemperature': 180, 'distanceToArrival': 500}
+        assert detected(body, _system('K1', 4500)) == ['Stratum Tectonicas', 'Osseus Discus']
+        assert detected(body, _system('K1', 6000)) == ['Osseus Discus']
+
+        body = {'surfaceTemperature': 180, 'distanceToArrival': 5000}
+        assert detected(body, _system('K1', 4500)) == ['Osseus Discus']
+        body['distanceToArrival'] = 0
+        assert detected(body, _system('K1', 4500)) == ['Stratum Tectonicas', 'Osseus Discus']
+
+    def test_tolerance_change_resets_ranges(self, config, capsys):
+        """Test that new tolerance factors are applied to cached ranges."""
+        body = {'surfaceTemperature': 225}
+        assert not config._is_species_valid(body, 'Stratum Tectonicas', 'K', 4500)
+
+        config.set_tolerance_factors(stellar_temp_tol=1.5, body_temp_tol=3.0, distance_tol=2.0)
+
+        assert config._is_species_valid(body, 'Stratum Tectonicas', 'K', 4500)
@@ -0,0 +1,87 @@
+"""Tests for the JSON pattern configuration."""
+
+import json
+
+import numpy as np
+import pytest
+
+from mgst.configs.json_pattern import JSONPatternConfig
+
+
+CORRIDOR = {'start_coords': (0.0, 0.0, 0.0), 'end_coords': (100.0, 0.0, 0.0), 'radius': 10.0}
+
+
+def make_system(name, x, y=0.0, z=0.0, sub_type='Water world'):
+    return {
+        'name': name,
+        'id64': hash(name) & 0xFFFF,
+        'coords': {'x': x, 'y': y, 'z': z},
+        'bodies': [{'subType': sub_type}],
+    }
+
+
+@pytest.fixture
+def pattern_file(temp_dir):
+    path = temp_dir / 'water_worlds.json'
+    path.write_text(json.dumps({'bodies': [{'subType': 'Water world'}]}))
+    return path
+
+
+class TestCorridorFiltering:
+    """Test corridor distance filtering."""
+
+    def test_corridor_distances_match_scalar(self, pattern_file):
+        """Test that vectorized distances agree with the scalar calculation."""
+        config = JSONPatternConfig(pattern_file, corridor_params=CORRIDOR)
+        points = np.array([(-5.0, 3.0, 4.0), (50.0, 6.0, 8.0), (130.0, 0.0, 0.0), (20.0, -1.0, 0.5)])
+
+        distances_sq = config._corridor_distances_sq(points)
+
+        expected = [
+            config._distance_to_line_segment(tuple(point), CORRIDOR['start_coords'], CORRIDOR['end_coords']) ** 2
+            for point in points
+        ]
+        assert distances_sq.tolist() == pytest.approx(expected)
+        assert [config._corridor_distance_sq(tuple(point)) for point in points] == pytest.approx(expected)
+
+    def test_filter_system_records_distance(self, pattern_file):
+        """Test that accepted systems carry their corridor distance."""
+        config = JSONPatternConfig(pattern_file, corridor_params=CORRIDOR)
+
+        result = config.filter_system(make_system('Inside', 50.0, 6.0, 8.0))
+
+        assert result['corridor_distance'] == 10.0
+        assert config.filter_system(make_system('Outside', 50.0, 20.0)) is None
+
+    def test_negative_radius_rejected(self, pattern_file):
+        """Test that a negative corridor radius is a configuration error."""
+        with pytest.raises(ValueError):
+            JSONPatternConfig(pattern_file, corridor_params={**CORRIDOR, 'radius': -10.0})
+
+    def test_filter_systems_matches_filter_system(self, pattern_file):
+        """Test that batch filtering yields the same results in input order."""
+        config = JSONPatternConfig(pattern_file, corridor_params=CORRIDOR)
+        systems = [
+            make_system('A', 10.0, 2.0),
+            make_system('B', 50.0, 30.0),
+            make_system('C', 60.0, -3.0, sub_type='Icy body'),
+            make_system('D', 105.0, 1.0),
+            make_system('E', 90.0, 0.0, 9.0),
+        ]
+
+        results = list(config.filter_systems(systems))
+
+        assert [r['name'] for r in results] == ['A', 'D', 'E']
+        assert results == [r for r in map(config.filter_system, systems) if r]
+
+    def test_summary_counts_output_subtypes_only(self, pattern_file):
+        """Test that only subtypes with output columns are counted in the summary."""
+        config = JSONPatternConfig(pattern_file)
+        system = make_system('Mixed', 0.0)
+        system['bodies'] += [{'subType': 'Water world'}, {'subType': 'Icy body'}]
+
+        result = config.filter_system(system)
+
+        assert result['Water world_count'] == 2
+        assert result['total_bodies'] == 3
+        assert set(result) <= set(config.get_output_columns())
@@ -0,0 +1,188 @@
+"""Tests for the stellar-adapted exobiology configuration."""
+
+import json
+import os
+
+import pytest
+
+from mgst.configs import stellar_adapted_exobiology
+from mgst.configs.stellar_adapted_exobiology import (
+    StellarAdaptedExobiologyConfig, _latest_stellar_analysis_file, mark_latest_stellar_analysis
+)
+
+
+SPECIES_RULESETS = {
+    'Stratum Tectonicas': {
+        'genus': 'Stratum',
+        'value': 19010800,
+        'rulesets': [{'atmosphere': 'CarbonDioxide', 'body_type': 'High metal content body'}],
+    },
+    'Concha Biconcavis': {
+        'genus': 'Concha',
+        'value': 16777100,
+        'rulesets': [{'atmosphere': 'CarbonDioxide', 'body_type': 'High metal content body'}],
+    },
+    'Bacterium Aurasus': {
+        'genus': 'Bacterium',
+        'value': 1000000,
+        'rulesets': [{'atmosphere': 'CarbonDioxide'}],
+    },
+}
+
+
+@pytest.fixture
+def output_dir(temp_dir, monkeypatch):
+    """Empty output directory that the analysis lookup scans."""
+    monkeypatch.setattr(stellar_adapted_exobiology, '_output_dir', lambda: temp_dir)
+    monkeypatch.delenv('MGST_REFRESH_STELLAR_ANALYSIS', raising=False)
+    _latest_stellar_analysis_file.cache_clear()
+    yield temp_dir
+    _latest_stellar_analysis_file.cache_clear()
+
+
+@pytest.fixture
+def make_config(monkeypatch, output_dir):
+    """Build configs from an in-memory ruleset catalog."""
+    def factory(rulesets=SPECIES_RULESETS):
+        monkeypatch.setattr(StellarAdaptedExobiologyConfig, '_load_all_rulesets', lambda self: rulesets)
+        return StellarAdaptedExobiologyConfig()
+    return factory
+
+
+def write_analysis(directory, mtime, run):
+    """Write a stellar analysis file tagged with its run name."""
+    directory.mkdir(parents=True)
+    (directory / 'stellar_preferences_detailed.json').write_text(json.dumps({'run': run}))
+    os.utime(directory, (mtime, mtime))
+    return directory
+
+
+def make_body(name):
+    return {
+        'bodyName': name,
+        'atmosphereType': 'CarbonDioxide',
+        'subType': 'High metal content body',
+        'surfacePressure': 0.02,
+        'updateTime': '2021-05-18 22:11:16',
+    }
+
+
+def make_system(stellar_class, body_count=2):
+    return {
+        'name': f'{stellar_class} System',
+        'coords': {'x': 1.0, 'y': 2.0, 'z': 3.0},
+        'stars': [{'mainStar': True, 'spectralClass': f'{stellar_class}5', 'surfaceTemperature': 4500.0}],
+        'bodies': [make_body(f'{stellar_class} System {i}') for i in range(body_count)],
+    }
+
+
+class TestStellarSpeciesFiltering:
+    """Test species filtering by the primary star's class."""
+
+    @pytest.mark.parametrize('stellar_class, expected', [
+        ('K', ['Stratum Tectonicas', 'Concha Biconcavis', 'Bacterium Aurasus']),
+        ('F', ['Stratum Tectonicas', 'Concha Biconcavis', 'Bacterium Aurasus']),
+        ('M', ['Concha Biconcavis', 'Bacterium Aurasus']),
+    ])
+    def test_detect_species_per_stellar_class(self, make_config, stellar_class, expected):
+        """Test that restricted species are only kept around their observed stellar classes."""
+        config = make_config()
+        system = make_system(stellar_class)
+
+        detected = config.detect_species_on_body(system['bodies'][0], system)
+
+        assert [s['name'] for s in detected] == expected
+        assert all(s['stellar_class'] == stellar_class for s in detected)
+
+    def test_filter_system_counts_compatible_species(self, make_config):
+        """Test that system results only count species compatible with the star."""
+        config = make_config()
+
+        k_result = config.filter_system(make_system('K'))
+        m_result = config.filter_system(make_system('M'))
+
+        assert (k_result['qualifying_bodies'], k_result['total_species']) == (2, 3)
+        assert (m_result['qualifying_bodies'], m_result['total_species']) == (2, 2)
+        assert m_result['primary_stellar_class'] == 'M'
+
+    def test_no_compatible_species(self, make_config, monkeypatch):
+        """Test that a star no known species tolerates is rejected without examining bodies."""
+        config = make_config({'Stratum Tectonicas': SPECIES_RULESETS['Stratum Tectonicas']})
+        monkeypatch.setattr(config, 'detect_species_on_body', lambda *args: pytest.fail('body was examined'))
+
+        assert config.filter_system(make_system('M')) is None
+
+    def test_too_few_bodies(self, make_config, monkeypatch):
+        """Test that systems below MIN_QUALIFYING_BODIES are rejected without examining bodies."""
+        config = make_config()
+        monkeypatch.setattr(config, 'detect_species_on_body', lambda *args: pytest.fail('body was examined'))
+
+        assert config.filter_system(make_system('K', body_count=config.MIN_QUALIFYING_BODIES - 1)) is None
+
+
+class TestLatestStellarAnalysis:
+    """Test locating the newest stellar analysis run."""
+
+    def test_newest_directory_wins(self, make_config, output_dir):
+        """Test that the most recently modified analysis directory is loaded."""
+        write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        write_analysis(output_dir / 'new_stellar_analysis', 2000, 'new')
+
+        assert make_config().stellar_analysis == {'run': 'new'}
+
+    def test_nested_analysis_directories(self, make_config, output_dir):
+        """Test that output/*/stellar_analysis is used when no top-level run exists."""
+        write_analysis(output_dir / 'run_a' / 'stellar_analysis', 2000, 'a')
+        write_analysis(output_dir / 'run_b' / 'stellar_analysis', 1000, 'b')
+
+        assert make_config().stellar_analysis == {'run': 'a'}
+
+    def test_newest_directory_without_file(self, make_config, output_dir):
+        """Test that a newest run missing its detailed file yields no analysis data."""
+        write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        (output_dir / 'new_stellar_analysis').mkdir()
+        os.utime(output_dir / 'new_stellar_analysis', (2000, 2000))
+
+        assert _latest_stellar_analysis_file() is None
+        assert make_config().stellar_analysis == {}
+
+    def test_lookup_cached_until_refresh_requested(self, make_config, output_dir, monkeypatch):
+        """Test that the location is resolved once unless MGST_REFRESH_STELLAR_ANALYSIS is set."""
+        write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        assert make_config().stellar_analysis == {'run': 'old'}
+
+        write_analysis(output_dir / 'new_stellar_analysis', 2000, 'new')
+        assert make_config().stellar_analysis == {'run': 'old'}
+
+        monkeypatch.setenv('MGST_REFRESH_STELLAR_ANALYSIS', '1')
+        assert make_config().stellar_analysis == {'run': 'new'}
+
+    def test_pointer_wins_over_newer_directory(self, output_dir):
+        """Test that a valid pointer is followed even when a newer run exists."""
+        pointed = write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        write_analysis(output_dir / 'new_stellar_analysis', 2000, 'new')
+
+        pointer = mark_latest_stellar_analysis(pointed)
+
+        assert pointer.read_text() == 'old_stellar_analysis\n'
+        assert _latest_stellar_analysis_file() == str(pointed / 'stellar_preferences_detailed.json')
+
+    def test_pointer_to_missing_file_falls_back_to_scan(self, output_dir):
+        """Test that a pointer naming a removed run is ignored."""
+        pointed = write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        newest = write_analysis(output_dir / 'new_stellar_analysis', 2000, 'new')
+        mark_latest_stellar_analysis(pointed)
+
+        (pointed / 'stellar_preferences_detailed.json').unlink()
+        os.utime(pointed, (1000, 1000))
+        _latest_stellar_analysis_file.cache_clear()
+
+        assert _latest_stellar_analysis_file() == str(newest / 'stellar_preferences_detailed.json')
+
+    def test_no_pointer_scans_for_newest(self, output_dir):
+        """Test that the newest run is chosen when no pointer has been written."""
+        write_analysis(output_dir / 'old_stellar_analysis', 1000, 'old')
+        newest = write_analysis(output_dir / 'new_stellar_analysis', 2000, 'new')
+
+        assert not (output_dir / '.latest_stellar_analysis').exists()
+        assert _latest_stellar_analysis_file() == str(newest / 'stellar_preferences_detailed.json')
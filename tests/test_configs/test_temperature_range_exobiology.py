@@ -0,0 +1,84 @@
+"""Tests for the temperature range-based exobiology configuration."""
+
+import pytest
+
+from mgst.configs.high_value_exobiology import HighValueExobiologyConfig
+from mgst.configs.temperature_range_exobiology import TemperatureRangeExobiologyConfig
+
+
+SPECIES_RANGES = {
+    'Stratum Tectonicas': {
+        'stellar_class_ranges': {
+            'K': {
+                'stellar_temp_range': [4000, 5000],
+                'body_temp_range': [160, 200],
+                'distance_range': [100, 2000],
+            },
+            'M': {},
+        },
+    },
+}
+
+
+@pytest.fixture
+def config(monkeypatch):
+    monkeypatch.setattr(TemperatureRangeExobiologyConfig, '_load_all_rulesets', lambda self: {})
+    monkeypatch.setattr(TemperatureRangeExobiologyConfig, '_load_species_ranges', lambda self: SPECIES_RANGES)
+    return TemperatureRangeExobiologyConfig()
+
+
+class TestRangeValidation:
+    """Test combined validation against empirical ranges."""
+
+    def test_missing_data(self, config):
+        """Test unknown species pass and unseen stellar classes fail."""
+        assert config._validate_all('Osseus Discus', 'G', 5800, 180, 500)
+        assert not config._validate_all('Stratum Tectonicas', 'G', 5800, 180, 500)
+        assert config._validate_all('Stratum Tectonicas', 'M', 3000, 1000, 1e6)
+
+    @pytest.mark.parametrize('stellar_temp,body_temp,distance,expected', [
+        (4500, 180, 500, True),
+        (5500, 180, 500, False),
+        (4500, 220, 500, False),
+        (4500, 180, 5000, False),
+        (4500, 180, 0, True),
+    ])
+    def test_exact_ranges(self, config, stellar_temp, body_temp, distance, expected):
+        """Test each range check with the default exact tolerances."""
+        assert config._validate_all('Stratum Tectonicas', 'K', stellar_temp, body_temp, distance) is expected
+
+    def test_tolerance_widens_ranges(self, config, capsys):
+        """Test that tolerance factors expand the accepted ranges."""
+        config.set_tolerance_factors(stellar_temp_tol=2.0, body_temp_tol=2.0, distance_tol=2.0)
+
+        assert config._validate_all('Stratum Tectonicas', 'K', 5400, 215, 2900)
+
+
+class TestSpeciesDetection:
+    """Test species detection against the system's primary star."""
+
+    @pytest.fixture
+    def base_species(self, monkeypatch):
+        species = [{'name': 'Stratum Tectonicas'}, {'name': 'Osseus Discus'}]
+        monkeypatch.setattr(HighValueExobiologyConfig, 'detect_species_on_body', lambda self, body: species)
+        return species
+
+    def test_known_star_validates_ranges(self, config, base_species):
+        """Test that species are checked against their ranges for the primary star."""
+        system = {'stars': [{'mainStar': True, 'spectralClass': 'K2', 'surfaceTemperature': 4500}]}
+
+        detected = config.detect_species_on_body({'surfaceTemperature': 180, 'distanceToArrival': 500}, system)
+
+        assert [s['name'] for s in detected] == ['Stratum Tectonicas', 'Osseus Discus']
+        assert detected[0]['stellar_class'] == 'K'
+
+    def test_unknown_star_keeps_species_without_ranges(self, config, base_species):
+        """Test that only species without range data pass without primary star data."""
+        detected = config.detect_species_on_body({'surfaceTemperature': 180}, {'name': 'Starless'})
+
+        assert detected == [{
+            'name': 'Osseus Discus',
+            'stellar_class': 'Unknown',
+            'stellar_temperature': 0.0,
+            'validation_method': 'empirical_temperature_ranges',
+        }]
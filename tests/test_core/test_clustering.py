@@ -5,7 +5,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
-from mgst.core.clustering import find_optimal_k, cluster_systems, process_cluster
+from mgst.core.clustering import _elbow_index, find_optimal_k, cluster_systems, process_cluster
 from mgst.core.routing import nearest_neighbor_route
 
 
@@ -27,6 +27,14 @@ class TestClustering:
         k = find_optimal_k(coords, k_range=[2, 3, 4])
         assert 2 <= k <= 4
     
+    def test_elbow_index(self):
+        """Test that the elbow is where the inertia curve flattens out."""
+        k_values = np.arange(1, 11, dtype=float)
+        inertias = np.array([100, 50, 20, 15, 12, 10, 9, 8, 7, 6], dtype=float)
+        
+        assert k_values[_elbow_index(k_values, inertias)] == 3
+        assert _elbow_index(k_values, np.full(10, 5.0)) == 5
+    
     def test_cluster_systems_basic(self, sample_systems_df):
         """Test basic system clustering."""
         cluster_labels, clustering_info = cluster_systems(sample_systems_df, k=2)
@@ -36,6 +44,16 @@ class TestClustering:
         assert clustering_info['optimal_k'] == 2
         assert 'cluster_sizes' in clustering_info
     
+    def test_cluster_sizes_match_labels(self, sample_systems_df):
+        """Test that cluster size stats are counted from the labels."""
+        cluster_labels, clustering_info = cluster_systems(sample_systems_df, k=3)
+        
+        sizes = [list(cluster_labels).count(label) for label in np.unique(cluster_labels)]
+        assert clustering_info['n_clusters'] == len(sizes)
+        assert clustering_info['cluster_sizes']['min'] == min(sizes)
+        assert clustering_info['cluster_sizes']['max'] == max(sizes)
+        assert clustering_info['cluster_sizes']['mean'] == pytest.approx(np.mean(sizes))
+    
     def test_cluster_systems_auto_k(self, sample_systems_df):
         """Test clustering with automatic k determination."""
         cluster_labels, clustering_info = cluster_systems(sample_systems_df, k=None)
@@ -44,6 +62,22 @@ class TestClustering:
         assert clustering_info['n_clusters'] >= 1
         assert clustering_info['optimal_k'] > 0
     
+    def test_cluster_systems_k_from_target_size(self, sample_systems_df, monkeypatch):
+        """Test that k comes from the target cluster size without an elbow sweep."""
+        monkeypatch.setattr('mgst.core.clustering.find_optimal_k', lambda *args, **kwargs: pytest.fail())
+        df = pd.concat([sample_systems_df] * 30, ignore_index=True)
+        df[['coords_x', 'coords_y', 'coords_z']] += np.arange(len(df))[:, None]
+        
+        _, clustering_info = cluster_systems(df, target_cluster_size=10)
+        assert clustering_info['optimal_k'] == 12
+        
+        _, clustering_info = cluster_systems(sample_systems_df)
+        assert clustering_info['optimal_k'] == len(sample_systems_df)
+        
+        # Too few systems for the elbow sweep to be worthwhile
+        _, clustering_info = cluster_systems(sample_systems_df, auto_k=True)
+        assert clustering_info['optimal_k'] == len(sample_systems_df)
+    
     def test_process_cluster_empty(self, temp_dir):
         """Test processing empty cluster."""
         empty_df = pd.DataFrame(columns=['system_name', 'coords_x', 'coords_y', 'coords_z'])
@@ -116,4 +150,18 @@ class TestClusteringIntegration:
         if 'summary_file' in results:
             assert summary_file.exists()
             summary_df = pd.read_csv(summary_file, sep='\t')
-            assert len(summary_df) > 0
\ No newline at end of file
+            assert len(summary_df) > 0
+    
+    def test_warm_start_from_saved_centers(self, sample_tsv_file, temp_dir):
+        """Test that a run can start from the centers saved by a previous run."""
+        from mgst.core.clustering import cluster_and_route_systems
+        
+        first = cluster_and_route_systems(sample_tsv_file, output_dir=temp_dir / "first", k=2, workers=1)
+        centers = np.load(first['centers_file'])
+        assert centers.shape == (2, 3)
+        
+        second = cluster_and_route_systems(
+            sample_tsv_file, output_dir=temp_dir / "second", workers=1,
+            warm_start_centers=first['centers_file']
+        )
+        assert second['clustering_info']['optimal_k'] == 2
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""Tests for the galaxy data filtering pipeline."""
+
+import json
+
+import pytest
+
+from mgst.configs.faction_search import FactionSearchConfig
+from mgst.core.filtering import filter_galaxy_data, process_jsonl_file
+
+
+SYSTEMS = [
+    {
+        'name': 'Mikunn',
+        'coords': {'x': 1.0, 'y': 2.0, 'z': 3.0},
+        'factions': [{'name': 'The Dukes of Mikunn', 'influence': 0.6}],
+    },
+    {
+        'name': 'Shinrarta Dezhra',
+        'coords': {'x': 55.7, 'y': 17.6, 'z': 27.2},
+        'factions': [{'name': 'The Dukes of Mikunn', 'influence': 0.1}],
+    },
+    {
+        'name': 'Sol',
+        'coords': {'x': 0.0, 'y': 0.0, 'z': 0.0},
+        'factions': [{'name': 'Sol Workers\' Party', 'influence': 0.2}],
+    },
+]
+
+
+class TestFilterGalaxyData:
+    """Test filtering a directory of JSONL files."""
+
+    def test_filter_galaxy_data_streams_matches(self, temp_dir):
+        """Test that workers filter every file with the config installed at startup."""
+        input_dir = temp_dir / "galaxy"
+        input_dir.mkdir()
+        for i in range(3):
+            (input_dir / f"part{i}.jsonl").write_text('\n'.join(json.dumps(s) for s in SYSTEMS) + '\n')
+        output_path = temp_dir / "matches.tsv"
+
+        result = filter_galaxy_data(input_dir, FactionSearchConfig(output_format='tsv'), output_path, workers=2)
+
+        assert result.errors == []
+        assert result.systems_processed == 9
+        assert result.matches_found == 6
+        assert len(output_path.read_text().splitlines()) == 7
+
+    def test_process_jsonl_file_without_config(self, temp_dir):
+        """Test that a missing config outside an initialized worker is reported clearly."""
+        input_file = temp_dir / "systems.jsonl"
+        input_file.write_text('\n'.join(json.dumps(s) for s in SYSTEMS) + '\n')
+
+        with pytest.raises(RuntimeError, match="needs a config"):
+            process_jsonl_file((input_file, None, 1024, False, 1000, "", 'tsv', False, None))
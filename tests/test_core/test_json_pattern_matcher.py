@@ -0,0 +1,67 @@
+"""Tests for JSON pattern matching."""
+
+import pickle
+
+from mgst.core.json_pattern_matcher import JSONPatternMatcher, compile_pattern, match_pattern
+
+
+MOON_PATTERN = {
+    'comment': 'Landable moon orbiting a ringed gas giant',
+    'bodies': [
+        {'subType': ['Class I gas giant', 'Class II gas giant'], 'bodyId': '$parent', 'rings': '*'},
+        {'isLandable': True, 'parents': [{'Planet': '$parent'}], 'rings': []},
+    ],
+}
+
+
+def make_system(*bodies):
+    return {'name': 'Test', 'bodies': list(bodies)}
+
+
+GIANT = {'subType': 'Class I gas giant', 'bodyId': 3, 'rings': [{'name': 'A Ring'}]}
+
+
+class TestCompiledPattern:
+    """Test matching with compiled patterns."""
+
+    def test_variables_link_bodies(self):
+        """Test that a variable bound by one body constrains another."""
+        compiled = compile_pattern(MOON_PATTERN)
+
+        moon = {'isLandable': True, 'parents': [{'Planet': 3}, {'Star': 0}]}
+        assert match_pattern(compiled, make_system(GIANT, moon))
+
+        stray = {'isLandable': True, 'parents': [{'Planet': 7}, {'Star': 0}]}
+        assert not match_pattern(compiled, make_system(GIANT, stray))
+
+    def test_matching_keeps_no_state(self):
+        """Test that bindings from one system do not leak into the next."""
+        compiled = compile_pattern({'bodies': [{'bodyId': '$id'}, {'parents': [{'Planet': '$id'}]}]})
+
+        assert match_pattern(compiled, make_system({'bodyId': 1}, {'parents': [{'Planet': 1}]}))
+        assert match_pattern(compiled, make_system({'bodyId': 2}, {'parents': [{'Planet': 2}]}))
+
+    def test_backtracking_drops_bindings(self):
+        """Test that bindings from a rejected body assignment are discarded."""
+        matcher = JSONPatternMatcher({'bodies': [{'bodyId': '$id'}, {'parents': [{'Planet': '$id'}]}]})
+
+        system = make_system({'bodyId': 1}, {'bodyId': 2}, {'parents': [{'Planet': 2}]})
+
+        assert matcher.matches(system)
+        assert matcher.variables == {'$id': 2}
+
+    def test_ranges_and_lists(self):
+        """Test numeric ranges, option lists and missing values."""
+        compiled = compile_pattern({'bodies': [{'gravity': {'max': 0.3}, 'atmosphereType': ['Ammonia', None]}]})
+
+        assert match_pattern(compiled, make_system({'gravity': 0.2}))
+        assert not match_pattern(compiled, make_system({'gravity': 0.4}))
+        assert not match_pattern(compiled, make_system({'gravity': 0.2, 'atmosphereType': 'Neon'}))
+        assert not match_pattern(compiled, make_system({}))
+
+    def test_pickles_as_pattern(self):
+        """Test that compiled patterns survive pickling for worker processes."""
+        compiled = pickle.loads(pickle.dumps(compile_pattern(MOON_PATTERN)))
+
+        assert compiled.pattern == MOON_PATTERN
+        assert match_pattern(compiled, make_system(GIANT, {'isLandable': True, 'parents': [{'Planet': 3}]}))
@@ -0,0 +1,34 @@
+"""Tests for the compressed file reader."""
+
+import gzip
+
+import pytest
+
+from mgst.data.compressed_reader import CompressedFileReader
+
+
+LINES = ['{"name": "Sol"}', '{"name": "Sirius é"}']
+
+
+@pytest.fixture(params=['systems.jsonl', 'systems.jsonl.gz'])
+def jsonl_file(request, temp_dir):
+    path = temp_dir / request.param
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'wt', encoding='utf-8') as f:
+        f.write('\n'.join(LINES))
+    return path
+
+
+class TestCompressedFileReader:
+    """Test reading plain and gzip files."""
+
+    def test_text_lines(self, jsonl_file):
+        """Test that text mode yields decoded lines."""
+        with CompressedFileReader(jsonl_file) as f:
+            assert [line.rstrip('\n') for line in f] == LINES
+
+    def test_binary_lines(self, jsonl_file):
+        """Test that binary mode yields undecoded lines and keeps compression info."""
+        with CompressedFileReader(jsonl_file, buffer_size=16, binary=True) as f:
+            assert [line.rstrip(b'\n') for line in f] == [line.encode('utf-8') for line in LINES]
+            assert f.get_compression_info()['is_compressed'] == (jsonl_file.suffix == '.gz')